@@ -79,6 +79,30 @@ async def get_sector_stats(db: Session = Depends(get_db)):
         )
 
 
+@router.get("/trading-day")
+async def get_trading_day(db: Session = Depends(get_db)):
+    """
+    거래일 정보 조회
+    
+    오늘의 거래일 여부와 최근/직전/다음 거래일을 제공합니다 (KRX 휴장일 반영).
+    """
+    try:
+        service = MarketService(db)
+        trading_day = await service.get_trading_day()
+        
+        return {
+            "data": trading_day,
+            "message": "거래일 정보 조회 완료",
+            "success": True
+        }
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"거래일 정보 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @router.get("/health")
 async def market_health_check(db: Session = Depends(get_db)):
     """
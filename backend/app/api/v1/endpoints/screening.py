@@ -1,11 +1,12 @@
 """
 스크리닝 관련 API 엔드포인트
 """
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.screening.crossovers import CROSS_LOOKBACK_DAYS
 from app.schemas.screening_simple import BuySignal
 from app.services.screening_service import ScreeningService
 
@@ -95,4 +96,71 @@ async def get_screening_stats(db: Session = Depends(get_db)):
         raise HTTPException(
             status_code=500,
             detail=f"통계 조회 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/backtest")
+async def get_backtest(
+    strategy: Optional[List[str]] = Query(None, description="전략 signal_type (여러 번 지정 가능, 기본값: 전체)"),
+    days: int = Query(180, ge=30, le=365, description="백테스트 기간 (달력일)"),
+    db: Session = Depends(get_db)
+):
+    """
+    매수 신호 전략 백테스트
+    
+    - **strategy**: rsi_oversold_macd_golden, sma_golden_cross, volume_breakout
+    - **days**: 저장된 지표 중 최근 며칠을 진입 구간으로 쓸지 (기본값: 180일)
+    
+    5/20/60거래일 보유 수익률, 적중률, 최대 낙폭을 신호 강도 구간별로 함께 반환
+    """
+    try:
+        service = ScreeningService(db)
+        report = await service.get_backtest(strategy, days)
+        
+        return {
+            "data": report,
+            "message": f"{len(report['strategies'])}개 전략 백테스트 완료",
+            "success": True
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"백테스트 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
+@router.get("/crossovers")
+async def get_crossover_events(
+    event: Optional[List[str]] = Query(None, description="교차 이벤트 (여러 번 지정 가능, 기본값: 전체)"),
+    days: int = Query(5, ge=1, le=CROSS_LOOKBACK_DAYS, description="최근 며칠(거래일) 안의 교차"),
+    sector: str = None,
+    limit: int = Query(100, ge=1, le=1000, description="반환할 최대 이벤트 수"),
+    db: Session = Depends(get_db)
+):
+    """
+    최근 교차 이벤트 조회 (상태가 아니라 교차가 일어난 거래일만)
+    
+    - **event**: macd_golden_cross, macd_dead_cross, sma_golden_cross, sma_dead_cross, rsi_oversold_exit
+    - **days**: 최근 거래일 수 (기본값: 5)
+    - **sector**: 섹터 필터 (선택사항)
+    """
+    try:
+        service = ScreeningService(db)
+        events = await service.get_crossover_events(event, days, sector, limit)
+        
+        return {
+            "data": events,
+            "message": f"최근 {days}거래일 교차 이벤트 {len(events)}건 조회 완료",
+            "success": True
+        }
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"교차 이벤트 조회 중 오류가 발생했습니다: {str(e)}"
         )
\ No newline at end of file
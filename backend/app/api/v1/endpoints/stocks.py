@@ -1,13 +1,14 @@
 """
 주식 관련 API 엔드포인트
 """
-from typing import List
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.schemas.stock_simple import StockDetail, ChartData
 from app.services.stock_service import StockService
+from app.indicators.custom import parse_custom_indicators
 
 router = APIRouter()
 
@@ -88,6 +89,9 @@ async def get_chart_data(
 async def get_technical_indicators(
     symbol: str,
     period: str = Query("6M", regex="^(1M|3M|6M|1Y)$"),
+    rsi_period: Optional[int] = Query(None, description="사용자 지정 RSI 기간 (예: 9)"),
+    macd: Optional[str] = Query(None, description="사용자 지정 MACD '단기,장기,신호' (예: 5,35,5)"),
+    sma: Optional[str] = Query(None, description="사용자 지정 이동평균 기간 목록 (예: 5,120)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -95,10 +99,17 @@ async def get_technical_indicators(
     
     - **symbol**: 종목 코드 (예: "005930")
     - **period**: 조회 기간 (1M, 3M, 6M, 1Y)
+    - **rsi_period / macd / sma**: 지정하면 저장된 종가로 계산해 rsi_9, macd_5_35_5,
+      macd_signal_5_35_5, macd_histogram_5_35_5, sma_5 형식의 필드로 함께 반환
     """
+    try:
+        custom = parse_custom_indicators(rsi_period, macd, sma)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         service = StockService(db)
-        indicators = await service.get_technical_indicators(symbol, period)
+        indicators = await service.get_technical_indicators(symbol, period, custom)
         
         return {
             "data": indicators,
@@ -0,0 +1 @@
+# 데이터 수집 파이프라인 패키지
\ No newline at end of file
@@ -0,0 +1,190 @@
+"""
+원본 일봉 캐시 - 데이터 소스 앞단의 종목별 Parquet 파일 캐시
+
+- 종목별 파일 하나({cache_dir}/{source}/{symbol}.parquet)에 받아 둔 일봉을 병합 저장
+- 장 마감 후 확정된 거래일 일봉은 변하지 않으므로 만료 없이 재사용
+- 확정 전(당일) 일봉은 짧은 TTL 동안만 재사용하고 이후 다시 조회
+"""
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from app.collector.sources import DataSource
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+
+# 이 시각 이후에 받은 당일 일봉은 확정된 것으로 본다 (장 마감 15:30 + 정정 여유)
+SETTLE_TIME = dt_time(18, 0)
+
+
+def settled_date(now: datetime) -> date:
+    """now 시점에 일봉이 확정된 마지막 날짜"""
+    now_kst = now.astimezone(KST)
+    if now_kst.time() >= SETTLE_TIME:
+        return now_kst.date()
+    return now_kst.date() - timedelta(days=1)
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중 통계"""
+    hits: int = 0  # 캐시만으로 응답
+    partial_hits: int = 0  # 일부 구간만 원본 조회
+    misses: int = 0  # 캐시 없음
+    upstream_calls: int = 0
+    cached_bars: int = 0  # 캐시에서 제공한 일봉 수
+    fetched_bars: int = 0  # 원본에서 받은 일봉 수
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.partial_hits + self.misses
+
+    def summary(self) -> str:
+        total = self.requests
+        ratio = (self.hits / total * 100) if total else 0.0
+        return (
+            f"캐시 요청 {total}건: 적중 {self.hits}건 ({ratio:.1f}%), 부분 적중 {self.partial_hits}건, "
+            f"미적중 {self.misses}건 / 원본 호출 {self.upstream_calls}회, "
+            f"일봉 캐시 {self.cached_bars}개 · 원본 {self.fetched_bars}개"
+        )
+
+
+class CachedDataSource(DataSource):
+    """다른 DataSource를 감싸는 디스크 캐시"""
+
+    def __init__(self, source: DataSource, cache_dir: str, today_ttl_seconds: int = 900):
+        self.source = source
+        self.name = f"cached-{source.name}"
+        self.cache_dir = os.path.join(cache_dir, source.name)
+        self.today_ttl = timedelta(seconds=today_ttl_seconds)
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, symbol: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, symbol)
+        return f"{base}.parquet", f"{base}.json"
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._symbol_locks.setdefault(symbol, threading.Lock())
+
+    def _load(self, symbol: str) -> Tuple[Optional[pd.DataFrame], Optional[dict]]:
+        data_path, meta_path = self._paths(symbol)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None, None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            return pd.read_parquet(data_path), meta
+        except Exception as e:
+            logger.warning(f"⚠️ {symbol} 캐시 읽기 실패, 무시: {e}")
+            return None, None
+
+    def _save(self, symbol: str, df: pd.DataFrame, meta: dict) -> None:
+        data_path, meta_path = self._paths(symbol)
+        df.to_parquet(f"{data_path}.tmp")
+        os.replace(f"{data_path}.tmp", data_path)
+        with open(f"{meta_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+    def _missing_ranges(self, meta: dict, start: date, end: date, now: datetime) -> list:
+        """캐시로 채울 수 없는 구간 목록"""
+        covered_start = date.fromisoformat(meta["start"])
+        covered_end = date.fromisoformat(meta["end"])
+        settled_until = date.fromisoformat(meta["settled_until"])
+        fetched_at = datetime.fromisoformat(meta["fetched_at"])
+
+        ranges = []
+        if start < covered_start:
+            ranges.append((start, covered_start - timedelta(days=1)))
+
+        if end > settled_until:
+            # 확정되지 않은 구간은 TTL 이내이고 이미 받은 범위일 때만 재사용
+            fresh = now - fetched_at < self.today_ttl and end <= covered_end
+            if not fresh:
+                ranges.append((max(settled_until + timedelta(days=1), start), end))
+        return ranges
+
+    def fetch_history(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        with self._lock_for(symbol):
+            now = datetime.now(KST)
+            cached, meta = self._load(symbol)
+
+            if cached is not None and start > date.fromisoformat(meta["end"]) + timedelta(days=1):
+                # 캐시 범위와 이어지지 않는 요청: 사이 구간을 받은 것으로 기록하지 않도록 캐시를 새로 시작
+                cached, meta = None, None
+
+            if cached is None:
+                ranges = [(start, end)]
+                kind = "misses"
+            else:
+                ranges = self._missing_ranges(meta, start, end, now)
+                kind = "partial_hits" if ranges else "hits"
+
+            frames = []
+            for range_start, range_end in ranges:
+                fetched = self.source.fetch_history(symbol, range_start, range_end)
+                self._record(upstream_calls=1, fetched_bars=len(fetched))
+                if not fetched.empty:
+                    frames.append(fetched)
+
+            if ranges:
+                pieces = ([cached] if cached is not None else []) + frames
+                if not pieces:
+                    return pd.DataFrame()
+                merged = pd.concat(pieces)
+                # 같은 날짜는 새로 받은 값을 우선
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+                self._save(symbol, merged, self._next_meta(meta, start, end, ranges, now))
+            else:
+                merged = cached
+
+            result = merged[(merged.index >= pd.Timestamp(start)) & (merged.index <= pd.Timestamp(end))]
+            fetched_count = sum(len(f) for f in frames)
+            self._record(**{kind: 1, "cached_bars": max(len(result) - fetched_count, 0)})
+            return result
+
+    @staticmethod
+    def _next_meta(meta: Optional[dict], start: date, end: date, ranges: list, now: datetime) -> dict:
+        """조회 후 캐시 범위/확정일 갱신
+
+        확정일과 조회 시각은 요청 끝부분(미확정 구간)을 실제로 다시 받은 경우에만 갱신한다.
+        이어지지 않는 요청은 fetch_history()에서 캐시를 새로 시작하므로 범위는 항상 연속이다.
+        """
+        if meta is None:
+            meta = {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "settled_until": date.min.isoformat(),
+                "fetched_at": now.isoformat(),
+            }
+
+        new_meta = {
+            "start": min(start, date.fromisoformat(meta["start"])).isoformat(),
+            "end": max(end, date.fromisoformat(meta["end"])).isoformat(),
+            "settled_until": meta["settled_until"],
+            "fetched_at": meta["fetched_at"],
+        }
+        if any(range_end >= end for _, range_end in ranges):
+            settled = max(date.fromisoformat(meta["settled_until"]), min(settled_date(now), end))
+            new_meta["settled_until"] = settled.isoformat()
+            new_meta["fetched_at"] = now.isoformat()
+        return new_meta
+
+    def _record(self, **counts: int) -> None:
+        with self._stats_lock:
+            for key, value in counts.items():
+                setattr(self.stats, key, getattr(self.stats, key) + value)
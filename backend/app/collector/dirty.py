@@ -0,0 +1,149 @@
+"""
+변경 집합 - 수집이 실제로 바꾼 (stock_id, date) 행을 모아 다음 단계가 영향받은 종목/거래일만 처리하게 함
+
+- 저장 직전에 기존 주가 행과 비교해 새 행이거나 값이 달라진 행만 변경으로 본다
+- 스크리닝: 변경된 종목만 다시 평가 / 시장 요약: 요약 거래일에 변경이 없으면 생략
+- API 캐시: 종목별 마지막 변경 시각(StockChange)을 캐시 키에 넣어 다른 프로세스의 변경도 반영
+"""
+import threading
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.collector.writer import DEFAULT_CHUNK_SIZE, dialect_insert
+from app.models import StockChange, StockPrice
+
+# 변경 여부를 비교하는 주가 컬럼
+COMPARED_PRICE_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class DirtySet:
+    """변경된 (stock_id, date) 집합 (저장 스레드와 메인 스레드에서 함께 쓰므로 잠금 사용)"""
+
+    def __init__(self, keys: Iterable[Tuple[int, date]] = ()):
+        self._keys: Set[Tuple[int, date]] = set(keys)
+        self._lock = threading.Lock()
+
+    def add(self, keys: Iterable[Tuple[int, date]]) -> None:
+        with self._lock:
+            self._keys.update(keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __bool__(self) -> bool:
+        return bool(self._keys)
+
+    def __contains__(self, key: Tuple[int, date]) -> bool:
+        return key in self._keys
+
+    @property
+    def stock_ids(self) -> Set[int]:
+        with self._lock:
+            return {stock_id for stock_id, _ in self._keys}
+
+    @property
+    def dates(self) -> Set[date]:
+        with self._lock:
+            return {day for _, day in self._keys}
+
+    def stock_ids_on(self, day: date) -> Set[int]:
+        """day에 변경된 종목"""
+        with self._lock:
+            return {stock_id for stock_id, changed in self._keys if changed == day}
+
+    def summary(self) -> str:
+        dates = sorted(self.dates)
+        if not dates:
+            return "변경 없음"
+        span = f"{dates[0]}" if len(dates) == 1 else f"{dates[0]} ~ {dates[-1]}"
+        return f"{len(self.stock_ids)}개 종목, {len(self)}행 ({span})"
+
+
+def find_changed_rows(db: Session, price_rows: List[Dict[str, Any]]) -> List[Tuple[int, date]]:
+    """저장할 주가 행 중 새 행이거나 기존 값과 다른 행의 (stock_id, date) (단일 조회)"""
+    if not price_rows:
+        return []
+
+    stock_ids = {row['stock_id'] for row in price_rows}
+    since = min(row['date'] for row in price_rows)
+    existing = {
+        (stock_id, day): values
+        for stock_id, day, *values in db.query(
+            StockPrice.stock_id,
+            StockPrice.date,
+            *(getattr(StockPrice, column) for column in COMPARED_PRICE_COLUMNS)
+        ).filter(StockPrice.stock_id.in_(stock_ids), StockPrice.date >= since)
+    }
+
+    changed = []
+    for row in price_rows:
+        key = (row['stock_id'], row['date'])
+        if existing.get(key) != [row[column] for column in COMPARED_PRICE_COLUMNS]:
+            changed.append(key)
+    return changed
+
+
+def change_records(changed: Iterable[Tuple[int, date]]) -> List[Dict[str, Any]]:
+    """종목별 StockChange 레코드 (변경된 거래일 범위)"""
+    ranges: Dict[int, Tuple[date, date]] = {}
+    for stock_id, day in changed:
+        first, last = ranges.get(stock_id, (day, day))
+        ranges[stock_id] = (min(first, day), max(last, day))
+    return [
+        {'stock_id': stock_id, 'first_date': first, 'last_date': last}
+        for stock_id, (first, last) in ranges.items()
+    ]
+
+
+def record_changes(db: Session, changed: Iterable[Tuple[int, date]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """변경된 (stock_id, date)를 종목별 StockChange로 upsert 하고 종목 수 반환 (커밋은 호출자)
+
+    - 변경 시각은 DB 시계(now())로 기록해 CollectionRun.started_at과 같은 시계/시간대로 비교된다
+    - 이미 행이 있으면 거래일 범위를 덮어쓰지 않고 넓힌다 (재개/중복 실행의 이전 변경 범위 보존)
+    """
+    rows = change_records(changed)
+    if not rows:
+        return 0
+
+    dialect_name = db.get_bind().dialect.name
+    # SQLite는 인자가 둘 이상인 min/max가 스칼라 함수
+    least, greatest = (func.least, func.greatest) if dialect_name == "postgresql" else (func.min, func.max)
+    table = StockChange.__table__
+    stmt = dialect_insert(dialect_name)(table).values(changed_at=func.now())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['stock_id'],
+        set_={
+            'first_date': least(table.c.first_date, stmt.excluded.first_date),
+            'last_date': greatest(table.c.last_date, stmt.excluded.last_date),
+            'changed_at': stmt.excluded.changed_at,
+        }
+    )
+    for offset in range(0, len(rows), chunk_size):
+        db.execute(stmt, rows[offset:offset + chunk_size])
+    return len(rows)
+
+
+def stock_version(db: Session, stock_id: int) -> Optional[Any]:
+    """종목 데이터의 마지막 변경 시각 (캐시 키용, 기록이 없으면 None)"""
+    return db.query(StockChange.changed_at).filter(StockChange.stock_id == stock_id).scalar()
+
+
+def data_version(db: Session) -> Optional[Any]:
+    """전체 데이터의 마지막 변경 시각 (전 종목을 쓰는 캐시 키용)"""
+    return db.query(func.max(StockChange.changed_at)).scalar()
+
+
+def changes_since(db: Session, since) -> DirtySet:
+    """since 이후 기록된 StockChange로 변경 집합 복원 (종목별 변경 거래일 범위의 양 끝만 담김)
+
+    수집 단계를 다른 프로세스에서 실행했을 때(샤드 병렬 수집) 다음 단계가 변경 종목/거래일을 알 수 있게 한다.
+    """
+    dirty = DirtySet()
+    for stock_id, first, last in db.query(
+        StockChange.stock_id, StockChange.first_date, StockChange.last_date
+    ).filter(StockChange.changed_at >= since):
+        dirty.add({(stock_id, first), (stock_id, last)})
+    return dirty
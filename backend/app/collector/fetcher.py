@@ -0,0 +1,133 @@
+"""
+동시 수집기 - 워커 풀 + 토큰 버킷 속도 제한 + 지터 재시도
+"""
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+
+from app.collector.sources import DataSource
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 속도 제한기
+
+    rate: 초당 토큰 충전 수 (0 이하면 제한 없음)
+    capacity: 버킷 크기 (순간 허용 버스트)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> float:
+        """토큰을 얻을 때까지 대기하고 대기한 시간(초)을 반환"""
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+
+@dataclass
+class FetchResult:
+    """종목별 수집 결과"""
+    symbol: str
+    data: pd.DataFrame
+    attempts: int
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ConcurrentFetcher:
+    """데이터 소스를 제한된 워커 풀로 병렬 호출하는 수집 단계"""
+
+    def __init__(
+        self,
+        source: DataSource,
+        max_workers: int = 8,
+        rate_limit: float = 5.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0
+    ):
+        self.source = source
+        self.max_workers = max(1, max_workers)
+        self.limiter = TokenBucket(rate_limit)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 + 풀 지터 (동시 재시도가 한꺼번에 몰리지 않도록)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def fetch_one(self, symbol: str, start: date, end: date) -> FetchResult:
+        """단일 종목 수집 (실패시 재시도)"""
+        started = time.monotonic()
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 2):
+            self.limiter.acquire()
+            try:
+                df = self.source.fetch_history(symbol, start, end)
+                return FetchResult(
+                    symbol=symbol,
+                    data=df if df is not None else pd.DataFrame(),
+                    attempts=attempt,
+                    elapsed=time.monotonic() - started
+                )
+            except Exception as e:
+                last_error = str(e)
+                if attempt > self.max_retries:
+                    break
+                delay = self._backoff(attempt)
+                logger.warning(f"⚠️ {symbol} 수집 재시도 {attempt}/{self.max_retries} ({delay:.2f}초 후): {e}")
+                time.sleep(delay)
+
+        return FetchResult(
+            symbol=symbol,
+            data=pd.DataFrame(),
+            attempts=self.max_retries + 1,
+            elapsed=time.monotonic() - started,
+            error=last_error
+        )
+
+    def fetch_many(self, requests: Iterable[Tuple[str, date, date]]) -> Iterator[FetchResult]:
+        """(symbol, start, end) 목록을 병렬 수집하여 완료 순서대로 반환"""
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fetch") as executor:
+            futures = [
+                executor.submit(self.fetch_one, symbol, start, end)
+                for symbol, start, end in requests
+            ]
+            for future in as_completed(futures):
+                yield future.result()
@@ -0,0 +1,104 @@
+"""
+저장된 주가 이력 조회 - 여러 종목의 일봉을 단일 쿼리로 읽어 종목별 DataFrame으로 분리
+"""
+from datetime import date
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.models import StockPrice
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+def _price_query(
+    db: Session,
+    stock_ids: Optional[Iterable[int]],
+    since: Optional[date],
+    until: Optional[date]
+):
+    """(stock_id, date) 순으로 정렬된 일봉 조회 쿼리 (조회할 종목이 없으면 None)"""
+    query = db.query(
+        StockPrice.stock_id,
+        StockPrice.date,
+        StockPrice.open,
+        StockPrice.high,
+        StockPrice.low,
+        StockPrice.close,
+        StockPrice.volume
+    )
+    if stock_ids is not None:
+        stock_ids = list(stock_ids)
+        if not stock_ids:
+            return None
+        query = query.filter(StockPrice.stock_id.in_(stock_ids))
+    if since is not None:
+        query = query.filter(StockPrice.date >= since)
+    if until is not None:
+        query = query.filter(StockPrice.date <= until)
+
+    return query.order_by(StockPrice.stock_id, StockPrice.date)
+
+
+def _history_frame(rows) -> pd.DataFrame:
+    """(date, OHLCV) 행 목록을 DataSource 형식 DataFrame으로 변환"""
+    frame = pd.DataFrame(rows, columns=['Date'] + OHLCV_COLUMNS)
+    frame['Date'] = pd.to_datetime(frame['Date'])
+    return frame.set_index('Date')
+
+
+def load_price_history(
+    db: Session,
+    stock_ids: Optional[Iterable[int]] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None
+) -> Dict[int, pd.DataFrame]:
+    """stock_id별 일봉 DataFrame 조회 (stock_id, date 순 단일 쿼리)
+
+    반환 형식은 DataSource.fetch_history와 같다:
+    'Date' DatetimeIndex + Open/High/Low/Close/Volume 컬럼
+    """
+    query = _price_query(db, stock_ids, since, until)
+    if query is None:
+        return {}
+
+    rows = query.all()
+    if not rows:
+        return {}
+
+    frame = pd.DataFrame(rows, columns=['stock_id', 'Date'] + OHLCV_COLUMNS)
+    frame['Date'] = pd.to_datetime(frame['Date'])
+
+    return {
+        stock_id: group.drop(columns='stock_id').set_index('Date')
+        for stock_id, group in frame.groupby('stock_id', sort=False)
+    }
+
+
+def iter_price_history(
+    db: Session,
+    stock_ids: Optional[Iterable[int]] = None,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    fetch_size: int = 10000
+) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """(stock_id, 일봉 DataFrame)을 종목 순서대로 하나씩 반환 (stock_id, date 순 단일 쿼리)
+
+    전체 결과를 메모리에 올리지 않고 fetch_size 행씩 받아 종목이 바뀔 때마다 내보낸다.
+    """
+    query = _price_query(db, stock_ids, since, until)
+    if query is None:
+        return
+
+    current_id = None
+    buffer = []
+    for row in query.yield_per(fetch_size):
+        if row[0] != current_id and buffer:
+            yield current_id, _history_frame(buffer)
+            buffer = []
+        current_id = row[0]
+        buffer.append(row[1:])
+
+    if buffer:
+        yield current_id, _history_frame(buffer)
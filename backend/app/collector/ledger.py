@@ -0,0 +1,157 @@
+"""
+수집 실행 원장 - 거래일별 종목 완료 상태를 기록해 중단된 수집을 이어서 실행
+"""
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.collector.writer import bulk_upsert
+from app.models import CollectionRun, CollectionRunItem
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class RunLedger:
+    """거래일 하나의 수집 실행 원장
+
+    종목별 완료 여부를 즉시 커밋하므로 수집이 중간에 죽어도
+    다음 실행은 완료되지 않은 종목만 처리한다.
+    """
+
+    def __init__(self, session_factory: sessionmaker, trade_date: date, shard: str = 'all'):
+        self.session_factory = session_factory
+        self.trade_date = trade_date
+        self.shard = shard
+        self.run_id: Optional[int] = None
+
+    def start(self, symbols: List[str], restart: bool = False) -> List[str]:
+        """실행을 시작(또는 재개)하고 처리해야 할 종목 목록을 반환
+
+        restart=True면 기존 완료 기록을 무시하고 모든 종목을 다시 처리한다.
+        """
+        db = self.session_factory()
+        try:
+            run = db.query(CollectionRun).filter(
+                CollectionRun.trade_date == self.trade_date,
+                CollectionRun.shard == self.shard
+            ).first()
+            if run is None:
+                run = CollectionRun(trade_date=self.trade_date, shard=self.shard, status='running')
+                db.add(run)
+                db.flush()
+            else:
+                run.status = 'running'
+                run.finished_at = None
+            self.run_id = run.id
+
+            if restart:
+                db.query(CollectionRunItem).filter(
+                    CollectionRunItem.run_id == run.id
+                ).update({'status': PENDING, 'error': None}, synchronize_session=False)
+
+            # 대상에서 빠진 종목의 미완료 기록 정리 (시가총액 순위 변동 등)
+            db.query(CollectionRunItem).filter(
+                CollectionRunItem.run_id == run.id,
+                CollectionRunItem.status != DONE,
+                ~CollectionRunItem.symbol.in_(symbols)
+            ).delete(synchronize_session=False)
+
+            # 아직 기록이 없는 종목만 pending으로 추가
+            bulk_upsert(
+                db,
+                CollectionRunItem,
+                [{'run_id': run.id, 'symbol': symbol, 'status': PENDING, 'attempts': 0} for symbol in symbols],
+                ('run_id', 'symbol'),
+                update_columns=()
+            )
+
+            done = {
+                symbol for (symbol,) in db.query(CollectionRunItem.symbol).filter(
+                    CollectionRunItem.run_id == run.id,
+                    CollectionRunItem.status == DONE
+                )
+            }
+            run.total_symbols = len(symbols)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        remaining = [symbol for symbol in symbols if symbol not in done]
+        if done:
+            logger.info(f"♻️ {self.trade_date} [{self.shard}] 수집 재개: 완료 {len(done)}개 건너뜀, 남은 종목 {len(remaining)}개")
+        return remaining
+
+    def _mark(self, symbols: List[str], status: str, error: Optional[str] = None) -> None:
+        if not symbols:
+            return
+        db = self.session_factory()
+        try:
+            db.query(CollectionRunItem).filter(
+                CollectionRunItem.run_id == self.run_id,
+                CollectionRunItem.symbol.in_(symbols)
+            ).update(
+                {
+                    'status': status,
+                    'error': error,
+                    'attempts': CollectionRunItem.attempts + 1
+                },
+                synchronize_session=False
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def mark_done(self, *symbols: str) -> None:
+        """종목 완료 기록"""
+        self._mark(list(symbols), DONE)
+
+    def mark_failed(self, symbol: str, error: str) -> None:
+        """종목 실패 기록 (다음 실행에서 다시 시도)"""
+        self._mark([symbol], FAILED, error[:500])
+
+    def progress(self, db: Optional[Session] = None) -> Dict[str, int]:
+        """상태별 종목 수"""
+        own_session = db is None
+        db = db or self.session_factory()
+        try:
+            counts = dict(
+                db.query(CollectionRunItem.status, func.count(CollectionRunItem.id))
+                .filter(CollectionRunItem.run_id == self.run_id)
+                .group_by(CollectionRunItem.status)
+                .all()
+            )
+        finally:
+            if own_session:
+                db.close()
+        return {status: counts.get(status, 0) for status in (DONE, FAILED, PENDING)}
+
+    def finish(self) -> Dict[str, int]:
+        """실행 종료 기록 후 최종 집계 반환"""
+        db = self.session_factory()
+        try:
+            counts = self.progress(db)
+            run = db.get(CollectionRun, self.run_id)
+            run.completed_symbols = counts[DONE]
+            run.failed_symbols = counts[FAILED]
+            run.status = 'completed' if counts[DONE] >= run.total_symbols else 'partial'
+            run.finished_at = func.now()
+            db.commit()
+            return counts
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
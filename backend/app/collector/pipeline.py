@@ -0,0 +1,245 @@
+"""
+수집 파이프라인 - 수집 → 지표 계산 → 저장 단계를 제한 큐로 연결해 동시에 실행
+
+- 수집: ConcurrentFetcher 워커들이 네트워크 호출 (속도 제한/재시도 포함)
+- 계산: 지표 계산 워커들이 수집 결과를 저장 가능한 DataFrame으로 변환
+- 저장: 단일 저장 스레드가 여러 종목을 모아 한 번에 기록
+
+큐가 가득 차면 앞 단계가 대기하므로(backpressure) 저장이 느려도 메모리가 무한히 늘지 않는다.
+DB 작업(저장, 실패 기록)은 모두 저장 스레드에서만 실행된다.
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from app.collector.fetcher import ConcurrentFetcher, FetchResult
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+@dataclass
+class StageStats:
+    """단계별 처리량 집계"""
+    name: str
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, elapsed: float, count: int = 1, ok: bool = True) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self.started_at is None:
+                self.started_at = now - elapsed
+            self.finished_at = now
+            self.busy_seconds += elapsed
+            if ok:
+                self.processed += count
+            else:
+                self.failed += count
+
+    @property
+    def wall_seconds(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 종목 수 (단계 시작~종료 기준)"""
+        wall = self.wall_seconds
+        return self.processed / wall if wall > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.name}: 처리 {self.processed}개, 실패 {self.failed}개, "
+            f"{self.throughput:.1f}개/초 (작업 {self.busy_seconds:.2f}초, 구간 {self.wall_seconds:.2f}초)"
+        )
+
+
+class CollectionPipeline:
+    """수집/계산/저장 3단계 파이프라인
+
+    compute(result) -> DataFrame: 수집 결과를 저장할 DataFrame으로 변환 (실패시 예외)
+    write(batch) -> 저장한 종목 목록 또는 None: {symbol: DataFrame} 묶음을 한 번에 저장 (실패시 예외)
+        목록을 반환하면 목록에 없는 종목은 on_failed로 보고한다 (None이면 묶음 전체를 저장으로 봄)
+    on_written(symbols) / on_failed(symbol, error): 저장 스레드에서 호출되는 결과 콜백
+    """
+
+    def __init__(
+        self,
+        fetcher: ConcurrentFetcher,
+        compute: Callable[[FetchResult], pd.DataFrame],
+        write: Callable[[Dict[str, pd.DataFrame]], Optional[List[str]]],
+        on_written: Optional[Callable[[List[str]], None]] = None,
+        on_failed: Optional[Callable[[str, str], None]] = None,
+        compute_workers: int = 2,
+        queue_size: int = 32,
+        write_batch_size: int = 20,
+        write_flush_seconds: float = 1.0
+    ):
+        self.fetcher = fetcher
+        self.compute = compute
+        self.write = write
+        self.on_written = on_written
+        self.on_failed = on_failed
+        self.compute_workers = max(1, compute_workers)
+        self.queue_size = queue_size
+        self.write_batch_size = max(1, write_batch_size)
+        self.write_flush_seconds = write_flush_seconds
+
+        self.stats = {
+            'fetch': StageStats('수집'),
+            'compute': StageStats('계산'),
+            'write': StageStats('저장'),
+        }
+
+    def run(self, requests: Iterable[Tuple[str, date, date]]) -> Dict[str, StageStats]:
+        """모든 요청을 처리할 때까지 파이프라인 실행"""
+        request_queue: queue.Queue = queue.Queue()
+        for request in requests:
+            request_queue.put(request)
+
+        compute_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        write_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+
+        fetch_threads = [
+            threading.Thread(target=self._fetch_worker, args=(request_queue, compute_queue, write_queue),
+                             name=f"fetch-{i}", daemon=True)
+            for i in range(self.fetcher.max_workers)
+        ]
+        compute_threads = [
+            threading.Thread(target=self._compute_worker, args=(compute_queue, write_queue),
+                             name=f"compute-{i}", daemon=True)
+            for i in range(self.compute_workers)
+        ]
+        writer = threading.Thread(target=self._write_worker, args=(write_queue,), name="write", daemon=True)
+
+        for thread in fetch_threads + compute_threads + [writer]:
+            thread.start()
+
+        for thread in fetch_threads:
+            thread.join()
+        for _ in compute_threads:
+            compute_queue.put(_STOP)
+        for thread in compute_threads:
+            thread.join()
+        write_queue.put(_STOP)
+        writer.join()
+
+        for stats in self.stats.values():
+            logger.info(f"📈 {stats.summary()}")
+        return self.stats
+
+    def _fetch_worker(self, request_queue: queue.Queue, compute_queue: queue.Queue, write_queue: queue.Queue) -> None:
+        while True:
+            try:
+                symbol, start, end = request_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            result = self.fetcher.fetch_one(symbol, start, end)
+            self.stats['fetch'].record(result.elapsed, ok=result.ok)
+            if result.ok:
+                compute_queue.put(result)
+            else:
+                write_queue.put(('failed', symbol, f"데이터 수집 실패: {result.error}"))
+
+    def _compute_worker(self, compute_queue: queue.Queue, write_queue: queue.Queue) -> None:
+        while True:
+            result = compute_queue.get()
+            if result is _STOP:
+                return
+
+            started = time.monotonic()
+            try:
+                df = self.compute(result)
+                self.stats['compute'].record(time.monotonic() - started)
+                write_queue.put(('data', result.symbol, df))
+            except Exception as e:
+                self.stats['compute'].record(time.monotonic() - started, ok=False)
+                write_queue.put(('failed', result.symbol, str(e)))
+
+    def _write_worker(self, write_queue: queue.Queue) -> None:
+        batch: Dict[str, pd.DataFrame] = {}
+
+        while True:
+            try:
+                item = write_queue.get(timeout=self.write_flush_seconds)
+            except queue.Empty:
+                self._flush(batch)
+                continue
+
+            if item is _STOP:
+                self._flush(batch)
+                return
+
+            kind, symbol, payload = item
+            if kind == 'failed':
+                self._notify_failed(symbol, payload)
+                continue
+
+            batch[symbol] = payload
+            if len(batch) >= self.write_batch_size:
+                self._flush(batch)
+
+    def _flush(self, batch: Dict[str, pd.DataFrame]) -> None:
+        """모인 종목을 한 번에 저장 (묶음 실패시 종목별로 다시 시도)"""
+        if not batch:
+            return
+
+        started = time.monotonic()
+        try:
+            saved = self.write(dict(batch))
+            self.stats['write'].record(time.monotonic() - started, count=len(batch))
+            self._notify_saved(list(batch), saved)
+        except Exception as e:
+            logger.warning(f"⚠️ {len(batch)}개 종목 묶음 저장 실패, 종목별 재시도: {e}")
+            for symbol, df in batch.items():
+                item_started = time.monotonic()
+                try:
+                    saved = self.write({symbol: df})
+                    self.stats['write'].record(time.monotonic() - item_started)
+                    self._notify_saved([symbol], saved)
+                except Exception as item_error:
+                    self.stats['write'].record(time.monotonic() - item_started, ok=False)
+                    self._notify_failed(symbol, f"저장 실패: {item_error}")
+        finally:
+            batch.clear()
+
+    def _notify_saved(self, symbols: List[str], saved: Optional[List[str]]) -> None:
+        """write()가 저장한 종목만 완료로, 나머지는 실패로 보고"""
+        if saved is None:
+            self._notify_written(symbols)
+            return
+        saved_set = set(saved)
+        written = [symbol for symbol in symbols if symbol in saved_set]
+        if written:
+            self._notify_written(written)
+        for symbol in symbols:
+            if symbol not in saved_set:
+                self._notify_failed(symbol, "저장되지 않음 (종목 정보 없음 또는 저장할 데이터 없음)")
+
+    def _notify_written(self, symbols: List[str]) -> None:
+        if self.on_written:
+            try:
+                self.on_written(symbols)
+            except Exception as e:
+                logger.error(f"❌ 저장 완료 기록 실패: {e}")
+
+    def _notify_failed(self, symbol: str, error: str) -> None:
+        if self.on_failed:
+            try:
+                self.on_failed(symbol, error)
+            except Exception as e:
+                logger.error(f"❌ {symbol} 실패 기록 실패: {e}")
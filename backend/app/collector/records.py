@@ -0,0 +1,103 @@
+"""
+컬럼 단위 레코드 변환 - DataFrame을 DB insert용 dict 목록으로 변환
+
+iterrows() + 셀별 pd.notna()/float() 대신 컬럼 전체를 한 번에 변환한다.
+(NaN → None, numpy 스칼라 → 파이썬 기본 타입, Timestamp → date)
+"""
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+# DB 컬럼명 → DataFrame 컬럼명
+PRICE_COLUMNS = {
+    'date': 'Date',
+    'open': 'Open',
+    'high': 'High',
+    'low': 'Low',
+    'close': 'Close',
+    'volume': 'Volume',
+    'change_amount': 'change_amount',
+    'change_percent': 'change_percent',
+}
+
+INDICATOR_COLUMNS = {
+    'date': 'Date',
+    'rsi': 'rsi',
+    'macd': 'macd',
+    'macd_signal': 'macd_signal',
+    'macd_histogram': 'macd_histogram',
+    'sma_20': 'sma_20',
+    'sma_60': 'sma_60',
+}
+
+
+def column_values(series: pd.Series, as_int: bool = False) -> List[Any]:
+    """Series 하나를 파이썬 값 리스트로 변환 (결측값은 None)"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = np.array(series.dt.date, dtype=object)
+    elif as_int:
+        values = np.full(len(series), None, dtype=object)
+        mask = series.notna().to_numpy()
+        values[mask] = series.to_numpy()[mask].astype(np.int64).astype(object)
+        return values.tolist()
+    else:
+        values = series.to_numpy(dtype=object)
+
+    mask = series.isna().to_numpy()
+    if mask.any():
+        values = values.copy()
+        values[mask] = None
+    return values.tolist()
+
+
+def frame_to_records(
+    df: pd.DataFrame,
+    columns: Mapping[str, str],
+    int_columns: Iterable[str] = (),
+    constants: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """DataFrame을 insert용 레코드 리스트로 변환
+
+    columns: DB 컬럼명 → DataFrame 컬럼명 (DataFrame에 없는 컬럼은 None)
+    int_columns: 정수로 저장해야 하는 DB 컬럼명 (예: volume)
+    constants: 모든 레코드에 공통으로 들어갈 값 (예: stock_id)
+    """
+    int_columns = set(int_columns)
+    keys = list(constants or {}) + list(columns)
+    length = len(df)
+
+    data = [[value] * length for value in (constants or {}).values()]
+    for key, source in columns.items():
+        if source in df.columns:
+            data.append(column_values(df[source], as_int=key in int_columns))
+        else:
+            data.append([None] * length)
+
+    return [dict(zip(keys, values)) for values in zip(*data)]
+
+
+def price_records(df: pd.DataFrame, stock_id: int) -> List[Dict[str, Any]]:
+    """StockPrice insert용 레코드"""
+    return frame_to_records(df, PRICE_COLUMNS, int_columns=('volume',), constants={'stock_id': stock_id})
+
+
+def indicator_records(df: pd.DataFrame, stock_id: int) -> List[Dict[str, Any]]:
+    """TechnicalIndicator insert용 레코드"""
+    return frame_to_records(df, INDICATOR_COLUMNS, constants={'stock_id': stock_id})
+
+
+def indicator_value_records(df: pd.DataFrame, stock_id: int, names: Iterable[str]) -> List[Dict[str, Any]]:
+    """IndicatorValue insert용 레코드 (지표 출력 하나당 한 행, 값이 없는 날짜는 제외)"""
+    if df.empty or 'Date' not in df.columns:
+        return []
+
+    dates = column_values(df['Date'])
+    records = []
+    for name in names:
+        if name not in df.columns:
+            continue
+        for day, value in zip(dates, column_values(df[name])):
+            if value is not None and np.isfinite(value):
+                records.append({'stock_id': stock_id, 'date': day, 'name': name, 'value': float(value)})
+    return records
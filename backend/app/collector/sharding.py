@@ -0,0 +1,36 @@
+"""
+수집 샤딩 - 종목 코드 해시로 수집 대상을 N개 작업에 결정적으로 분배
+"""
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, List
+
+
+@dataclass(frozen=True)
+class ShardSpec:
+    """샤드 지정 (index: 0부터 시작, count: 전체 샤드 수)"""
+    index: int = 0
+    count: int = 1
+
+    @property
+    def label(self) -> str:
+        return "all" if self.count == 1 else f"{self.index}/{self.count}"
+
+    def contains(self, symbol: str) -> bool:
+        """종목이 이 샤드에 속하는지 여부 (프로세스와 무관하게 항상 같은 결과)"""
+        return self.count == 1 or zlib.crc32(symbol.encode()) % self.count == self.index
+
+    def select(self, symbols: Iterable[str]) -> List[str]:
+        return [symbol for symbol in symbols if self.contains(symbol)]
+
+
+def parse_shard(spec: str) -> ShardSpec:
+    """'i/N' 형식 문자열 파싱 (예: '0/4')"""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"샤드 형식이 올바르지 않습니다: {spec} (예: 0/4)")
+
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드 범위가 올바르지 않습니다: {spec} (0 <= i < N)")
+    return ShardSpec(index, count)
@@ -0,0 +1,76 @@
+"""
+시장 전체 스냅샷 - KRX 상장종목 목록 한 번으로 최신 거래일 일봉 도출
+
+fdr.StockListing('KRX')는 전 종목의 당일 시가/고가/저가/종가/거래량을 담고 있으므로
+이미 전일까지 저장된 종목은 종목별 DataReader 호출 없이 최신 일봉을 만들 수 있다.
+"""
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from app.collector.history import OHLCV_COLUMNS
+
+
+def listing_bars(listing_df: pd.DataFrame) -> pd.DataFrame:
+    """상장종목 목록에서 종목코드별 당일 일봉 추출
+
+    거래정지 등으로 시가/거래량이 0이거나 비어 있는 종목은 제외한다.
+    """
+    if not set(OHLCV_COLUMNS).issubset(listing_df.columns):
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    bars = listing_df.set_index('Code')[OHLCV_COLUMNS].apply(pd.to_numeric, errors='coerce')
+    traded = bars.notna().all(axis=1) & (bars['Open'] > 0) & (bars['Volume'] > 0)
+    return bars[traded]
+
+
+def resolve_trade_dates(probe_df: pd.DataFrame) -> Tuple[Optional[date], Optional[date]]:
+    """기준 종목의 최근 일봉으로 (최신 거래일, 직전 거래일) 결정"""
+    if probe_df is None or len(probe_df) == 0:
+        return None, None
+
+    dates = pd.DatetimeIndex(probe_df.index).sort_values()
+    latest = dates[-1].date()
+    previous = dates[-2].date() if len(dates) >= 2 else None
+    return latest, previous
+
+
+def is_snapshot_ready(last_stored: Optional[date], trade_date: date, previous_date: Optional[date]) -> bool:
+    """스냅샷 일봉 하나만으로 이력이 이어지는 종목인지 여부
+
+    직전 거래일까지 저장돼 있거나(신규 1일) 당일까지 저장돼 있으면(재수집) 충분하다.
+    저장 이력이 없거나 중간에 빈 거래일이 있으면 종목별 이력 수집이 필요하다.
+    """
+    if last_stored is None:
+        return False
+    return last_stored == trade_date or (previous_date is not None and last_stored == previous_date)
+
+
+def append_snapshot_bar(history: Optional[pd.DataFrame], bar: pd.Series, trade_date: date) -> pd.DataFrame:
+    """저장된 이력 뒤에 스냅샷 일봉을 붙여 DataSource 형식 DataFrame 생성"""
+    index = pd.DatetimeIndex([pd.Timestamp(trade_date)], name='Date')
+    today = pd.DataFrame([bar[OHLCV_COLUMNS].to_numpy()], columns=OHLCV_COLUMNS, index=index)
+
+    if history is None or history.empty:
+        return today
+
+    history = history[history.index < index[0]]
+    return pd.concat([history, today])
+
+
+def split_snapshot_universe(
+    symbols,
+    bars: pd.DataFrame,
+    last_dates: Dict[str, date],
+    trade_date: date,
+    previous_date: Optional[date]
+) -> Tuple[list, list]:
+    """(스냅샷으로 처리할 종목, 종목별 수집이 필요한 종목)으로 분리"""
+    snapshot, fallback = [], []
+    for symbol in symbols:
+        if symbol in bars.index and is_snapshot_ready(last_dates.get(symbol), trade_date, previous_date):
+            snapshot.append(symbol)
+        else:
+            fallback.append(symbol)
+    return snapshot, fallback
@@ -0,0 +1,111 @@
+"""
+주가 데이터 소스 - 수집기가 사용하는 교체 가능한 데이터 제공자
+"""
+import random
+import time
+import zlib
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class DataSource(ABC):
+    """일별 OHLCV 데이터 제공자 인터페이스
+
+    반환 형식은 FinanceDataReader와 동일하게 맞춘다:
+    'Date' 이름의 DatetimeIndex + Open/High/Low/Close/Volume 컬럼
+    """
+    name: str = "base"
+
+    @abstractmethod
+    def fetch_history(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """종목의 [start, end] 구간 일봉 조회"""
+
+
+class FinanceDataReaderSource(DataSource):
+    """FinanceDataReader 기반 실제 데이터 소스"""
+    name = "fdr"
+
+    def fetch_history(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        import FinanceDataReader as fdr
+
+        return fdr.DataReader(symbol, start=start, end=end)
+
+
+class FakeDataSource(DataSource):
+    """네트워크 지연을 흉내내는 로컬 가짜 데이터 소스 (벤치마크/개발용)
+
+    종목 코드로 시드를 고정하므로 같은 구간 요청은 항상 같은 데이터를 돌려준다.
+    """
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.2,
+        jitter: float = 0.05,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+
+    def fetch_history(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise ConnectionError(f"{symbol}: 가짜 데이터 소스 일시 오류")
+
+        return self._generate_bars(symbol, start, end)
+
+    @staticmethod
+    def _generate_bars(symbol: str, start: date, end: date) -> pd.DataFrame:
+        """종목별로 결정적인 랜덤 워크 일봉 생성"""
+        dates = pd.bdate_range(start=start, end=end, name="Date")
+        if len(dates) == 0:
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume", "Change"])
+
+        # 날짜 기준 오프셋으로 생성해야 구간이 달라도 같은 날짜는 같은 값이 된다
+        base_day = pd.Timestamp("2000-01-03")
+        offsets = np.asarray((dates - base_day).days // 7 * 5 + dates.dayofweek, dtype=np.int64)
+        rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+        span = int(offsets.max()) + 1
+        returns = rng.normal(0.0003, 0.02, span)
+        path = 10000.0 * np.exp(np.cumsum(returns))
+        close = np.round(path[offsets], 0)
+
+        spread = np.abs(rng.normal(0, 0.01, span))[offsets]
+        open_ = np.round(close * (1 + rng.normal(0, 0.005, span)[offsets]), 0)
+        high = np.maximum(open_, close) * (1 + spread)
+        low = np.minimum(open_, close) * (1 - spread)
+        volume = rng.integers(10_000, 5_000_000, span)[offsets]
+
+        df = pd.DataFrame(
+            {
+                "Open": open_,
+                "High": np.round(high, 0),
+                "Low": np.round(low, 0),
+                "Close": close,
+                "Volume": volume,
+            },
+            index=dates,
+        )
+        df["Change"] = df["Close"].pct_change()
+        return df
+
+
+def get_data_source(name: str, **kwargs) -> DataSource:
+    """이름으로 데이터 소스 생성"""
+    sources = {
+        FinanceDataReaderSource.name: FinanceDataReaderSource,
+        FakeDataSource.name: FakeDataSource,
+    }
+    if name not in sources:
+        raise ValueError(f"알 수 없는 데이터 소스: {name} (사용 가능: {', '.join(sources)})")
+    return sources[name](**kwargs)
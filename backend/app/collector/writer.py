@@ -0,0 +1,60 @@
+"""
+대량 저장기 - INSERT ... ON CONFLICT DO UPDATE 기반 청크 단위 upsert
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def dialect_insert(dialect_name: str):
+    """DB 종류별 ON CONFLICT 지원 insert 생성자"""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"bulk upsert를 지원하지 않는 데이터베이스: {dialect_name}")
+    return insert
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """행 목록을 청크 단위로 upsert 하고 처리한 행 수를 반환
+
+    conflict_columns는 테이블의 유니크 인덱스와 일치해야 한다
+    (예: StockPrice → uk_stock_date (stock_id, date)).
+    커밋은 호출자가 담당한다.
+    """
+    if not rows:
+        return 0
+
+    dialect_name = db.get_bind().dialect.name
+    insert = dialect_insert(dialect_name)
+    table = model.__table__
+
+    columns = list(rows[0].keys())
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in conflict_columns]
+
+    # 문장은 한 번만 만들고 청크별 executemany로 실행 (컴파일 캐시 재사용)
+    stmt = insert(table)
+    if update_columns:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={c: stmt.excluded[c] for c in update_columns}
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+    for offset in range(0, len(rows), chunk_size):
+        db.execute(stmt, rows[offset:offset + chunk_size])
+
+    return len(rows)
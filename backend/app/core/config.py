@@ -36,12 +36,21 @@ class Settings(BaseSettings):
     
     # 캐시 설정 (메모리 기반)
     CACHE_TTL_SECONDS: int = 3600
+    INDICATOR_CACHE_SIZE: int = 512  # 사용자 지정 기간 지표 계산 결과 LRU 캐시 항목 수
+    BACKTEST_CACHE_SIZE: int = 32  # 백테스트 결과 LRU 캐시 항목 수
     
     # 데이터 수집 설정
     DATA_COLLECTION_ENABLED: bool = True
     MAX_STOCKS: int = 200  # 무료 플랜: 상위 200개 종목만
     DATA_RETENTION_DAYS: int = 180  # 6개월
-    
+    COLLECT_DATA_SOURCE: str = "fdr"  # 'fdr' 또는 'fake' (벤치마크/개발용)
+    COLLECT_MAX_WORKERS: int = 8  # 동시 수집 워커 수
+    COLLECT_RATE_LIMIT: float = 5.0  # 초당 최대 요청 수 (0이면 제한 없음)
+    COLLECT_MAX_RETRIES: int = 3  # 종목별 재시도 횟수
+    COLLECT_WRITE_BATCH_SIZE: int = 20  # 한 트랜잭션에 묶어 저장할 종목 수
+    COLLECT_CACHE_DIR: Optional[str] = ".cache/ohlcv"  # 원본 일봉 캐시 경로 (비우면 캐시 사용 안 함)
+    COLLECT_CACHE_TODAY_TTL_SECONDS: int = 900  # 확정 전 당일 일봉 캐시 유효 시간
+
     # 보안
     SECRET_KEY: str = "change-this-secret-key"
     
@@ -0,0 +1,111 @@
+"""
+단계 오케스트레이터 - 의존 관계가 있는 배치 단계를 한 프로세스에서 순서대로 실행
+
+- 각 단계는 공유 context(dict)를 받아 다음 단계가 쓸 결과를 context에 남긴다
+  (예: 수집 단계가 계산한 DataFrame을 스크리닝 단계가 DB 재조회 없이 사용)
+- 선언 순서를 유지한 위상 정렬로 실행하고, 실패한 단계에 의존하는 단계는 건너뛴다
+- 단계별 소요 시간과 결과를 StageTiming으로 남긴다
+"""
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Stage:
+    """실행 단계 (run(context)의 반환값은 context[name]에 저장)"""
+    name: str
+    run: Callable[[Dict[str, Any]], Any]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageTiming:
+    """단계 실행 결과"""
+    name: str
+    status: str  # 'done', 'failed', 'skipped'
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+@dataclass
+class OrchestratorReport:
+    timings: List[StageTiming] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return all(timing.status == 'done' for timing in self.timings)
+
+    def summary(self) -> str:
+        parts = [f"{timing.name} {timing.seconds:.2f}초 ({timing.status})" for timing in self.timings]
+        total = sum(timing.seconds for timing in self.timings)
+        return f"{', '.join(parts)} / 합계 {total:.2f}초"
+
+
+def execution_order(stages: Sequence[Stage]) -> List[Stage]:
+    """의존 관계를 만족하는 실행 순서 (같은 조건이면 선언 순서, 순환/미등록 의존은 ValueError)"""
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [name for name in stage.depends_on if name not in by_name]
+        if missing:
+            raise ValueError(f"{stage.name} 단계의 의존 단계가 없습니다: {', '.join(missing)}")
+
+    ordered: List[Stage] = []
+    placed = set()
+    remaining = list(stages)
+    while remaining:
+        ready = [stage for stage in remaining if all(name in placed for name in stage.depends_on)]
+        if not ready:
+            raise ValueError(f"단계 의존 관계에 순환이 있습니다: {', '.join(stage.name for stage in remaining)}")
+        stage = ready[0]
+        ordered.append(stage)
+        placed.add(stage.name)
+        remaining.remove(stage)
+    return ordered
+
+
+def run_stages(
+    stages: Sequence[Stage],
+    context: Optional[Dict[str, Any]] = None,
+    only: Optional[Iterable[str]] = None
+) -> OrchestratorReport:
+    """단계를 의존 순서대로 실행
+
+    only가 주어지면 해당 단계만 실행하고, 빠진 의존 단계는 이미 끝난 것으로 본다
+    (그 결과가 context에 없으면 각 단계가 DB에서 읽도록 작성한다).
+    """
+    context = {} if context is None else context
+    selected = set(only) if only else None
+    report = OrchestratorReport()
+    failed = set()
+
+    for stage in execution_order(stages):
+        if selected is not None and stage.name not in selected:
+            continue
+
+        blocked = [name for name in stage.depends_on if name in failed]
+        if blocked:
+            logger.warning(f"⏭️ {stage.name} 단계 건너뜀 (실패한 선행 단계: {', '.join(blocked)})")
+            report.timings.append(StageTiming(stage.name, 'skipped'))
+            failed.add(stage.name)
+            continue
+
+        logger.info(f"▶️ {stage.name} 단계 시작")
+        started = time.perf_counter()
+        try:
+            context[stage.name] = stage.run(context)
+        except Exception as e:
+            elapsed = time.perf_counter() - started
+            logger.error(f"❌ {stage.name} 단계 실패 ({elapsed:.2f}초): {e}")
+            report.timings.append(StageTiming(stage.name, 'failed', elapsed, str(e)))
+            failed.add(stage.name)
+            continue
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"✅ {stage.name} 단계 완료 ({elapsed:.2f}초)")
+        report.timings.append(StageTiming(stage.name, 'done', elapsed))
+
+    return report
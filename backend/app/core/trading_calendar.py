@@ -0,0 +1,159 @@
+"""
+KRX 거래일 달력 - 저장된 지수 일자와 휴장일 테이블로 거래일 판정
+
+- 지수가 저장된 구간: 지수 일자가 곧 거래일 (임시 휴장도 자연히 반영)
+- 그 밖의 구간(아직 지수가 없는 오늘 등): 주말과 휴장일(market_holidays)을 뺀 평일
+- 달력 범위의 날짜마다 '그날까지의 마지막 거래일' 위치를 미리 계산해 두어 조회는 O(1)
+- API는 (날짜, 마지막 지수일/휴장일 id, CALENDAR_CACHE_SECONDS 구간)별로 한 번만 만들어 재사용 (get_trading_calendar)
+"""
+import logging
+import time
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.database import SessionLocal
+from app.models import MarketHoliday, MarketIndex
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_LOOKBACK_DAYS = 730  # 오늘 이전 달력 범위
+CALENDAR_LOOKAHEAD_DAYS = 60  # 오늘 이후 달력 범위
+CALENDAR_CACHE_SECONDS = 600  # 휴장일 삭제/과거 지수 보충처럼 키에 안 잡히는 변경의 최대 반영 지연
+
+calendar_cache = LRUCache(4)
+
+
+class TradingCalendar:
+    """[start, end] 구간의 거래일 달력 (구간 밖은 주말/휴장일 규칙으로 판정)"""
+
+    def __init__(self, trading_days: Iterable[date], holidays: Iterable[date], start: date, end: date):
+        self.start = start
+        self.end = end
+        self.holidays = frozenset(holidays)
+        self.days: List[date] = sorted(day for day in set(trading_days) if start <= day <= end)
+        self._days = frozenset(self.days)
+
+        # _latest[i] = start + i일까지의 마지막 거래일 위치 (-1이면 없음)
+        self._latest: List[int] = []
+        position = -1
+        for offset in range((end - start).days + 1):
+            if position + 1 < len(self.days) and self.days[position + 1] == start + timedelta(days=offset):
+                position += 1
+            self._latest.append(position)
+
+    def _is_open_by_rule(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def is_trading_day(self, day: date) -> bool:
+        if self.start <= day <= self.end:
+            return day in self._days
+        return self._is_open_by_rule(day)
+
+    def latest_trading_day(self, day: Optional[date] = None) -> Optional[date]:
+        """day(기본값: 오늘)와 같거나 이전인 마지막 거래일"""
+        day = day or date.today()
+        if not self.start <= day <= self.end:
+            return self._walk(day, -1)
+        position = self._latest[(day - self.start).days]
+        return self.days[position] if position >= 0 else self._walk(self.start - timedelta(days=1), -1)
+
+    def previous_trading_day(self, day: Optional[date] = None) -> Optional[date]:
+        """day(기본값: 오늘) 직전 거래일"""
+        return self.latest_trading_day((day or date.today()) - timedelta(days=1))
+
+    def next_trading_day(self, day: Optional[date] = None) -> Optional[date]:
+        """day(기본값: 오늘) 다음 거래일"""
+        day = day or date.today()
+        if self.start <= day < self.end:
+            position = self._latest[(day - self.start).days] + 1
+            if position < len(self.days):
+                return self.days[position]
+            day = self.end
+        return self._walk(day + timedelta(days=1), 1)
+
+    def trading_days(self, since: date, until: date) -> List[date]:
+        """[since, until] 구간의 거래일 목록 (달력 범위 안에서만)"""
+        return self.days[bisect_right(self.days, since - timedelta(days=1)):bisect_right(self.days, until)]
+
+    def _walk(self, day: date, step: int, limit: int = 31) -> Optional[date]:
+        """규칙(주말/휴장일 제외)으로 step 방향의 가장 가까운 거래일 탐색"""
+        for _ in range(limit):
+            if self._is_open_by_rule(day):
+                return day
+            day += timedelta(days=step)
+        return None
+
+
+def build_trading_calendar(db: Session, today: Optional[date] = None) -> TradingCalendar:
+    """오늘 기준 [-CALENDAR_LOOKBACK_DAYS, +CALENDAR_LOOKAHEAD_DAYS] 달력 생성 (쿼리 2번)"""
+    today = today or date.today()
+    start = today - timedelta(days=CALENDAR_LOOKBACK_DAYS)
+    end = today + timedelta(days=CALENDAR_LOOKAHEAD_DAYS)
+
+    index_days = {
+        day for (day,) in db.query(MarketIndex.date).filter(MarketIndex.date >= start).distinct()
+    }
+    holidays = {day for (day,) in db.query(MarketHoliday.date)}
+
+    # 지수가 저장된 구간은 지수 일자, 그 밖은 평일 - 휴장일
+    first = min(index_days) if index_days else None
+    last = max(index_days) if index_days else None
+    trading_days = set(index_days)
+    day = start
+    while day <= end:
+        covered = first is not None and first <= day <= last
+        if not covered and day.weekday() < 5 and day not in holidays:
+            trading_days.add(day)
+        day += timedelta(days=1)
+
+    return TradingCalendar(trading_days, holidays, start, end)
+
+
+def calendar_version(db: Session) -> Tuple:
+    """달력을 만드는 데이터의 버전 (지수 마지막 일자, 휴장일 마지막 id) - 인덱스만 읽는 조회 1번"""
+    return tuple(db.query(
+        db.query(func.max(MarketIndex.date)).scalar_subquery(),
+        db.query(func.max(MarketHoliday.id)).scalar_subquery(),
+    ).one())
+
+
+def get_trading_calendar(db: Session, today: Optional[date] = None) -> TradingCalendar:
+    """(날짜, 데이터 버전)별로 한 번만 만든 거래일 달력
+
+    새 지수일 저장과 휴장일 등록은 버전이 바뀌어 바로 반영되고, 휴장일 삭제처럼 버전에 드러나지 않는
+    변경은 CALENDAR_CACHE_SECONDS 안에 반영된다 (같은 프로세스의 변경은 invalidate_trading_calendar).
+    """
+    today = today or date.today()
+    key = (today, *calendar_version(db), int(time.time() // CALENDAR_CACHE_SECONDS))
+    return calendar_cache.get_or_compute(key, lambda: build_trading_calendar(db, today))
+
+
+def invalidate_trading_calendar() -> None:
+    """이 프로세스의 거래일 달력 캐시 비우기 (지수/휴장일 저장 후 호출)"""
+    calendar_cache.clear()
+
+
+def load_trading_calendar(today: Optional[date] = None) -> TradingCalendar:
+    """새 세션으로 거래일 달력 조회 (배치 스크립트용)"""
+    db = SessionLocal()
+    try:
+        return get_trading_calendar(db, today)
+    finally:
+        db.close()
+
+
+def skip_if_closed(calendar: TradingCalendar, day: Optional[date] = None, force: bool = False) -> bool:
+    """day(기본값: 오늘)가 휴장일이면 안내 로그를 남기고 True (force면 항상 False)"""
+    day = day or date.today()
+    if force or calendar.is_trading_day(day):
+        return False
+    logger.info(
+        f"📅 {day}은(는) 휴장일입니다 (최근 거래일: {calendar.latest_trading_day(day)}). "
+        f"실행을 건너뜁니다 (--force로 강제 실행)"
+    )
+    return True
@@ -0,0 +1 @@
+# 기술적 지표 계산 패키지
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+사용자 지정 기간 지표 - 저장된 종가로 요청 시점에 계산하고 LRU 캐시에 보관
+
+캐시 키는 (종목, 지표, 기간, 마지막 저장 거래일, 종목 데이터 변경 시각)이므로 새 일봉이 저장되거나
+과거 일봉이 정정되면 자연히 새 키로 다시 계산되고 이전 항목은 LRU 순서에 따라 밀려난다.
+"""
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.collector.dirty import stock_version
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.indicators.registry import IndicatorContext, macd_series, rsi_series
+from app.models import StockPrice
+
+MIN_PERIOD = 2
+MAX_PERIOD = 250
+
+indicator_cache = LRUCache(settings.INDICATOR_CACHE_SIZE)
+
+
+@dataclass(frozen=True)
+class CustomIndicator:
+    """요청된 지표와 기간"""
+    indicator: str  # 'rsi', 'macd', 'sma'
+    params: Tuple[int, ...]
+
+    @property
+    def suffix(self) -> str:
+        return "_".join(str(p) for p in self.params)
+
+    def compute(self, ctx: IndicatorContext) -> Dict[str, pd.Series]:
+        """출력 컬럼명(예: rsi_9, macd_5_35_5) → 값"""
+        if self.indicator == 'rsi':
+            return {f"rsi_{self.suffix}": rsi_series(ctx, *self.params)}
+        if self.indicator == 'macd':
+            macd, signal, histogram = macd_series(ctx, *self.params)
+            return {
+                f"macd_{self.suffix}": macd,
+                f"macd_signal_{self.suffix}": signal,
+                f"macd_histogram_{self.suffix}": histogram,
+            }
+        if self.indicator == 'sma':
+            return {f"sma_{self.suffix}": ctx.rolling_mean('Close', *self.params)}
+        raise ValueError(f"지원하지 않는 지표입니다: {self.indicator}")
+
+
+def _parse_periods(text: str, name: str) -> Tuple[int, ...]:
+    try:
+        periods = tuple(int(part) for part in text.split(","))
+    except ValueError:
+        raise ValueError(f"{name} 값은 쉼표로 구분한 정수여야 합니다: {text}")
+    for period in periods:
+        if not MIN_PERIOD <= period <= MAX_PERIOD:
+            raise ValueError(f"{name} 기간은 {MIN_PERIOD}~{MAX_PERIOD} 사이여야 합니다: {period}")
+    return periods
+
+
+def parse_custom_indicators(
+    rsi_period: Optional[int] = None,
+    macd: Optional[str] = None,
+    sma: Optional[str] = None
+) -> List[CustomIndicator]:
+    """쿼리 파라미터를 지표 요청 목록으로 변환 (잘못된 값은 ValueError)"""
+    requests = []
+    if rsi_period is not None:
+        requests.append(CustomIndicator('rsi', _parse_periods(str(rsi_period), 'rsi_period')))
+    if macd:
+        params = _parse_periods(macd, 'macd')
+        if len(params) != 3 or params[0] >= params[1]:
+            raise ValueError(f"macd는 '단기,장기,신호' 형식이고 단기 < 장기여야 합니다: {macd}")
+        requests.append(CustomIndicator('macd', params))
+    if sma:
+        requests.extend(CustomIndicator('sma', (window,)) for window in sorted(set(_parse_periods(sma, 'sma'))))
+    return requests
+
+
+def _to_mapping(series: pd.Series) -> Dict[date, Optional[float]]:
+    return {
+        day: (None if value is None or math.isnan(value) else float(value))
+        for day, value in series.items()
+    }
+
+
+def get_custom_indicators(
+    db: Session,
+    stock_id: int,
+    symbol: str,
+    requests: List[CustomIndicator]
+) -> Dict[str, Dict[date, Optional[float]]]:
+    """출력 컬럼명 → {날짜: 값} (캐시에 없는 지표만 저장된 전체 종가로 계산)"""
+    if not requests:
+        return {}
+
+    last_date = db.query(func.max(StockPrice.date)).filter(StockPrice.stock_id == stock_id).scalar()
+    if last_date is None:
+        return {}
+
+    version = stock_version(db, stock_id)
+    context = None
+    results: Dict[str, Dict[date, Optional[float]]] = {}
+    for request in requests:
+        key = (symbol, request.indicator, request.params, last_date, version)
+        values = indicator_cache.get(key)
+        if values is None:
+            if context is None:
+                rows = (
+                    db.query(StockPrice.date, StockPrice.close)
+                    .filter(StockPrice.stock_id == stock_id)
+                    .order_by(StockPrice.date)
+                    .all()
+                )
+                closes = pd.DataFrame(rows, columns=['Date', 'Close']).set_index('Date')
+                context = IndicatorContext(closes)
+            values = {name: _to_mapping(series) for name, series in request.compute(context).items()}
+            indicator_cache.put(key, values)
+        results.update(values)
+    return results
@@ -0,0 +1,146 @@
+"""
+다종목 지표 엔진 - (종목 × 날짜) 종가 패널에서 전 종목 지표를 한 번에 계산
+
+scripts/collect_daily_data.py의 calculate_technical_indicators(pandas, 종목별)와
+같은 정의를 numpy 배열 연산으로 구현한다.
+- RSI(14): 상승/하락폭의 14일 단순이동평균 기반
+- MACD: EMA12 - EMA26 (pandas ewm(span, adjust=True)와 동일), 신호선 EMA9, 히스토그램
+- SMA20/60, 전일 대비 변화량/변화율
+
+상장일이 다르거나 거래정지로 빈 날짜(NaN)가 있는 종목은 각 행의 유효값을 앞으로 모아
+종목별 계산과 똑같이 처리한 뒤 원래 날짜 위치로 되돌린다.
+"""
+from typing import Dict, Hashable, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+SMA_WINDOWS = (20, 60)
+
+INDICATOR_NAMES = (
+    'rsi', 'macd', 'macd_signal', 'macd_histogram', 'sma_20', 'sma_60',
+    'change_amount', 'change_percent',
+)
+
+
+def _compact(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """각 행의 유효값을 앞쪽으로 모음 (반환: 압축 패널, 원래 열 인덱스, 유효 개수)"""
+    valid = ~np.isnan(values)
+    # 유효값이 먼저 오도록 안정 정렬 → 날짜 순서 유지
+    order = np.argsort(~valid, axis=1, kind='stable')
+    compacted = np.take_along_axis(values, order, axis=1)
+    counts = valid.sum(axis=1)
+    return compacted, order, counts
+
+
+def _expand(compacted: np.ndarray, order: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """압축 패널 결과를 원래 날짜 위치로 되돌림"""
+    positions = np.arange(compacted.shape[1])
+    result = np.where(positions[None, :] < counts[:, None], compacted, np.nan)
+    expanded = np.full_like(compacted, np.nan)
+    np.put_along_axis(expanded, order, result, axis=1)
+    return expanded
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """앞쪽 정렬된 패널의 window일 단순이동평균 (window개 미만이면 NaN)"""
+    filled = np.nan_to_num(values, nan=0.0)
+    cumsum = np.cumsum(filled, axis=1)
+    sums = cumsum.copy()
+    sums[:, window:] = cumsum[:, window:] - cumsum[:, :-window]
+    result = sums / window
+    result[:, :window - 1] = np.nan
+    return result
+
+
+def _ewm_mean(values: np.ndarray, span: int) -> np.ndarray:
+    """pandas ewm(span=span, adjust=True).mean()과 같은 지수이동평균 (시간축 순회, 종목축 벡터화)"""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    result = np.empty_like(values)
+    numerator = np.zeros(values.shape[0])
+    denominator = np.zeros(values.shape[0])
+    for t in range(values.shape[1]):
+        numerator = values[:, t] + decay * numerator
+        denominator = 1.0 + decay * denominator
+        result[:, t] = numerator / denominator
+    return result
+
+
+def compute_indicator_panel(closes: np.ndarray) -> Dict[str, np.ndarray]:
+    """(종목 × 날짜) 종가 패널에서 지표 패널 계산
+
+    반환 dict의 키는 calculate_technical_indicators가 만드는 컬럼명과 같다.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.ndim != 2:
+        raise ValueError("closes는 (종목 × 날짜) 2차원 배열이어야 합니다")
+    if closes.shape[1] == 0:
+        return {name: closes.copy() for name in INDICATOR_NAMES}
+
+    compacted, order, counts = _compact(closes)
+
+    # 변화량 / 변화율
+    change = np.full_like(compacted, np.nan)
+    change[:, 1:] = compacted[:, 1:] - compacted[:, :-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_percent = np.full_like(compacted, np.nan)
+        change_percent[:, 1:] = change[:, 1:] / compacted[:, :-1] * 100
+
+    # RSI: 첫 변화량(NaN)은 상승/하락 모두 0으로 취급 (pandas where 동작과 동일)
+    delta = np.nan_to_num(change, nan=0.0)
+    gain = _rolling_mean(np.where(delta > 0, delta, 0.0), RSI_PERIOD)
+    loss = _rolling_mean(np.where(delta < 0, -delta, 0.0), RSI_PERIOD)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = gain / loss
+        rsi = 100 - (100 / (1 + rs))
+
+    # MACD
+    macd = _ewm_mean(compacted, MACD_FAST) - _ewm_mean(compacted, MACD_SLOW)
+    macd_signal = _ewm_mean(macd, MACD_SIGNAL)
+
+    panel = {
+        'rsi': rsi,
+        'macd': macd,
+        'macd_signal': macd_signal,
+        'macd_histogram': macd - macd_signal,
+        'change_amount': change,
+        'change_percent': change_percent,
+    }
+    for window in SMA_WINDOWS:
+        panel[f'sma_{window}'] = _rolling_mean(compacted, window)
+
+    return {name: _expand(panel[name], order, counts) for name in INDICATOR_NAMES}
+
+
+def frames_to_panel(
+    frames: Mapping[Hashable, pd.DataFrame],
+    column: str = 'Close'
+) -> Tuple[List[Hashable], pd.DatetimeIndex, np.ndarray]:
+    """종목별 일봉 DataFrame(Date 인덱스)을 (종목 × 날짜) 패널로 변환"""
+    keys = list(frames)
+    if not keys:
+        return keys, pd.DatetimeIndex([]), np.empty((0, 0))
+
+    wide = pd.concat({key: frames[key][column] for key in keys}, axis=1).sort_index()
+    return keys, pd.DatetimeIndex(wide.index), wide.to_numpy(dtype=np.float64).T
+
+
+def panel_to_frames(
+    keys: List[Hashable],
+    dates: pd.DatetimeIndex,
+    panel: Mapping[str, np.ndarray],
+    closes: np.ndarray
+) -> Dict[Hashable, pd.DataFrame]:
+    """지표 패널을 종목별 DataFrame(Date 인덱스, 지표 컬럼)으로 분리 (종가가 있는 날짜만)"""
+    frames = {}
+    for i, key in enumerate(keys):
+        valid = ~np.isnan(closes[i])
+        frames[key] = pd.DataFrame(
+            {name: values[i, valid] for name, values in panel.items()},
+            index=dates[valid]
+        )
+    return frames
@@ -0,0 +1,217 @@
+"""
+지표 레지스트리 - 지표별 입력 컬럼과 계산 함수를 등록하고 공통 중간값을 종목당 한 번만 계산
+
+- 지표는 register_indicator로 이름, 입력 컬럼(Open/High/Low/Close/Volume), 출력 컬럼을 선언한다
+- 변화량, 이동평균/표준편차, 이동 최고/최저, True Range, EMA 같은 중간값은
+  IndicatorContext가 캐시하므로 여러 지표가 같은 값을 써도 한 번만 계산된다
+- technical_indicators 테이블에 전용 컬럼이 없는 지표(long_format=True)는
+  indicator_values 테이블에 (종목, 날짜, 이름, 값) 행으로 저장되므로 지표를 추가해도 스키마 변경이 없다
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.indicators.engine import MACD_FAST, MACD_SIGNAL, MACD_SLOW, RSI_PERIOD
+
+BOLLINGER_WINDOW = 20
+BOLLINGER_WIDTH = 2.0
+ATR_PERIOD = 14
+STOCHASTIC_PERIOD = 14
+STOCHASTIC_SMOOTHING = 3
+OBV_WINDOW = 20
+VOLUME_SMA_WINDOW = 20
+
+
+class IndicatorContext:
+    """종목 하나의 일봉과 계산된 중간값 캐시"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._cache: Dict[Tuple, pd.Series] = {}
+
+    def has(self, columns: Iterable[str]) -> bool:
+        return all(column in self.df.columns for column in columns)
+
+    def shared(self, key: Tuple, factory: Callable[[], pd.Series]) -> pd.Series:
+        """key로 캐시된 중간값 (없으면 factory로 계산)"""
+        if key not in self._cache:
+            self._cache[key] = factory()
+        return self._cache[key]
+
+    def diff(self, column: str = 'Close') -> pd.Series:
+        return self.shared(('diff', column), lambda: self.df[column].diff())
+
+    def rolling_mean(self, column: str, window: int) -> pd.Series:
+        return self.shared(('mean', column, window), lambda: self.df[column].rolling(window=window).mean())
+
+    def rolling_std(self, column: str, window: int) -> pd.Series:
+        return self.shared(('std', column, window), lambda: self.df[column].rolling(window=window).std(ddof=0))
+
+    def rolling_max(self, column: str, window: int) -> pd.Series:
+        return self.shared(('max', column, window), lambda: self.df[column].rolling(window=window).max())
+
+    def rolling_min(self, column: str, window: int) -> pd.Series:
+        return self.shared(('min', column, window), lambda: self.df[column].rolling(window=window).min())
+
+    def ewm_mean(self, column: str, span: int) -> pd.Series:
+        return self.shared(('ewm', column, span), lambda: self.df[column].ewm(span=span).mean())
+
+    def true_range(self) -> pd.Series:
+        def compute() -> pd.Series:
+            previous_close = self.df['Close'].shift(1)
+            ranges = pd.concat([
+                self.df['High'] - self.df['Low'],
+                (self.df['High'] - previous_close).abs(),
+                (self.df['Low'] - previous_close).abs(),
+            ], axis=1)
+            return ranges.max(axis=1, skipna=True)
+        return self.shared(('true_range',), compute)
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """등록된 지표 정의"""
+    name: str
+    inputs: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    compute: Callable[[IndicatorContext], Dict[str, pd.Series]]
+    long_format: bool = True  # technical_indicators 전용 컬럼이 없으면 indicator_values에 저장
+
+
+INDICATORS: Dict[str, Indicator] = {}
+
+
+def register_indicator(name: str, inputs: Iterable[str], outputs: Iterable[str], long_format: bool = True):
+    """지표 계산 함수 등록 데코레이터"""
+    def decorator(func: Callable[[IndicatorContext], Dict[str, pd.Series]]):
+        if name in INDICATORS:
+            raise ValueError(f"이미 등록된 지표입니다: {name}")
+        INDICATORS[name] = Indicator(name, tuple(inputs), tuple(outputs), func, long_format)
+        return func
+    return decorator
+
+
+def long_format_indicators() -> List[str]:
+    """indicator_values에 저장되는 지표 이름 목록"""
+    return [name for name, indicator in INDICATORS.items() if indicator.long_format]
+
+
+def long_format_outputs() -> List[str]:
+    """indicator_values에 저장되는 출력 컬럼 목록"""
+    return [output for name in long_format_indicators() for output in INDICATORS[name].outputs]
+
+
+def compute_indicators(df: pd.DataFrame, names: Optional[Iterable[str]] = None) -> Dict[str, pd.Series]:
+    """등록된 지표를 한 컨텍스트에서 계산 (입력 컬럼이 없는 지표는 건너뜀)"""
+    context = IndicatorContext(df)
+    selected = INDICATORS.values() if names is None else [INDICATORS[name] for name in names]
+
+    results: Dict[str, pd.Series] = {}
+    for indicator in selected:
+        if not context.has(indicator.inputs):
+            continue
+        results.update(indicator.compute(context))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 기간을 지정할 수 있는 지표 계산 (등록 지표와 사용자 지정 기간 조회가 함께 사용)
+# ---------------------------------------------------------------------------
+
+def rsi_series(ctx: IndicatorContext, period: int) -> pd.Series:
+    """RSI (상승/하락폭의 period일 단순이동평균 기반)"""
+    delta = ctx.diff('Close')
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rs = gain / loss
+    return 100 - (100 / (1 + rs))
+
+
+def macd_series(ctx: IndicatorContext, fast: int, slow: int, signal: int) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """(MACD, 신호선, 히스토그램)"""
+    macd = ctx.ewm_mean('Close', fast) - ctx.ewm_mean('Close', slow)
+    macd_signal = macd.ewm(span=signal).mean()
+    return macd, macd_signal, macd - macd_signal
+
+
+# ---------------------------------------------------------------------------
+# 기본 지표 (technical_indicators / stock_prices 전용 컬럼)
+# ---------------------------------------------------------------------------
+
+@register_indicator('rsi', inputs=('Close',), outputs=('rsi',), long_format=False)
+def _rsi(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    return {'rsi': rsi_series(ctx, RSI_PERIOD)}
+
+
+@register_indicator('macd', inputs=('Close',), outputs=('macd', 'macd_signal', 'macd_histogram'), long_format=False)
+def _macd(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    macd, signal, histogram = macd_series(ctx, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
+    return {'macd': macd, 'macd_signal': signal, 'macd_histogram': histogram}
+
+
+@register_indicator('sma', inputs=('Close',), outputs=('sma_20', 'sma_60'), long_format=False)
+def _sma(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    return {'sma_20': ctx.rolling_mean('Close', 20), 'sma_60': ctx.rolling_mean('Close', 60)}
+
+
+@register_indicator('change', inputs=('Close',), outputs=('change_amount', 'change_percent'), long_format=False)
+def _change(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    return {
+        'change_amount': ctx.diff('Close'),
+        'change_percent': ctx.df['Close'].pct_change() * 100,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 확장 지표 (indicator_values 행 저장)
+# 모두 유한한 기간만 참조하므로 며칠치 이력만으로도 전체 재계산과 같은 값이 나온다
+# ---------------------------------------------------------------------------
+
+@register_indicator('bollinger', inputs=('Close',), outputs=('bb_upper', 'bb_lower'))
+def _bollinger(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    """볼린저 밴드 (20일, 2σ) - 중심선은 sma_20과 같다"""
+    middle = ctx.rolling_mean('Close', BOLLINGER_WINDOW)
+    width = BOLLINGER_WIDTH * ctx.rolling_std('Close', BOLLINGER_WINDOW)
+    return {'bb_upper': middle + width, 'bb_lower': middle - width}
+
+
+@register_indicator('atr', inputs=('High', 'Low', 'Close'), outputs=('atr_14',))
+def _atr(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    """ATR (True Range의 14일 단순이동평균)"""
+    atr = ctx.shared(('mean', 'true_range', ATR_PERIOD), lambda: ctx.true_range().rolling(window=ATR_PERIOD).mean())
+    return {'atr_14': atr}
+
+
+@register_indicator('stochastic', inputs=('High', 'Low', 'Close'), outputs=('stoch_k', 'stoch_d'))
+def _stochastic(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    """스토캐스틱 %K(14), %D(%K의 3일 평균)"""
+    highest = ctx.rolling_max('High', STOCHASTIC_PERIOD)
+    lowest = ctx.rolling_min('Low', STOCHASTIC_PERIOD)
+    span = (highest - lowest).replace(0, np.nan)
+    stoch_k = (ctx.df['Close'] - lowest) / span * 100
+    return {'stoch_k': stoch_k, 'stoch_d': stoch_k.rolling(window=STOCHASTIC_SMOOTHING).mean()}
+
+
+@register_indicator('obv', inputs=('Close', 'Volume'), outputs=('obv_20',))
+def _obv(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    """OBV 20일 합 (상승일 +거래량, 하락일 -거래량)
+
+    누적 OBV는 계산 시작일에 따라 값이 달라지므로 최근 20일 합으로 저장한다.
+    """
+    signed = np.sign(ctx.diff('Close')) * ctx.df['Volume']
+    return {'obv_20': signed.rolling(window=OBV_WINDOW).sum()}
+
+
+@register_indicator('volume_sma', inputs=('Volume',), outputs=('volume_sma_20',))
+def _volume_sma(ctx: IndicatorContext) -> Dict[str, pd.Series]:
+    """거래량 20일 이동평균"""
+    return {'volume_sma_20': ctx.rolling_mean('Volume', VOLUME_SMA_WINDOW)}
+
+
+# 확장 지표 계산에 필요한 최소 거래일 수 (스냅샷 모드의 이력 조회 기간 산정용)
+# 확장 지표를 추가하면 그 지표의 참조 기간도 반영해야 한다
+LONG_FORMAT_LOOKBACK = max(
+    BOLLINGER_WINDOW, ATR_PERIOD + 1, STOCHASTIC_PERIOD + STOCHASTIC_SMOOTHING - 1, OBV_WINDOW + 1, VOLUME_SMA_WINDOW
+)
@@ -0,0 +1,187 @@
+"""
+스트리밍 지표 상태 - 저장된 상태에 당일 종가 하나만 반영해 지표를 O(1)로 갱신
+
+EMA(MACD)와 이동평균/RSI의 누적합은 직전 상태와 새 종가만으로 다음 값을 구할 수 있으므로
+매일 200일 이력을 다시 계산하지 않고 종목별 상태를 저장해 두고 한 봉씩 전진시킨다.
+
+정의는 engine.py / calculate_technical_indicators와 같다.
+- EMA: pandas ewm(span, adjust=True). 가중치 합(1 + d + d² + ...)은 누적 봉 수로 복원
+- RSI: 상승/하락폭 14일 단순이동평균 (첫 봉의 변화량은 0으로 취급)
+- SMA20/60: 최근 종가 누적합
+
+허용 오차: 같은 종가 이력 전체를 다시 계산한 결과와 상대 오차 1e-9 이내.
+KRX 종가는 원 단위 정수라 누적합은 정확히 일치하고, EMA는 계산 순서 차이로
+1e-12 수준의 차이만 생긴다. 소수 가격의 누적합 반올림 오차가 쌓이지 않도록
+STATE_WINDOW 봉마다 보관 중인 최근 종가로 누적합을 다시 계산한다.
+"""
+import json
+import math
+from dataclasses import dataclass, field, replace
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.indicators.engine import MACD_FAST, MACD_SIGNAL, MACD_SLOW, RSI_PERIOD, SMA_WINDOWS
+from app.models import IndicatorState
+
+# 보관할 최근 종가 수 (가장 긴 이동평균 기준, RSI는 RSI_PERIOD + 1개면 충분)
+STATE_WINDOW = max(max(SMA_WINDOWS), RSI_PERIOD + 1)
+
+STREAMING_TOLERANCE = 1e-9
+
+
+@dataclass
+class StreamingState:
+    """종목별 지표 상태 (last_date 봉까지 반영)"""
+    last_date: Optional[date] = None
+    bar_count: int = 0
+    ema_fast: float = 0.0
+    ema_slow: float = 0.0
+    ema_signal: float = 0.0
+    gain_sum: float = 0.0  # 최근 RSI_PERIOD개 상승폭 합
+    loss_sum: float = 0.0  # 최근 RSI_PERIOD개 하락폭 합
+    close_sums: Dict[int, float] = field(default_factory=lambda: {window: 0.0 for window in SMA_WINDOWS})
+    closes: List[float] = field(default_factory=list)  # 최근 STATE_WINDOW개 종가
+
+
+def _ema_step(previous: float, value: float, span: int, count: int) -> float:
+    """adjust=True EMA를 한 봉 전진 (count: 이전까지 반영한 봉 수)"""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    # 이전 가중치 합 = 1 + d + ... + d^(count-1)
+    weight = (1.0 - decay ** count) / (1.0 - decay)
+    return (value + decay * previous * weight) / (1.0 + decay * weight)
+
+
+def _delta_at(closes: List[float], offset: int) -> Optional[float]:
+    """closes[-offset] 봉의 전일 대비 변화량 (첫 봉은 0, 범위 밖이면 None)"""
+    if len(closes) < offset:
+        return None
+    if len(closes) == offset:
+        return 0.0
+    return closes[-offset] - closes[-offset - 1]
+
+
+def _resync(state: StreamingState) -> None:
+    """보관 중인 최근 종가로 누적합을 다시 계산 (반올림 오차 제거)"""
+    closes = state.closes
+    for window in SMA_WINDOWS:
+        state.close_sums[window] = math.fsum(closes[-window:]) if len(closes) >= window else math.fsum(closes)
+
+    deltas = [_delta_at(closes, offset) for offset in range(1, min(RSI_PERIOD, len(closes)) + 1)]
+    state.gain_sum = math.fsum(d for d in deltas if d > 0)
+    state.loss_sum = math.fsum(-d for d in deltas if d < 0)
+
+
+def _rsi(gain_sum: float, loss_sum: float) -> float:
+    """pandas 계산과 같은 0 나눗셈 처리 (하락 없음 → 100, 변화 없음 → NaN)"""
+    if loss_sum == 0:
+        return math.nan if gain_sum == 0 else 100.0
+    return 100.0 - 100.0 / (1.0 + gain_sum / loss_sum)
+
+
+def advance(state: StreamingState, close: float, bar_date: Optional[date] = None) -> Tuple[StreamingState, Dict[str, float]]:
+    """새 종가 하나를 반영한 상태와 그 봉의 지표값 반환 (원래 상태는 변경하지 않음)"""
+    close = float(close)
+    new = replace(state, close_sums=dict(state.close_sums), closes=list(state.closes))
+    count = state.bar_count
+    previous_close = state.closes[-1] if state.closes else None
+
+    # 변화량 / 변화율
+    change = close - previous_close if previous_close is not None else math.nan
+    if previous_close is None:
+        change_percent = math.nan
+    elif previous_close == 0:
+        change_percent = math.nan if change == 0 else math.copysign(math.inf, change)
+    else:
+        change_percent = change / previous_close * 100
+
+    # EMA / MACD
+    new.ema_fast = _ema_step(state.ema_fast, close, MACD_FAST, count)
+    new.ema_slow = _ema_step(state.ema_slow, close, MACD_SLOW, count)
+    macd = new.ema_fast - new.ema_slow
+    new.ema_signal = _ema_step(state.ema_signal, macd, MACD_SIGNAL, count)
+
+    # RSI: 새 변화량을 더하고 창에서 빠지는 변화량을 뺌
+    delta = 0.0 if math.isnan(change) else change
+    dropped = _delta_at(state.closes, RSI_PERIOD)
+    new.gain_sum += max(delta, 0.0) - (max(dropped, 0.0) if dropped is not None else 0.0)
+    new.loss_sum += max(-delta, 0.0) - (max(-dropped, 0.0) if dropped is not None else 0.0)
+
+    # 이동평균 누적합
+    for window in SMA_WINDOWS:
+        leaving = state.closes[-window] if len(state.closes) >= window else 0.0
+        new.close_sums[window] += close - leaving
+
+    new.closes.append(close)
+    del new.closes[:-STATE_WINDOW]
+    new.bar_count = count + 1
+    new.last_date = bar_date
+    if new.bar_count % STATE_WINDOW == 0:
+        _resync(new)
+
+    values = {
+        'rsi': _rsi(new.gain_sum, new.loss_sum) if new.bar_count >= RSI_PERIOD else math.nan,
+        'macd': macd,
+        'macd_signal': new.ema_signal,
+        'macd_histogram': macd - new.ema_signal,
+        'change_amount': change,
+        'change_percent': change_percent,
+    }
+    for window in SMA_WINDOWS:
+        values[f'sma_{window}'] = new.close_sums[window] / window if new.bar_count >= window else math.nan
+
+    return new, values
+
+
+def seed_state(closes: Iterable[float], last_date: Optional[date] = None) -> StreamingState:
+    """종가 이력 전체로 초기 상태 생성 (이력 첫 봉부터 전진)"""
+    state = StreamingState()
+    for close in closes:
+        if close is None or math.isnan(close):
+            continue
+        state, _ = advance(state, close)
+    state.last_date = last_date
+    return state
+
+
+def state_record(state: StreamingState, stock_id: int) -> Dict[str, Any]:
+    """IndicatorState insert용 레코드"""
+    return {
+        'stock_id': stock_id,
+        'last_date': state.last_date,
+        'bar_count': state.bar_count,
+        'ema_fast': state.ema_fast,
+        'ema_slow': state.ema_slow,
+        'ema_signal': state.ema_signal,
+        'gain_sum': state.gain_sum,
+        'loss_sum': state.loss_sum,
+        'sum_20': state.close_sums[20],
+        'sum_60': state.close_sums[60],
+        'closes': json.dumps(state.closes),
+    }
+
+
+def state_from_record(row: Any) -> StreamingState:
+    """IndicatorState 행(모델 또는 매핑)에서 상태 복원"""
+    get = row.get if isinstance(row, dict) else lambda key: getattr(row, key)
+    return StreamingState(
+        last_date=get('last_date'),
+        bar_count=get('bar_count'),
+        ema_fast=get('ema_fast'),
+        ema_slow=get('ema_slow'),
+        ema_signal=get('ema_signal'),
+        gain_sum=get('gain_sum'),
+        loss_sum=get('loss_sum'),
+        close_sums={20: get('sum_20'), 60: get('sum_60')},
+        closes=json.loads(get('closes')),
+    )
+
+
+def load_states(db: Session, stock_ids: Iterable[int]) -> Dict[int, StreamingState]:
+    """종목 ID별 저장된 지표 상태 조회"""
+    stock_ids = list(stock_ids)
+    if not stock_ids:
+        return {}
+    rows = db.query(IndicatorState).filter(IndicatorState.stock_id.in_(stock_ids)).all()
+    return {row.stock_id: state_from_record(row) for row in rows}
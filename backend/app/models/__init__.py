@@ -5,8 +5,18 @@ from app.models.stock import (
     TechnicalIndicator,
     BuySignal,
     MarketIndex,
+    MarketHoliday,
     MarketSummary
 )
+from app.models.collection import (
+    CollectionRun,
+    CollectionRunItem,
+    StockChange
+)
+from app.models.indicator import (
+    IndicatorState,
+    IndicatorValue
+)
 
 __all__ = [
     "Stock",
@@ -14,5 +24,11 @@ __all__ = [
     "TechnicalIndicator",
     "BuySignal",
     "MarketIndex",
-    "MarketSummary"
-]
\ No newline at end of file
+    "MarketHoliday",
+    "MarketSummary",
+    "CollectionRun",
+    "CollectionRunItem",
+    "StockChange",
+    "IndicatorState",
+    "IndicatorValue"
+]
@@ -0,0 +1,75 @@
+"""
+데이터 수집 실행 기록 모델 - 중단된 수집 재개용, 종목별 데이터 변경 기록
+"""
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, Index, ForeignKey
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class CollectionRun(Base):
+    """거래일별 수집 실행 기록"""
+    __tablename__ = "collection_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    trade_date = Column(Date, nullable=False)
+    shard = Column(String(20), nullable=False, default='all')  # 'all' 또는 'i/N'
+
+    # 상태: running, completed, partial
+    status = Column(String(20), nullable=False, default='running')
+    total_symbols = Column(Integer, nullable=False, default=0)
+    completed_symbols = Column(Integer, nullable=False, default=0)
+    failed_symbols = Column(Integer, nullable=False, default=0)
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    # 관계 설정
+    items = relationship("CollectionRunItem", back_populates="run")
+
+    __table_args__ = (
+        Index('uk_collection_run_date_shard', 'trade_date', 'shard', unique=True),
+    )
+
+
+class CollectionRunItem(Base):
+    """수집 실행의 종목별 진행 상태"""
+    __tablename__ = "collection_run_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(Integer, ForeignKey('collection_runs.id'), nullable=False)
+    symbol = Column(String(10), nullable=False)
+
+    # 상태: pending, done, failed
+    status = Column(String(20), nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # 관계 설정
+    run = relationship("CollectionRun", back_populates="items")
+
+    __table_args__ = (
+        Index('idx_collection_run_items_status', 'run_id', 'status'),
+        Index('uk_collection_run_item_symbol', 'run_id', 'symbol', unique=True),
+    )
+
+
+class StockChange(Base):
+    """종목별 마지막 데이터 변경 (수집이 실제로 값을 바꾼 거래일 범위와 시각)
+
+    API 캐시 키에 changed_at을 넣어 수집 프로세스의 변경을 API 프로세스가 알 수 있게 한다.
+    """
+    __tablename__ = "stock_changes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, unique=True)
+    first_date = Column(Date, nullable=False)
+    last_date = Column(Date, nullable=False)
+    changed_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index('idx_stock_changes_changed_at', 'changed_at'),
+    )
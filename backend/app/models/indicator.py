@@ -0,0 +1,49 @@
+"""
+지표 모델 - 스트리밍 지표 갱신용 종목별 상태, 확장 지표 값(long format)
+"""
+from sqlalchemy import Column, Integer, String, Date, DateTime, Float, Text, Index, ForeignKey
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class IndicatorState(Base):
+    """종목별 지표 계산 상태 (last_date 봉까지 반영)"""
+    __tablename__ = "indicator_states"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, unique=True)
+    last_date = Column(Date, nullable=False)
+    bar_count = Column(Integer, nullable=False, default=0)  # 상태에 반영된 봉 수 (EMA 가중치 복원용)
+
+    # MACD용 지수이동평균
+    ema_fast = Column(Float, nullable=False)
+    ema_slow = Column(Float, nullable=False)
+    ema_signal = Column(Float, nullable=False)
+
+    # RSI용 최근 14일 상승/하락폭 합
+    gain_sum = Column(Float, nullable=False)
+    loss_sum = Column(Float, nullable=False)
+
+    # 이동평균용 최근 종가 합과 종가 창 (JSON 배열, 최근 60개)
+    sum_20 = Column(Float, nullable=False)
+    sum_60 = Column(Float, nullable=False)
+    closes = Column(Text, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class IndicatorValue(Base):
+    """확장 지표 값 - 지표 하나당 한 행이라 새 지표를 추가해도 스키마 변경이 필요 없음"""
+    __tablename__ = "indicator_values"
+
+    id = Column(Integer, primary_key=True, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False)
+    date = Column(Date, nullable=False)
+    name = Column(String(30), nullable=False)  # 지표 출력명 (예: bb_upper, atr_14)
+    value = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index('idx_indicator_values_date_name', 'date', 'name'),
+        Index('uk_indicator_value_stock_date_name', 'stock_id', 'date', 'name', unique=True),
+    )
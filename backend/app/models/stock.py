@@ -175,6 +175,17 @@ class MarketIndex(Base):
     )
 
 
+class MarketHoliday(Base):
+    """KRX 휴장일 (주말 외 휴장: 공휴일, 대체공휴일, 연말 휴장 등)"""
+    __tablename__ = "market_holidays"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    date = Column(Date, nullable=False, unique=True, index=True)
+    name = Column(String(50), nullable=True)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class MarketSummary(Base):
     """시장 요약 정보 - 일별 통계 (레거시 호환)"""
     __tablename__ = "market_summary"
@@ -2,7 +2,7 @@
 시장 관련 스키마
 """
 from typing import List, Dict, Optional
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseResponse
@@ -50,6 +50,15 @@ class MarketStats(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class TradingDay(BaseModel):
+    """거래일 정보 (KRX 거래일 달력 기준)"""
+    today: date = Field(..., description="오늘")
+    is_trading_day: bool = Field(..., description="오늘 거래일 여부")
+    latest_trading_day: Optional[date] = Field(None, description="오늘과 같거나 이전인 최근 거래일")
+    previous_trading_day: Optional[date] = Field(None, description="직전 거래일")
+    next_trading_day: Optional[date] = Field(None, description="다음 거래일")
+
+
 class MarketStatsResponse(BaseResponse[MarketStats]):
     """시장 통계 응답"""
     pass
@@ -61,6 +70,8 @@ class DataHealth(BaseModel):
     active_stocks: int = Field(..., description="활성 종목 수")
     last_data_update: datetime = Field(..., description="마지막 데이터 업데이트")
     data_freshness_hours: float = Field(..., description="데이터 신선도 (시간)")
+    latest_trading_day: Optional[date] = Field(None, description="최근 거래일")
+    missed_trading_days: int = Field(0, description="마지막 업데이트 이후 지나간 거래일 수 (오늘 제외)")
     
     # 데이터 품질 지표
     missing_price_count: int = Field(..., description="가격 정보 누락 종목 수")
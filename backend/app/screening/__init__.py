@@ -0,0 +1 @@
+# 스크리닝 엔진 패키지
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""
+벡터화 백테스트 - 저장 기간 전체에서 전략 진입 시점을 찾아 보유 기간별 성과 집계
+
+- 진입: load_snapshot_panel()의 (종목, 거래일) 행에 전략 evaluate()를 한 번 적용
+- 종가 패널(거래일 × 종목)에서 h거래일 뒤 종가와 구간 최저가를 인덱스 조회로 한 번에 구함
+- 신호 강도 구간별(50점 미만 / 50-79 / 80점 이상) 통계를 함께 내 점수 기준의 효과를 비교
+- 결과는 (전략, 기간, 마지막 지표 거래일, 데이터 변경 시각) 키로 LRU 캐시에 보관
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.collector.dirty import data_version
+from app.core.config import settings
+from app.models import TechnicalIndicator
+from app.screening.engine import ScreeningSnapshot, load_snapshot_panel
+from app.screening.strategies import STRATEGIES, Strategy
+
+HORIZONS = (5, 20, 60)  # 보유 거래일 수
+STRENGTH_BUCKETS = ((0, 50), (50, 80), (80, 101))  # [하한, 상한) 신호 강도 구간
+
+backtest_cache = LRUCache(settings.BACKTEST_CACHE_SIZE)
+
+
+def close_panel(snapshot: ScreeningSnapshot) -> pd.DataFrame:
+    """기간 스냅샷의 종가를 (거래일 × 종목) 패널로 변환"""
+    frame = pd.DataFrame({'date': snapshot.dates, 'stock_id': snapshot.stock_ids, 'close': snapshot.close})
+    return frame.pivot(index='date', columns='stock_id', values='close').sort_index()
+
+
+def forward_outcomes(closes: pd.DataFrame, horizon: int) -> Tuple[np.ndarray, np.ndarray]:
+    """각 (거래일, 종목)에서 horizon거래일 보유 시 수익률과 보유 구간 최대 낙폭 패널
+
+    낙폭은 다음 거래일부터 horizon거래일 뒤까지의 최저 종가 기준 (수익이면 0).
+    뒤따르는 거래일이 부족하면 NaN.
+    """
+    future = closes.shift(-horizon)
+    # 역순 rolling으로 [t+1, t+horizon] 최저가
+    lowest = closes[::-1].rolling(horizon, min_periods=horizon).min()[::-1].shift(-1)
+    base = closes.to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = future.to_numpy() / base - 1.0
+        drawdowns = np.minimum(lowest.to_numpy() / base - 1.0, 0.0)
+    return returns, drawdowns
+
+
+def _summary(returns: np.ndarray, drawdowns: np.ndarray) -> Dict[str, Any]:
+    valid = np.isfinite(returns)
+    returns = returns[valid]
+    drawdowns = drawdowns[valid]
+    if not len(returns):
+        return {"trades": 0, "mean_return": None, "median_return": None, "hit_rate": None,
+                "avg_drawdown": None, "max_drawdown": None}
+    return {
+        "trades": int(len(returns)),
+        "mean_return": round(float(returns.mean()) * 100, 2),
+        "median_return": round(float(np.median(returns)) * 100, 2),
+        "hit_rate": round(float((returns > 0).mean()) * 100, 1),
+        "avg_drawdown": round(float(drawdowns.mean()) * 100, 2),
+        "max_drawdown": round(float(drawdowns.min()) * 100, 2),
+    }
+
+
+def backtest_strategy(
+    snapshot: ScreeningSnapshot,
+    strategy: Strategy,
+    horizons: Sequence[int] = HORIZONS,
+    closes: Optional[pd.DataFrame] = None
+) -> Dict[str, Any]:
+    """기간 스냅샷 전체에서 전략 진입의 보유 기간별 성과 (수익률/낙폭 단위: %)
+
+    진입 조건은 run_strategies()와 같되 신호 강도 하한과 거래일별 개수 제한은 두지 않는다.
+    """
+    if closes is None:
+        closes = close_panel(snapshot)
+
+    result = strategy.evaluate(snapshot)
+    usable = np.isfinite(snapshot.rsi) & np.isfinite(snapshot.macd) & np.isfinite(snapshot.macd_signal)
+    entries = np.flatnonzero(result.mask & usable)
+    strength = np.asarray(result.strength, dtype=np.float64)[entries]
+
+    rows = closes.index.get_indexer(snapshot.dates[entries])
+    cols = closes.columns.get_indexer(snapshot.stock_ids[entries])
+
+    report = {
+        "strategy": strategy.signal_type,
+        "label": strategy.label,
+        "entries": int(len(entries)),
+        "horizons": {},
+    }
+    for horizon in horizons:
+        returns, drawdowns = forward_outcomes(closes, horizon)
+        entry_returns = returns[rows, cols]
+        entry_drawdowns = drawdowns[rows, cols]
+
+        buckets = []
+        for low, high in STRENGTH_BUCKETS:
+            in_bucket = (strength >= low) & (strength < high)
+            buckets.append({
+                "min_strength": low,
+                "max_strength": min(high - 1, 100),
+                **_summary(entry_returns[in_bucket], entry_drawdowns[in_bucket]),
+            })
+        report["horizons"][horizon] = {
+            **_summary(entry_returns, entry_drawdowns),
+            "by_strength": buckets,
+        }
+    return report
+
+
+def run_backtest(
+    db: Session,
+    strategy_names: Optional[Sequence[str]] = None,
+    days: int = settings.DATA_RETENTION_DAYS
+) -> Dict[str, Any]:
+    """저장된 최근 days일 지표로 전략별 백테스트 (알 수 없는 전략은 ValueError)"""
+    names = list(STRATEGIES) if not strategy_names else list(strategy_names)
+    unknown = [name for name in names if name not in STRATEGIES]
+    if unknown:
+        raise ValueError(f"알 수 없는 전략입니다: {', '.join(unknown)} (지원: {', '.join(STRATEGIES)})")
+
+    until: Optional[date] = db.query(func.max(TechnicalIndicator.date)).scalar()
+    if until is None:
+        return {"since": None, "until": None, "strategies": []}
+    since = until - timedelta(days=days)
+
+    def compute() -> Dict[str, Any]:
+        snapshot = load_snapshot_panel(db, since, until)
+        closes = close_panel(snapshot)
+        return {
+            "since": since,
+            "until": until,
+            "strategies": [backtest_strategy(snapshot, STRATEGIES[name], closes=closes) for name in names],
+        }
+
+    # 새 거래일이 저장되면 until이, 과거 행이 정정되면 데이터 변경 시각이 바뀌어 새 키로 계산
+    key = (tuple(names), days, until, data_version(db))
+    return backtest_cache.get_or_compute(key, compute)
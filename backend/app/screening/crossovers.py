@@ -0,0 +1,169 @@
+"""
+교차 이벤트 탐지 - (거래일 × 종목) 지표 패널에서 직전 거래일과 비교해 실제 교차 시점만 찾음
+
+`macd > macd_signal` 같은 상태 조건은 신호선 위에 머무는 동안 계속 참이지만,
+교차 이벤트는 전일 (fast <= slow) 이고 당일 (fast > slow) 인 거래일에만 발생한다.
+전 종목을 배열 한 번의 비교로 처리한다.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.orm import Session
+
+from app.models import Stock, TechnicalIndicator
+
+RSI_OVERSOLD_LEVEL = 30
+CROSS_LOOKBACK_DAYS = 20  # 이벤트 탐색 최대 거래일 수
+PANEL_COLUMNS = ('rsi', 'macd', 'macd_signal', 'sma_20', 'sma_60')
+
+
+@dataclass(frozen=True)
+class CrossEvent:
+    """fast가 slow(지표 컬럼 또는 고정값)를 upward면 아래→위, 아니면 위→아래로 교차"""
+    name: str
+    label: str
+    fast: str
+    slow: Union[str, float]
+    upward: bool = True
+
+
+CROSS_EVENTS: Dict[str, CrossEvent] = {
+    event.name: event
+    for event in (
+        CrossEvent('macd_golden_cross', "MACD 골든크로스", 'macd', 'macd_signal'),
+        CrossEvent('macd_dead_cross', "MACD 데드크로스", 'macd', 'macd_signal', upward=False),
+        CrossEvent('sma_golden_cross', "SMA20/60 골든크로스", 'sma_20', 'sma_60'),
+        CrossEvent('sma_dead_cross', "SMA20/60 데드크로스", 'sma_20', 'sma_60', upward=False),
+        CrossEvent('rsi_oversold_exit', f"RSI {RSI_OVERSOLD_LEVEL} 상향 재진입", 'rsi', RSI_OVERSOLD_LEVEL),
+    )
+}
+
+
+@dataclass
+class IndicatorPanel:
+    """(거래일 × 종목) 지표 패널 (values의 각 배열 shape = (len(dates), len(stock_ids)))"""
+    dates: np.ndarray  # datetime64[D], 오름차순
+    stock_ids: np.ndarray
+    symbols: np.ndarray
+    names: np.ndarray
+    sectors: np.ndarray
+    values: Dict[str, np.ndarray]
+
+
+def panel_from_frame(frame: pd.DataFrame, columns: Iterable[str] = PANEL_COLUMNS) -> IndicatorPanel:
+    """(stock_id, date, symbol, name, sector, 지표...) 행 목록을 패널로 변환 (없는 칸은 NaN)"""
+    stocks = frame.drop_duplicates('stock_id').set_index('stock_id').sort_index()
+    values = {
+        column: frame.pivot(index='date', columns='stock_id', values=column)
+        .reindex(columns=stocks.index)
+        .sort_index()
+        for column in columns
+    }
+    first = next(iter(values.values()))
+    return IndicatorPanel(
+        dates=first.index.to_numpy(dtype='datetime64[D]'),
+        stock_ids=stocks.index.to_numpy(dtype=np.int64),
+        symbols=stocks['symbol'].to_numpy(dtype=object),
+        names=stocks['name'].to_numpy(dtype=object),
+        sectors=stocks['sector'].to_numpy(dtype=object),
+        values={column: panel.to_numpy(dtype=np.float64, na_value=np.nan) for column, panel in values.items()},
+    )
+
+
+def load_indicator_panel(
+    db: Session,
+    days: int = CROSS_LOOKBACK_DAYS,
+    until: Optional[date] = None,
+    stock_ids: Optional[Iterable[int]] = None
+) -> IndicatorPanel:
+    """until(기본값: 최신 지표일)까지 최근 days+1거래일의 활성 종목 지표 패널 (단일 쿼리)
+
+    첫 거래일은 days번째 거래일의 교차 판단에만 쓰인다. stock_ids로 종목을 제한할 수 있다.
+    """
+    dates_query = db.query(TechnicalIndicator.date).distinct()
+    if until is not None:
+        dates_query = dates_query.filter(TechnicalIndicator.date <= until)
+    since = dates_query.order_by(TechnicalIndicator.date.desc()).offset(days).limit(1).scalar()
+
+    query = (
+        db.query(
+            Stock.id,
+            Stock.symbol,
+            Stock.name,
+            Stock.sector,
+            TechnicalIndicator.date,
+            *(getattr(TechnicalIndicator, column) for column in PANEL_COLUMNS),
+        )
+        .join(TechnicalIndicator, TechnicalIndicator.stock_id == Stock.id)
+        .filter(Stock.is_active == True)
+    )
+    if since is not None:
+        query = query.filter(TechnicalIndicator.date >= since)
+    if until is not None:
+        query = query.filter(TechnicalIndicator.date <= until)
+    if stock_ids is not None:
+        query = query.filter(Stock.id.in_(list(stock_ids)))
+
+    frame = pd.DataFrame(
+        query.all(),
+        columns=['stock_id', 'symbol', 'name', 'sector', 'date', *PANEL_COLUMNS]
+    )
+    return panel_from_frame(frame)
+
+
+def cross_matrix(panel: IndicatorPanel, event: CrossEvent) -> np.ndarray:
+    """(거래일 × 종목) 교차 발생 여부 (첫 거래일과 결측 구간은 False)"""
+    fast = panel.values[event.fast]
+    slow = panel.values[event.slow] if isinstance(event.slow, str) else np.full_like(fast, event.slow)
+    if not event.upward:
+        fast, slow = slow, fast
+
+    crossed = np.zeros(fast.shape, dtype=bool)
+    with np.errstate(invalid='ignore'):
+        crossed[1:] = (fast[:-1] <= slow[:-1]) & (fast[1:] > slow[1:])
+    return crossed
+
+
+def cross_age(crossed: np.ndarray) -> np.ndarray:
+    """(거래일 × 종목) 마지막 교차 후 경과 거래일 (당일 교차 0, 교차 이력이 없으면 NaN)"""
+    steps = np.arange(crossed.shape[0])[:, None]
+    last = np.maximum.accumulate(np.where(crossed, steps, -1), axis=0)
+    return np.where(last >= 0, steps - last, np.nan)
+
+
+def detect_crossovers(
+    panel: IndicatorPanel,
+    events: Optional[Iterable[str]] = None,
+    days: int = 5
+) -> List[Dict[str, Any]]:
+    """최근 days거래일 안의 교차 이벤트 목록 (최신 거래일순, 알 수 없는 이벤트는 ValueError)"""
+    names = list(CROSS_EVENTS) if not events else list(events)
+    unknown = [name for name in names if name not in CROSS_EVENTS]
+    if unknown:
+        raise ValueError(f"알 수 없는 교차 이벤트입니다: {', '.join(unknown)} (지원: {', '.join(CROSS_EVENTS)})")
+
+    start = max(len(panel.dates) - days, 0)
+    found = []
+    for name in names:
+        event = CROSS_EVENTS[name]
+        rows, cols = np.nonzero(cross_matrix(panel, event)[start:])
+        rows += start
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            found.append({
+                'date': panel.dates[row].astype(date),
+                'symbol': panel.symbols[col],
+                'name': panel.names[col],
+                'sector': panel.sectors[col],
+                'event': name,
+                'label': event.label,
+                **{
+                    column: float(panel.values[column][row, col])
+                    for column in (event.fast, event.slow) if isinstance(column, str)
+                },
+            })
+
+    found.sort(key=lambda item: item['date'], reverse=True)
+    return found
@@ -0,0 +1,430 @@
+"""
+벡터화 스크리닝 엔진 - 최신 지표 스냅샷을 배열로 읽어 전 종목 신호 강도를 한 번에 계산
+
+scripts/run_screening.py의 calculate_signal_strength(종목별 if/elif)와
+같은 점수 구간을 np.select로 구현한다. 결측값(NaN)은 비교가 모두 거짓이 되어
+스칼라 함수와 마찬가지로 해당 항목 점수가 0이 된다.
+전략별 조건은 app/screening/strategies.py에서 이 스냅샷 배열을 공유해 평가한다.
+load_snapshot_panel()은 저장 기간 전체를 (종목, 거래일) 행으로 펼친 스냅샷을 만들어
+과거 신호 백필도 같은 전략 코드로 한 번에 평가한다. snapshot_from_frames()는 같은 계산을
+수집 단계가 메모리에 들고 있는 DataFrame에 적용한다 (scripts/run_pipeline.py).
+"""
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models import Stock, StockPrice, TechnicalIndicator
+from app.screening.crossovers import (
+    CROSS_EVENTS, CROSS_LOOKBACK_DAYS, cross_age, cross_matrix, load_indicator_panel, panel_from_frame,
+)
+
+# 거래량 비율 기준: 직전 20거래일 평균 (달력일 45일 안에서 탐색)
+VOLUME_AVERAGE_DAYS = 20
+VOLUME_LOOKBACK_DAYS = 45
+
+
+@dataclass
+class ScreeningSnapshot:
+    """거래일 하나의 전 종목 지표 (종목 순서가 같은 배열 묶음)"""
+    trade_date: date
+    stock_ids: np.ndarray
+    symbols: np.ndarray
+    names: np.ndarray
+    sectors: np.ndarray
+    prices: np.ndarray
+    rsi: np.ndarray
+    macd: np.ndarray
+    macd_signal: np.ndarray
+    volume_ratio: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    change_percent: np.ndarray
+    sma_20: np.ndarray
+    sma_60: np.ndarray
+    prev_sma_20: np.ndarray  # 직전 거래일 값 (이동평균 교차 판단용)
+    prev_sma_60: np.ndarray
+    macd_cross_age: Optional[np.ndarray] = None  # 마지막 MACD 골든크로스 후 경과 거래일 (없으면 NaN)
+    dates: Optional[np.ndarray] = None  # 행별 거래일 (datetime64[D], 기간 스냅샷에서만 사용)
+
+    def __len__(self) -> int:
+        return len(self.stock_ids)
+
+
+def _float_array(values) -> np.ndarray:
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def load_volume_ratios(
+    db: Session,
+    trade_date: date,
+    stock_ids: Optional[Iterable[int]] = None,
+    window: int = VOLUME_AVERAGE_DAYS
+) -> Dict[int, float]:
+    """종목별 당일 거래량 / 직전 window거래일 평균 거래량 (윈도 함수 단일 쿼리)
+
+    평균을 구할 이력이 없거나 평균이 0인 종목은 결과에서 빠진다.
+    """
+    ranked = select(
+        StockPrice.stock_id,
+        StockPrice.volume,
+        func.row_number().over(
+            partition_by=StockPrice.stock_id,
+            order_by=StockPrice.date.desc()
+        ).label('rank')
+    ).where(
+        StockPrice.date < trade_date,
+        StockPrice.date >= trade_date - timedelta(days=VOLUME_LOOKBACK_DAYS)
+    )
+    current = select(StockPrice.stock_id, StockPrice.volume).where(StockPrice.date == trade_date)
+    if stock_ids is not None:
+        stock_ids = list(stock_ids)
+        ranked = ranked.where(StockPrice.stock_id.in_(stock_ids))
+        current = current.where(StockPrice.stock_id.in_(stock_ids))
+
+    ranked = ranked.subquery()
+    averages = (
+        select(ranked.c.stock_id, func.avg(ranked.c.volume).label('average'))
+        .where(ranked.c.rank <= window)
+        .group_by(ranked.c.stock_id)
+        .subquery()
+    )
+    current = current.subquery()
+    rows = db.execute(
+        select(current.c.stock_id, current.c.volume, averages.c.average)
+        .join(averages, averages.c.stock_id == current.c.stock_id)
+    ).all()
+
+    return {
+        stock_id: volume / float(average)
+        for stock_id, volume, average in rows
+        if average and volume is not None
+    }
+
+
+def load_snapshot(db: Session, trade_date: date, stock_ids: Optional[Iterable[int]] = None) -> ScreeningSnapshot:
+    """활성 종목의 trade_date 지표/주가와 직전 거래일 이동평균(단일 쿼리), 거래량 비율 조회
+
+    stock_ids가 주어지면 해당 종목만 조회한다 (변경된 종목만 다시 스크리닝할 때).
+    """
+    if stock_ids is not None:
+        stock_ids = list(stock_ids)
+    previous_date = (
+        db.query(func.max(TechnicalIndicator.date))
+        .filter(TechnicalIndicator.date < trade_date)
+        .scalar()
+    )
+    previous = aliased(TechnicalIndicator)
+
+    query = (
+        db.query(
+            Stock.id,
+            Stock.symbol,
+            Stock.name,
+            Stock.sector,
+            Stock.price,
+            TechnicalIndicator.rsi,
+            TechnicalIndicator.macd,
+            TechnicalIndicator.macd_signal,
+            TechnicalIndicator.sma_20,
+            TechnicalIndicator.sma_60,
+            previous.sma_20,
+            previous.sma_60,
+            StockPrice.close,
+            StockPrice.volume,
+            StockPrice.change_percent,
+        )
+        .join(TechnicalIndicator, TechnicalIndicator.stock_id == Stock.id)
+        .outerjoin(previous, and_(previous.stock_id == Stock.id, previous.date == previous_date))
+        .outerjoin(StockPrice, and_(StockPrice.stock_id == Stock.id, StockPrice.date == trade_date))
+        .filter(TechnicalIndicator.date == trade_date, Stock.is_active == True)
+    )
+    if stock_ids is not None:
+        query = query.filter(Stock.id.in_(stock_ids))
+    rows = query.order_by(Stock.id).all()
+    columns = list(zip(*rows)) if rows else [[] for _ in range(15)]
+
+    # 거래량 비율 (평균을 구할 수 없는 종목은 기존 기본값 1.0)
+    ratios = load_volume_ratios(db, trade_date, stock_ids)
+    volume_ratio = np.array([ratios.get(stock_id, 1.0) for stock_id in columns[0]], dtype=np.float64)
+
+    # 최근 CROSS_LOOKBACK_DAYS거래일 패널에서 MACD 골든크로스 경과일
+    ids = np.array(columns[0], dtype=np.int64)
+    macd_cross_age = np.full(len(ids), np.nan)
+    panel = load_indicator_panel(db, CROSS_LOOKBACK_DAYS, trade_date, stock_ids)
+    if len(panel.dates) and panel.dates[-1] == np.datetime64(trade_date):
+        ages = cross_age(cross_matrix(panel, CROSS_EVENTS['macd_golden_cross']))[-1]
+        positions = pd.Index(panel.stock_ids).get_indexer(ids)
+        found = positions >= 0
+        macd_cross_age[found] = ages[positions[found]]
+
+    return ScreeningSnapshot(
+        trade_date=trade_date,
+        stock_ids=ids,
+        symbols=np.array(columns[1], dtype=object),
+        names=np.array(columns[2], dtype=object),
+        sectors=np.array(columns[3], dtype=object),
+        prices=_float_array(columns[4]),
+        rsi=_float_array(columns[5]),
+        macd=_float_array(columns[6]),
+        macd_signal=_float_array(columns[7]),
+        volume_ratio=volume_ratio,
+        close=_float_array(columns[12]),
+        volume=_float_array(columns[13]),
+        change_percent=_float_array(columns[14]),
+        sma_20=_float_array(columns[8]),
+        sma_60=_float_array(columns[9]),
+        prev_sma_20=_float_array(columns[10]),
+        prev_sma_60=_float_array(columns[11]),
+        macd_cross_age=macd_cross_age,
+    )
+
+
+INDICATOR_FRAME_COLUMNS = ['stock_id', 'symbol', 'name', 'sector', 'date', 'rsi', 'macd', 'macd_signal', 'sma_20', 'sma_60']
+PRICE_FRAME_COLUMNS = ['stock_id', 'date', 'close', 'volume', 'change_percent']
+
+
+def load_snapshot_panel(
+    db: Session,
+    since: date,
+    until: date,
+    window: int = VOLUME_AVERAGE_DAYS
+) -> ScreeningSnapshot:
+    """since~until 모든 거래일의 활성 종목 지표를 (종목, 거래일) 행으로 펼친 스냅샷
+
+    날짜별 쿼리 없이 지표/주가를 기간 단위로 한 번씩 읽는다 (since 이전 CROSS_LOOKBACK_DAYS거래일
+    지표와 거래량 평균용 주가 이력 포함 - 일별 load_snapshot()과 같은 이력). 계산은 panel_snapshot()을 따른다.
+    """
+    history_start = (
+        db.query(TechnicalIndicator.date)
+        .filter(TechnicalIndicator.date < since)
+        .distinct()
+        .order_by(TechnicalIndicator.date.desc())
+        .offset(CROSS_LOOKBACK_DAYS - 1)
+        .limit(1)
+        .scalar()
+    ) or db.query(func.min(TechnicalIndicator.date)).filter(TechnicalIndicator.date < since).scalar()
+    indicator_rows = (
+        db.query(
+            Stock.id,
+            Stock.symbol,
+            Stock.name,
+            Stock.sector,
+            TechnicalIndicator.date,
+            TechnicalIndicator.rsi,
+            TechnicalIndicator.macd,
+            TechnicalIndicator.macd_signal,
+            TechnicalIndicator.sma_20,
+            TechnicalIndicator.sma_60,
+        )
+        .join(TechnicalIndicator, TechnicalIndicator.stock_id == Stock.id)
+        .filter(
+            TechnicalIndicator.date >= (history_start or since),
+            TechnicalIndicator.date <= until,
+            Stock.is_active == True
+        )
+        .order_by(Stock.id, TechnicalIndicator.date)
+        .all()
+    )
+    price_rows = (
+        db.query(StockPrice.stock_id, StockPrice.date, StockPrice.close, StockPrice.volume, StockPrice.change_percent)
+        .join(Stock, Stock.id == StockPrice.stock_id)
+        .filter(
+            StockPrice.date >= since - timedelta(days=VOLUME_LOOKBACK_DAYS),
+            StockPrice.date <= until,
+            Stock.is_active == True
+        )
+        .all()
+    )
+    return panel_snapshot(
+        pd.DataFrame(indicator_rows, columns=INDICATOR_FRAME_COLUMNS),
+        pd.DataFrame(price_rows, columns=PRICE_FRAME_COLUMNS),
+        since,
+        until,
+        window
+    )
+
+
+def snapshot_from_frames(
+    frames: Dict[str, pd.DataFrame],
+    stocks: Dict[str, Tuple[int, str, Optional[str]]],
+    trade_date: date,
+    window: int = VOLUME_AVERAGE_DAYS
+) -> ScreeningSnapshot:
+    """수집 단계가 계산한 종목별 일봉+지표 DataFrame으로 trade_date 스냅샷 생성 (DB 조회 없음)
+
+    frames: 종목 코드 → Date/Close/Volume/change_percent/지표 컬럼 DataFrame
+            (직전 이동평균, 거래량 평균, MACD 교차 판단을 위해 최근 이력 포함)
+    stocks: 종목 코드 → (stock_id, 종목명, 섹터), 여기 없는 종목은 제외
+    """
+    indicator_parts = []
+    price_parts = []
+    for symbol, df in frames.items():
+        if symbol not in stocks or df.empty:
+            continue
+        stock_id, name, sector = stocks[symbol]
+        dates = pd.to_datetime(df['Date']).dt.date
+        indicator_parts.append(pd.DataFrame({
+            'stock_id': stock_id,
+            'symbol': symbol,
+            'name': name,
+            'sector': sector,
+            'date': dates,
+            **{column: df[column] for column in INDICATOR_FRAME_COLUMNS[5:]},
+        }))
+        price_parts.append(pd.DataFrame({
+            'stock_id': stock_id,
+            'date': dates,
+            'close': df['Close'],
+            'volume': df['Volume'],
+            'change_percent': df['change_percent'],
+        }))
+
+    indicators = (
+        pd.concat(indicator_parts, ignore_index=True).sort_values(['stock_id', 'date'], kind='stable')
+        if indicator_parts else pd.DataFrame(columns=INDICATOR_FRAME_COLUMNS)
+    )
+    prices = pd.concat(price_parts, ignore_index=True) if price_parts else pd.DataFrame(columns=PRICE_FRAME_COLUMNS)
+    indicators = indicators[indicators['date'] <= trade_date]
+    prices = prices[prices['date'] <= trade_date]
+    return panel_snapshot(indicators, prices, trade_date, trade_date, window)
+
+
+def volume_averages(prices: pd.DataFrame, window: int = VOLUME_AVERAGE_DAYS) -> np.ndarray:
+    """주가 행(종목/날짜순)마다 같은 종목의 직전 window개 일봉 평균 거래량
+
+    load_volume_ratios()와 같이 VOLUME_LOOKBACK_DAYS일 안의 일봉만 쓰고, 없으면 NaN.
+    거래정지 종목도 다른 종목의 거래일이 아니라 자기 일봉 기준으로 센다.
+    """
+    grouped = prices.groupby('stock_id', sort=False)
+    dates = pd.to_datetime(prices['date'])
+    earliest = dates - pd.Timedelta(days=VOLUME_LOOKBACK_DAYS)
+    total = np.zeros(len(prices))
+    count = np.zeros(len(prices))
+    for lag in range(1, window + 1):
+        volume = grouped['volume'].shift(lag).to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(volume) & (pd.to_datetime(grouped['date'].shift(lag)) >= earliest).to_numpy()
+        total += np.where(valid, volume, 0.0)
+        count += valid
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(count > 0, total / count, np.nan)
+
+
+def panel_snapshot(
+    indicators: pd.DataFrame,
+    prices: pd.DataFrame,
+    since: date,
+    until: date,
+    window: int = VOLUME_AVERAGE_DAYS
+) -> ScreeningSnapshot:
+    """지표 행(INDICATOR_FRAME_COLUMNS, 종목/날짜순)과 주가 행(PRICE_FRAME_COLUMNS)으로 기간 스냅샷 계산
+
+    since 이전 행은 아래 계산의 이력으로만 쓰인다.
+    - 직전 거래일 이동평균: 종목별 한 행 이전 값
+    - 거래량 비율: 종목별 직전 window개 일봉 평균 (load_volume_ratios와 같은 기준)
+    - 진입 가격: 현재가 대신 해당 거래일 종가
+    - MACD 골든크로스 경과일: 최근 CROSS_LOOKBACK_DAYS거래일 안의 교차만 반영 (그 이전 교차는 NaN,
+      load_snapshot()과 같은 기준이려면 since 이전 CROSS_LOOKBACK_DAYS거래일 지표가 필요)
+    """
+    frame = indicators.reset_index(drop=True)
+    grouped = frame.groupby('stock_id', sort=False)
+    frame['prev_sma_20'] = grouped['sma_20'].shift(1)
+    frame['prev_sma_60'] = grouped['sma_60'].shift(1)
+
+    frame = frame[(frame['date'] >= since) & (frame['date'] <= until)]
+    macd_cross_age = np.empty(0)
+    if len(frame):
+        panel = panel_from_frame(indicators, ('macd', 'macd_signal'))
+        ages = cross_age(cross_matrix(panel, CROSS_EVENTS['macd_golden_cross']))
+        ages[ages >= CROSS_LOOKBACK_DAYS] = np.nan
+        macd_cross_age = ages[
+            pd.Index(panel.dates).get_indexer(frame['date'].to_numpy(dtype='datetime64[D]')),
+            pd.Index(panel.stock_ids).get_indexer(frame['stock_id'])
+        ]
+
+    prices = prices.sort_values(['stock_id', 'date'], kind='stable').reset_index(drop=True)
+    if len(prices):
+        average = volume_averages(prices, window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = prices['volume'].to_numpy(dtype=np.float64) / average
+        prices['volume_ratio'] = np.where(average > 0, ratio, 1.0)
+    else:
+        prices['volume_ratio'] = pd.Series(dtype=np.float64)
+
+    frame = frame.merge(prices, on=['stock_id', 'date'], how='left')
+    frame['volume_ratio'] = frame['volume_ratio'].fillna(1.0)
+
+    def floats(column: str) -> np.ndarray:
+        return frame[column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    return ScreeningSnapshot(
+        trade_date=until,
+        stock_ids=frame['stock_id'].to_numpy(dtype=np.int64),
+        symbols=frame['symbol'].to_numpy(dtype=object),
+        names=frame['name'].to_numpy(dtype=object),
+        sectors=frame['sector'].to_numpy(dtype=object),
+        prices=floats('close'),
+        rsi=floats('rsi'),
+        macd=floats('macd'),
+        macd_signal=floats('macd_signal'),
+        volume_ratio=floats('volume_ratio'),
+        close=floats('close'),
+        volume=floats('volume'),
+        change_percent=floats('change_percent'),
+        sma_20=floats('sma_20'),
+        sma_60=floats('sma_60'),
+        prev_sma_20=floats('prev_sma_20'),
+        prev_sma_60=floats('prev_sma_60'),
+        macd_cross_age=macd_cross_age,
+        dates=frame['date'].to_numpy(dtype='datetime64[D]'),
+    )
+
+
+def volume_score(volume_ratio: np.ndarray) -> np.ndarray:
+    """거래량 점수 (20점 만점)"""
+    with np.errstate(invalid='ignore'):
+        return np.select(
+            [volume_ratio >= 2.0, volume_ratio >= 1.5, volume_ratio >= 1.2, volume_ratio >= 1.0],
+            [20, 15, 10, 5],
+            default=0
+        )
+
+
+def signal_strength(
+    rsi: np.ndarray,
+    macd: np.ndarray,
+    macd_signal: np.ndarray,
+    volume_ratio: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """신호 강도 (0-100) - calculate_signal_strength의 배열 버전"""
+    rsi = np.asarray(rsi, dtype=np.float64)
+    macd_signal = np.asarray(macd_signal, dtype=np.float64)
+    macd_diff = np.asarray(macd, dtype=np.float64) - macd_signal
+    if volume_ratio is None:
+        volume_ratio = np.ones_like(rsi)
+    volume_ratio = np.asarray(volume_ratio, dtype=np.float64)
+
+    with np.errstate(invalid='ignore'):
+        # RSI 점수 (40점 만점)
+        rsi_score = np.select(
+            [rsi <= 20, rsi <= 25, rsi <= 30, rsi <= 35],
+            [40, 35, 30, 20],
+            default=0
+        )
+
+        # MACD 점수 (30점 만점)
+        golden = macd_diff > 0
+        macd_score = np.select(
+            [golden & (macd_diff > macd_signal * 0.1), golden & (macd_diff > macd_signal * 0.05), golden],
+            [30, 25, 20],
+            default=0
+        )
+
+        # 추가 보정 (10점): RSI 극도 과매도 + MACD 골든크로스
+        bonus = np.where((rsi <= 25) & golden, 10, 0)
+
+    return np.minimum(rsi_score + macd_score + volume_score(volume_ratio) + bonus, 100)
@@ -0,0 +1,182 @@
+"""
+스크리닝 전략 - 같은 지표 스냅샷 배열을 공유해 여러 매수 신호 전략을 한 번에 평가
+
+- 전략은 Strategy를 상속하고 register_strategy로 등록한다 (signal_type이 BuySignal.signal_type)
+- evaluate()는 종목 배열 전체에 대한 (조건 충족 여부, 신호 강도)를 반환한다
+- run_strategies()는 스냅샷 한 번으로 등록된 모든 전략의 신호를 모은다
+  (기간 스냅샷이면 신호 수 제한을 거래일별로 적용)
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.screening.engine import ScreeningSnapshot, signal_strength, volume_score
+
+RSI_OVERSOLD = 30
+MACD_CROSS_DAYS = 3  # MACD 골든크로스 인정 기간 (교차 후 경과 거래일)
+MIN_SIGNAL_STRENGTH = 50
+MAX_SIGNALS = 15  # 전략별 최대 신호 수
+
+
+@dataclass
+class StrategyResult:
+    """전략 평가 결과 (스냅샷 종목 순서와 같은 배열)"""
+    mask: np.ndarray
+    strength: np.ndarray
+
+
+class Strategy(ABC):
+    """매수 신호 전략"""
+    signal_type: str = ""
+    label: str = ""
+
+    @abstractmethod
+    def evaluate(self, snapshot: ScreeningSnapshot) -> StrategyResult:
+        """전 종목의 조건 충족 여부와 신호 강도 (0-100)"""
+
+    def reason(self, snapshot: ScreeningSnapshot, index: int) -> str:
+        """신호 발생 이유 문구"""
+        return self.label
+
+
+STRATEGIES: Dict[str, Strategy] = {}
+
+
+def register_strategy(cls):
+    """전략 클래스 등록 데코레이터"""
+    if cls.signal_type in STRATEGIES:
+        raise ValueError(f"이미 등록된 전략입니다: {cls.signal_type}")
+    STRATEGIES[cls.signal_type] = cls()
+    return cls
+
+
+@register_strategy
+class OversoldGoldenCross(Strategy):
+    """RSI 과매도 + MACD 골든크로스 (기존 스크리닝)
+
+    MACD가 신호선 위에 있는 상태만이 아니라 최근 MACD_CROSS_DAYS거래일 안에
+    실제 교차가 있어야 한다 (교차 정보가 없는 스냅샷은 상태 조건만 사용).
+    """
+    signal_type = 'rsi_oversold_macd_golden'
+    label = "RSI 과매도 + MACD 골든크로스"
+
+    def evaluate(self, snapshot: ScreeningSnapshot) -> StrategyResult:
+        with np.errstate(invalid='ignore'):
+            mask = (snapshot.rsi <= RSI_OVERSOLD) & (snapshot.macd > snapshot.macd_signal)
+            if snapshot.macd_cross_age is not None:
+                mask &= snapshot.macd_cross_age <= MACD_CROSS_DAYS
+        strength = signal_strength(snapshot.rsi, snapshot.macd, snapshot.macd_signal, snapshot.volume_ratio)
+        return StrategyResult(mask, strength)
+
+    def reason(self, snapshot: ScreeningSnapshot, index: int) -> str:
+        if snapshot.macd_cross_age is not None:
+            age = int(snapshot.macd_cross_age[index])
+            when = "당일" if age == 0 else f"{age}일 전"
+            return f"RSI 과매도({snapshot.rsi[index]:.1f}) + MACD 골든크로스({when})"
+        return f"RSI 과매도({snapshot.rsi[index]:.1f}) + MACD 골든크로스"
+
+
+@register_strategy
+class SmaGoldenCross(Strategy):
+    """SMA20이 SMA60을 상향 돌파
+
+    기본 50점 + 거래량 점수(20) + 종가 SMA20 위(15) + MACD 신호선 위(15)
+    """
+    signal_type = 'sma_golden_cross'
+    label = "SMA20/60 골든크로스"
+
+    def evaluate(self, snapshot: ScreeningSnapshot) -> StrategyResult:
+        with np.errstate(invalid='ignore'):
+            mask = (snapshot.prev_sma_20 <= snapshot.prev_sma_60) & (snapshot.sma_20 > snapshot.sma_60)
+            strength = (
+                50
+                + volume_score(snapshot.volume_ratio)
+                + np.where(snapshot.close > snapshot.sma_20, 15, 0)
+                + np.where(snapshot.macd > snapshot.macd_signal, 15, 0)
+            )
+        return StrategyResult(mask, np.minimum(strength, 100))
+
+
+@register_strategy
+class VolumeBreakout(Strategy):
+    """거래량 급증을 동반한 상승 (20일 평균 거래량 2배 이상, 종가 SMA20 위)
+
+    거래량 비율 구간 점수(5배 70 / 3배 60 / 2배 50) + 종가 SMA60 위(15) + MACD 신호선 위(15)
+    """
+    signal_type = 'volume_breakout'
+    label = "거래량 급증 돌파"
+
+    def evaluate(self, snapshot: ScreeningSnapshot) -> StrategyResult:
+        ratio = snapshot.volume_ratio
+        with np.errstate(invalid='ignore'):
+            mask = (ratio >= 2.0) & (snapshot.change_percent > 0) & (snapshot.close > snapshot.sma_20)
+            strength = (
+                np.select([ratio >= 5.0, ratio >= 3.0, ratio >= 2.0], [70, 60, 50], default=0)
+                + np.where(snapshot.close > snapshot.sma_60, 15, 0)
+                + np.where(snapshot.macd > snapshot.macd_signal, 15, 0)
+            )
+        return StrategyResult(mask, np.minimum(strength, 100))
+
+    def reason(self, snapshot: ScreeningSnapshot, index: int) -> str:
+        return f"거래량 {snapshot.volume_ratio[index]:.1f}배 급증 + 상승 돌파"
+
+
+def run_strategies(
+    snapshot: ScreeningSnapshot,
+    strategies: Optional[Iterable[Strategy]] = None,
+    min_strength: int = MIN_SIGNAL_STRENGTH,
+    limit: Optional[int] = MAX_SIGNALS
+) -> List[Dict[str, Any]]:
+    """등록된 전략을 모두 평가해 전략별 신호 강도순 신호 목록 반환
+
+    BuySignal은 RSI/MACD 값이 필수이므로 값이 없는 종목은 모든 전략에서 제외한다.
+    """
+    strategies = list(STRATEGIES.values() if strategies is None else strategies)
+    usable = np.isfinite(snapshot.rsi) & np.isfinite(snapshot.macd) & np.isfinite(snapshot.macd_signal)
+
+    signals = []
+    for strategy in strategies:
+        result = strategy.evaluate(snapshot)
+        indices = np.flatnonzero(result.mask & usable & (result.strength >= min_strength))
+        # 강도 내림차순, 같은 강도는 조회 순서 유지 (list.sort와 동일한 안정 정렬)
+        indices = indices[np.argsort(-result.strength[indices], kind='stable')]
+        if snapshot.dates is not None:
+            indices = _limit_per_date(indices, snapshot.dates, limit)
+        elif limit is not None:
+            indices = indices[:limit]
+
+        signals.extend(_signal_record(snapshot, strategy, i, int(result.strength[i])) for i in indices)
+    return signals
+
+
+def _limit_per_date(indices: np.ndarray, dates: np.ndarray, limit: Optional[int]) -> np.ndarray:
+    """강도순 인덱스를 거래일순으로 묶고 거래일마다 상위 limit개만 남김"""
+    indices = indices[np.argsort(dates[indices], kind='stable')]
+    if limit is None or not len(indices):
+        return indices
+    grouped = dates[indices]
+    starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+    rank = np.arange(len(indices)) - np.repeat(starts, np.diff(np.r_[starts, len(indices)]))
+    return indices[rank < limit]
+
+
+def _signal_record(snapshot: ScreeningSnapshot, strategy: Strategy, i: int, strength: int) -> Dict[str, Any]:
+    return {
+        'stock_id': int(snapshot.stock_ids[i]),
+        'symbol': snapshot.symbols[i],
+        'name': snapshot.names[i],
+        'sector': snapshot.sectors[i],
+        'date': snapshot.dates[i].astype(date) if snapshot.dates is not None else snapshot.trade_date,
+        'signal_type': strategy.signal_type,
+        'reason': strategy.reason(snapshot, i),
+        'signal_strength': strength,
+        'entry_price': float(snapshot.prices[i]) if not np.isnan(snapshot.prices[i]) else 0.0,
+        'rsi_value': float(snapshot.rsi[i]),
+        'macd_value': float(snapshot.macd[i]),
+        'macd_signal_value': float(snapshot.macd_signal[i]),
+        'volume_ratio': float(snapshot.volume_ratio[i]),
+        'volume': int(snapshot.volume[i]) if not np.isnan(snapshot.volume[i]) else None,
+    }
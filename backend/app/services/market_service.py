@@ -2,12 +2,13 @@
 시장 서비스 - 시장 통계 관련 비즈니스 로직
 """
 from typing import List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, and_
 
+from app.core.trading_calendar import get_trading_calendar
 from app.models import Stock, BuySignal, MarketIndex, TechnicalIndicator
-from app.schemas.market import MarketStats, MarketIndex as MarketIndexSchema, DataHealth, SectorStats
+from app.schemas.market import MarketStats, MarketIndex as MarketIndexSchema, DataHealth, SectorStats, TradingDay
 
 
 class MarketService:
@@ -158,6 +159,13 @@ class MarketService:
         # 데이터 신선도 (시간 단위)
         data_freshness = (datetime.utcnow() - last_update).total_seconds() / 3600
         
+        # 마지막 업데이트 다음 날부터 어제까지의 거래일 수 (주말/휴장일은 세지 않음)
+        calendar = get_trading_calendar(self.db)
+        today = date.today()
+        missed_trading_days = len(
+            calendar.trading_days(last_update.date() + timedelta(days=1), today - timedelta(days=1))
+        )
+        
         # 데이터 품질 지표
         missing_price_count = (
             self.db.query(Stock)
@@ -182,16 +190,31 @@ class MarketService:
         
         # 데이터베이스 및 API 상태 판정
         db_status = "healthy" if quality_score > 70 else "warning" if quality_score > 50 else "error"
-        api_status = "healthy" if data_freshness < 24 else "warning" if data_freshness < 48 else "error"
+        api_status = "healthy" if missed_trading_days == 0 else "warning" if missed_trading_days == 1 else "error"
         
         return DataHealth(
             total_stocks=total_stocks,
             active_stocks=active_stocks,
             last_data_update=last_update,
             data_freshness_hours=round(data_freshness, 2),
+            latest_trading_day=calendar.latest_trading_day(today),
+            missed_trading_days=missed_trading_days,
             missing_price_count=missing_price_count,
             missing_indicator_count=missing_indicator_count,
             data_quality_score=round(quality_score, 2),
             database_status=db_status,
             api_status=api_status
-        )
\ No newline at end of file
+        )
+    
+    async def get_trading_day(self) -> TradingDay:
+        """오늘 기준 거래일 정보 (날짜별로 한 번 만든 거래일 달력 사용)"""
+        
+        calendar = get_trading_calendar(self.db)
+        today = date.today()
+        return TradingDay(
+            today=today,
+            is_trading_day=calendar.is_trading_day(today),
+            latest_trading_day=calendar.latest_trading_day(today),
+            previous_trading_day=calendar.previous_trading_day(today),
+            next_trading_day=calendar.next_trading_day(today)
+        )
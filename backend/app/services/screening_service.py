@@ -6,7 +6,10 @@ from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, func
 
+from app.core.trading_calendar import get_trading_calendar
 from app.models import Stock, TechnicalIndicator, BuySignal
+from app.screening.backtest import run_backtest
+from app.screening.crossovers import detect_crossovers, load_indicator_panel
 from app.schemas.screening_simple import BuySignal as BuySignalSchema
 
 
@@ -84,9 +87,9 @@ class ScreeningService:
         symbol: str,
         days: int = 30
     ) -> List[Dict[str, Any]]:
-        """특정 종목의 신호 이력 조회"""
+        """특정 종목의 신호 이력 조회 (최근 거래일부터 days일 전까지)"""
         
-        end_date = datetime.utcnow()
+        end_date = get_trading_calendar(self.db).latest_trading_day()
         start_date = end_date - timedelta(days=days)
         
         history = (
@@ -95,8 +98,8 @@ class ScreeningService:
             .filter(
                 and_(
                     Stock.symbol == symbol,
-                    BuySignal.date >= start_date.date(),
-                    BuySignal.date <= end_date.date()
+                    BuySignal.date >= start_date,
+                    BuySignal.date <= end_date
                 )
             )
             .order_by(desc(BuySignal.date))
@@ -168,4 +171,26 @@ class ScreeningService:
             "sector_distribution": sector_distribution,
             "avg_signal_strength": avg_signal_strength,
             "last_updated": last_updated
-        }
\ No newline at end of file
+        }
+    
+    async def get_backtest(
+        self,
+        strategies: Optional[List[str]] = None,
+        days: int = 180
+    ) -> Dict[str, Any]:
+        """전략 백테스트 결과 조회 (마지막 지표 거래일이 같으면 캐시 사용)"""
+        return run_backtest(self.db, strategies, days)
+    
+    async def get_crossover_events(
+        self,
+        events: Optional[List[str]] = None,
+        days: int = 5,
+        sector: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """최근 days거래일 안에 발생한 교차 이벤트 (전 종목 지표 패널 한 번 조회)"""
+        panel = load_indicator_panel(self.db, days)
+        found = detect_crossovers(panel, events, days)
+        if sector:
+            found = [event for event in found if event['sector'] == sector]
+        return found[:limit]
\ No newline at end of file
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, or_, func
 
 from app.models import Stock, StockPrice, TechnicalIndicator
+from app.indicators.custom import CustomIndicator, get_custom_indicators
 from app.schemas.stock_simple import StockDetail, ChartData, StockSearchResult
 
 
@@ -148,9 +149,10 @@ class StockService:
     async def get_technical_indicators(
         self,
         symbol: str,
-        period: str = "6M"
+        period: str = "6M",
+        custom: Optional[List[CustomIndicator]] = None
     ) -> List[Dict[str, Any]]:
-        """기술적 지표 조회"""
+        """기술적 지표 조회 (custom: 저장된 종가로 계산할 사용자 지정 기간 지표)"""
         
         stock = (
             self.db.query(Stock)
@@ -186,10 +188,13 @@ class StockService:
             .all()
         )
         
+        # 사용자 지정 기간 지표 (캐시 적중시 재계산 없음)
+        custom_values = get_custom_indicators(self.db, stock.id, symbol, custom or [])
+        
         # ORM 객체를 딕셔너리로 변환
         result = []
         for indicator in indicators:
-            result.append({
+            row = {
                 "date": indicator.date,
                 "rsi": indicator.rsi,
                 "macd": indicator.macd,
@@ -197,7 +202,10 @@ class StockService:
                 "macd_histogram": indicator.macd_histogram,
                 "sma_20": indicator.sma_20,
                 "sma_60": indicator.sma_60,
-            })
+            }
+            for name, values in custom_values.items():
+                row[name] = values.get(indicator.date)
+            result.append(row)
         
         return result
     
@@ -0,0 +1,92 @@
+"""
+지표 계산 벤치마크 - 종목별 pandas 계산 vs (종목 × 날짜) 패널 벡터화 엔진
+"""
+import sys
+import os
+import argparse
+import time
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# DB를 사용하지 않으므로 설정 로딩용 기본값만 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import numpy as np
+import pandas as pd
+
+from app.indicators.engine import INDICATOR_NAMES, compute_indicator_panel
+from collect_daily_data import calculate_technical_indicators
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def build_panel(symbols: int, days: int, seed: int = 0) -> np.ndarray:
+    """상장일이 서로 다른 랜덤 워크 종가 패널 생성"""
+    rng = np.random.default_rng(seed)
+    closes = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, (symbols, days)), axis=1))
+    listing_offsets = rng.integers(0, days // 3, symbols)
+    closes[np.arange(days)[None, :] < listing_offsets[:, None]] = np.nan
+    return closes
+
+
+def run_pandas(closes: np.ndarray, dates: pd.DatetimeIndex) -> tuple:
+    """기존 방식: 종목마다 DataFrame을 만들어 calculate_technical_indicators 호출"""
+    started = time.perf_counter()
+    results = []
+    for row in closes:
+        valid = ~np.isnan(row)
+        df = pd.DataFrame({'Close': row[valid]}, index=dates[valid])
+        results.append(calculate_technical_indicators(df))
+    return time.perf_counter() - started, results
+
+
+def max_difference(closes: np.ndarray, panel: dict, pandas_results: list) -> float:
+    """두 방식 결과의 최대 상대 오차"""
+    worst = 0.0
+    for i, result in enumerate(pandas_results):
+        valid = ~np.isnan(closes[i])
+        for name in INDICATOR_NAMES:
+            expected = result[name].to_numpy()
+            actual = panel[name][i, valid]
+            both = ~np.isnan(expected) & ~np.isnan(actual)
+            if (np.isnan(expected) != np.isnan(actual)).any():
+                return float('inf')
+            if both.any():
+                diff = np.abs(expected[both] - actual[both]) / np.maximum(1.0, np.abs(expected[both]))
+                worst = max(worst, float(diff.max()))
+    return worst
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="지표 계산 벤치마크")
+    parser.add_argument("--sizes", default="200,2000,10000", help="종목 수 목록 (쉼표 구분)")
+    parser.add_argument("--days", type=int, default=180, help="거래일 수")
+    args = parser.parse_args()
+
+    dates = pd.bdate_range("2024-01-02", periods=args.days, name="Date")
+    logger.info(f"🚀 지표 계산 벤치마크: 거래일 {args.days}일")
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        closes = build_panel(size, args.days)
+
+        started = time.perf_counter()
+        panel = compute_indicator_panel(closes)
+        engine_elapsed = time.perf_counter() - started
+
+        pandas_elapsed, pandas_results = run_pandas(closes, dates)
+        diff = max_difference(closes, panel, pandas_results)
+
+        logger.info(
+            f"{size:>6,}개 종목: pandas 종목별 {pandas_elapsed:8.3f}초 | "
+            f"패널 엔진 {engine_elapsed:8.3f}초 | {pandas_elapsed / engine_elapsed:6.1f}배 | "
+            f"최대 상대 오차 {diff:.1e}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+저장 단계 벤치마크 - 행별 SELECT 후 ORM 저장 vs ON CONFLICT 대량 upsert
+"""
+import sys
+import os
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 벤치마크는 별도 DB를 사용하므로 설정 로딩용 기본값만 지정
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import Stock, StockPrice, TechnicalIndicator
+from app.collector.writer import bulk_upsert
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def build_rows(stock_ids: list, days: int) -> tuple:
+    """종목 × 거래일 가짜 주가/지표 행 생성"""
+    rng = np.random.default_rng(0)
+    start = date.today() - timedelta(days=days)
+    dates = [start + timedelta(days=i) for i in range(days)]
+
+    price_rows = []
+    indicator_rows = []
+    for stock_id in stock_ids:
+        closes = 10000 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+        for trade_date, close in zip(dates, closes):
+            close = float(close)
+            price_rows.append({
+                'stock_id': stock_id, 'date': trade_date,
+                'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                'volume': 1_000_000, 'change_amount': 0.0, 'change_percent': 0.0
+            })
+            indicator_rows.append({
+                'stock_id': stock_id, 'date': trade_date,
+                'rsi': 50.0, 'macd': 1.0, 'macd_signal': 0.5, 'macd_histogram': 0.5,
+                'sma_20': close, 'sma_60': close
+            })
+    return price_rows, indicator_rows
+
+
+def save_row_by_row(db, price_rows: list, indicator_rows: list) -> None:
+    """기존 방식: 행마다 SELECT 후 갱신 또는 추가"""
+    for price, indicator in zip(price_rows, indicator_rows):
+        existing_price = db.query(StockPrice).filter(
+            StockPrice.stock_id == price['stock_id'],
+            StockPrice.date == price['date']
+        ).first()
+        if existing_price:
+            for key, value in price.items():
+                setattr(existing_price, key, value)
+        else:
+            db.add(StockPrice(**price))
+
+        existing_indicator = db.query(TechnicalIndicator).filter(
+            TechnicalIndicator.stock_id == indicator['stock_id'],
+            TechnicalIndicator.date == indicator['date']
+        ).first()
+        if existing_indicator:
+            for key, value in indicator.items():
+                setattr(existing_indicator, key, value)
+        else:
+            db.add(TechnicalIndicator(**indicator))
+    db.commit()
+
+
+def save_bulk(db, price_rows: list, indicator_rows: list, chunk_size: int) -> None:
+    """대량 upsert 방식"""
+    bulk_upsert(db, StockPrice, price_rows, ('stock_id', 'date'), chunk_size=chunk_size)
+    bulk_upsert(db, TechnicalIndicator, indicator_rows, ('stock_id', 'date'), chunk_size=chunk_size)
+    db.commit()
+
+
+def measure(label: str, func, session_factory, price_rows: list, indicator_rows: list, **kwargs) -> None:
+    """빈 테이블 삽입과 기존 행 갱신을 각각 측정"""
+    total = len(price_rows) + len(indicator_rows)
+    for phase in ("insert", "update"):
+        db = session_factory()
+        try:
+            started = time.perf_counter()
+            func(db, price_rows, indicator_rows, **kwargs)
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+        logger.info(f"{label:<10} {phase:<6}: {elapsed:7.2f}초 ({total / elapsed:10,.0f} 행/초)")
+
+
+def reset_tables(bench_engine) -> None:
+    """가격/지표 테이블 비우기"""
+    with bench_engine.begin() as conn:
+        conn.execute(TechnicalIndicator.__table__.delete())
+        conn.execute(StockPrice.__table__.delete())
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="저장 단계 벤치마크")
+    parser.add_argument("--database-url", default=None,
+                        help="벤치마크용 DB URL (기본값: 임시 SQLite 파일)")
+    parser.add_argument("--stocks", type=int, default=50, help="종목 수")
+    parser.add_argument("--days", type=int, default=180, help="종목당 거래일 수")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="upsert 청크 크기")
+    args = parser.parse_args()
+
+    tmpdir = None
+    url = args.database_url
+    if url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmpdir.name, 'benchmark.db')}"
+
+    bench_engine = create_engine(url)
+    Base.metadata.create_all(bind=bench_engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=bench_engine)
+
+    db = session_factory()
+    try:
+        stocks = [
+            Stock(symbol=f"B{i:05d}", name=f"벤치마크{i}", market="KOSPI", is_active=False)
+            for i in range(args.stocks)
+        ]
+        db.add_all(stocks)
+        db.commit()
+        stock_ids = [s.id for s in stocks]
+    finally:
+        db.close()
+
+    price_rows, indicator_rows = build_rows(stock_ids, args.days)
+    logger.info(f"🚀 저장 벤치마크: {bench_engine.dialect.name}, "
+                f"{args.stocks}개 종목 × {args.days}일 (행 {len(price_rows) * 2:,}개)")
+
+    try:
+        reset_tables(bench_engine)
+        measure("행별 저장", save_row_by_row, session_factory, price_rows, indicator_rows)
+        reset_tables(bench_engine)
+        measure("대량 upsert", save_bulk, session_factory, price_rows, indicator_rows,
+                chunk_size=args.chunk_size)
+    finally:
+        reset_tables(bench_engine)
+        with bench_engine.begin() as conn:
+            conn.execute(Stock.__table__.delete().where(Stock.id.in_(stock_ids)))
+        bench_engine.dispose()
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
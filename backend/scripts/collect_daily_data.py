@@ -3,8 +3,10 @@
 """
 import sys
 import os
+import argparse
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import logging
 
 # 프로젝트 루트 추가
@@ -12,11 +14,29 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pandas as pd
 import FinanceDataReader as fdr
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import sessionmaker
 
 from app.core.database import engine
-from app.models import Stock, StockPrice, TechnicalIndicator, MarketIndex
+from app.models import Stock, StockPrice, TechnicalIndicator, MarketIndex, IndicatorState, IndicatorValue
 from app.core.config import settings
+from app.core.trading_calendar import load_trading_calendar, skip_if_closed
+from app.collector.sources import DataSource, FinanceDataReaderSource, get_data_source
+from app.collector.fetcher import ConcurrentFetcher
+from app.collector.cache import CachedDataSource
+from app.collector.writer import bulk_upsert
+from app.collector.dirty import DirtySet, record_changes, find_changed_rows
+from app.collector.records import frame_to_records, price_records, indicator_records, indicator_value_records
+from app.collector.history import OHLCV_COLUMNS, load_price_history
+from app.collector.ledger import RunLedger
+from app.collector.sharding import ShardSpec, parse_shard
+from app.collector.pipeline import CollectionPipeline
+from app.collector.snapshot import listing_bars, resolve_trade_dates, append_snapshot_bar, split_snapshot_universe
+from app.indicators.registry import (
+    LONG_FORMAT_LOOKBACK, compute_indicators, long_format_indicators, long_format_outputs
+)
+from app.indicators.streaming import StreamingState, advance, seed_state, state_record, load_states
+from app.screening.crossovers import CROSS_LOOKBACK_DAYS
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,30 +44,61 @@ logger = logging.getLogger(__name__)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 전체 수집시 조회 기간 (6개월 + 여유분)
+FULL_HISTORY_DAYS = 200
 
-def get_top_stocks(limit: int = 200) -> List[Dict]:
+# 증분 수집시 지표 워밍업 기간 (달력일 120일 ≈ 거래일 80일)
+# SMA60은 60거래일이면 정확하고, EMA(MACD)는 80거래일 이후 가중치가 0.3% 미만이라
+# 전체 수집 결과와 소수점 수준 차이만 발생한다
+INDICATOR_WARMUP_DAYS = 120
+
+# 지표 상태로 갱신하는 종목의 확장 지표 계산용 이력 기간 (달력일, 연휴 여유분 포함)
+LONG_FORMAT_HISTORY_DAYS = LONG_FORMAT_LOOKBACK * 7 // 5 + 14
+
+# 다음 단계(스크리닝)에 메모리로 넘길 종목별 최근 일봉+지표 행 수
+# (직전 20거래일 거래량 평균과 MACD 교차 탐색 기간 + 당일)
+RECENT_FRAME_ROWS = CROSS_LOOKBACK_DAYS + 1
+
+# Stock 컬럼명 → KRX 상장종목 목록 컬럼명
+STOCK_LISTING_COLUMNS = {
+    'symbol': 'Code',
+    'name': 'Name',
+    'market': 'Market',
+    'sector': 'Sector',
+    'industry': 'Industry',
+    'market_cap': 'Marcap',
+}
+
+# 종목 마스터 동기화시 비교/갱신하는 컬럼
+STOCK_MASTER_FIELDS = ('symbol', 'name', 'market', 'sector', 'industry', 'market_cap')
+
+
+def get_krx_listing() -> pd.DataFrame:
+    """KRX 전체 상장종목 목록 (당일 시세 포함) 조회"""
+    return fdr.StockListing('KRX')
+
+
+def get_top_stocks(limit: int = 200, listing_df: Optional[pd.DataFrame] = None) -> List[Dict]:
     """시가총액 상위 종목 리스트 가져오기"""
     try:
         logger.info(f"📈 시가총액 상위 {limit}개 종목 조회 중...")
         
         # KRX 전체 종목 정보
-        stocks_df = fdr.StockListing('KRX')
+        stocks_df = listing_df if listing_df is not None else get_krx_listing()
         
         # 시가총액 상위 종목 선별
         stocks_df = stocks_df.dropna(subset=['Market'])
         stocks_df = stocks_df[stocks_df['Market'].isin(['KOSPI', 'KOSDAQ'])]
         stocks_df = stocks_df.nlargest(limit, 'Marcap')
         
-        stocks_list = []
-        for _, row in stocks_df.iterrows():
-            stocks_list.append({
-                'symbol': row['Code'],
-                'name': row['Name'],
-                'market': row['Market'],
-                'sector': row.get('Sector', '기타'),
-                'industry': row.get('Industry', '기타'),
-                'market_cap': int(row['Marcap']) if pd.notna(row['Marcap']) else None
-            })
+        # 업종 정보가 없는 경우 '기타'로 채움
+        for column in ('Sector', 'Industry'):
+            if column in stocks_df.columns:
+                stocks_df[column] = stocks_df[column].fillna('기타')
+            else:
+                stocks_df[column] = '기타'
+        
+        stocks_list = frame_to_records(stocks_df, STOCK_LISTING_COLUMNS, int_columns=('market_cap',))
         
         logger.info(f"✅ {len(stocks_list)}개 종목 조회 완료")
         return stocks_list
@@ -57,45 +108,60 @@ def get_top_stocks(limit: int = 200) -> List[Dict]:
         raise
 
 
-def update_stocks_master(stocks_list: List[Dict]) -> None:
-    """종목 마스터 테이블 업데이트"""
+def update_stocks_master(stocks_list: List[Dict], shard: ShardSpec = ShardSpec()) -> None:
+    """종목 마스터 테이블 업데이트
+
+    기존 종목을 한 번에 읽어 symbol → row 맵을 만들고, 추가/변경/비활성화 대상을
+    집합 연산으로 구한 뒤 각각 대량 INSERT / UPDATE 로 반영한다.
+    샤드 실행에서는 자기 샤드에 속한 종목만 건드려 샤드 간 쓰기가 겹치지 않는다.
+    """
     db = SessionLocal()
     try:
         logger.info("📝 종목 마스터 테이블 업데이트 중...")
         
-        updated_count = 0
-        for stock_info in stocks_list:
-            stock = db.query(Stock).filter(Stock.symbol == stock_info['symbol']).first()
-            
-            if stock:
-                # 기존 종목 업데이트
-                stock.name = stock_info['name']
-                stock.market = stock_info['market']
-                stock.sector = stock_info['sector']
-                stock.industry = stock_info['industry']
-                stock.market_cap = stock_info['market_cap']
-                stock.is_active = True
-            else:
-                # 새 종목 추가
-                stock = Stock(
-                    symbol=stock_info['symbol'],
-                    name=stock_info['name'],
-                    market=stock_info['market'],
-                    sector=stock_info['sector'],
-                    industry=stock_info['industry'],
-                    market_cap=stock_info['market_cap'],
-                    is_active=True
-                )
-                db.add(stock)
-            
-            updated_count += 1
-        
-        # 상위 종목에서 제외된 종목들 비활성화
-        active_symbols = [s['symbol'] for s in stocks_list]
-        db.query(Stock).filter(~Stock.symbol.in_(active_symbols)).update({'is_active': False})
+        existing = {
+            row.symbol: row
+            for row in db.query(
+                Stock.id, Stock.symbol, Stock.name, Stock.market, Stock.sector,
+                Stock.industry, Stock.market_cap, Stock.is_active
+            )
+            if shard.contains(row.symbol)
+        }
+        incoming = {s['symbol']: s for s in stocks_list if shard.contains(s['symbol'])}
+        
+        inserts = [
+            {**{field: incoming[symbol][field] for field in STOCK_MASTER_FIELDS}, 'is_active': True}
+            for symbol in incoming.keys() - existing.keys()
+        ]
+        
+        updates = []
+        for symbol in incoming.keys() & existing.keys():
+            row = existing[symbol]
+            values = {field: incoming[symbol][field] for field in STOCK_MASTER_FIELDS}
+            if row.is_active and all(getattr(row, field) == value for field, value in values.items()):
+                continue  # 변경 없음
+            updates.append({'id': row.id, **values, 'is_active': True})
+        
+        # 상위 종목에서 제외된 종목들 비활성화 (현재 활성 종목만 대상)
+        deactivate_ids = [
+            row.id for symbol, row in existing.items()
+            if symbol not in incoming and row.is_active
+        ]
+        
+        if inserts:
+            db.execute(insert(Stock), inserts)
+        if updates:
+            db.execute(update(Stock), updates)
+        if deactivate_ids:
+            db.query(Stock).filter(Stock.id.in_(deactivate_ids)).update(
+                {'is_active': False}, synchronize_session=False
+            )
         
         db.commit()
-        logger.info(f"✅ 종목 마스터 업데이트 완료: {updated_count}개")
+        logger.info(
+            f"✅ 종목 마스터 업데이트 완료: 추가 {len(inserts)}개, 변경 {len(updates)}개, "
+            f"비활성화 {len(deactivate_ids)}개 (변경 없음 {len(incoming) - len(inserts) - len(updates)}개)"
+        )
         
     except Exception as e:
         logger.error(f"❌ 종목 마스터 업데이트 실패: {e}")
@@ -106,33 +172,10 @@ def update_stocks_master(stocks_list: List[Dict]) -> None:
 
 
 def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """기술적 지표 계산"""
+    """기술적 지표 계산 (등록된 모든 지표를 공통 중간값을 공유하며 한 번에 계산)"""
     try:
-        # RSI 계산 (14일)
-        def calculate_rsi(prices, period=14):
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi
-        
-        df['rsi'] = calculate_rsi(df['Close'])
-        
-        # MACD 계산
-        ema12 = df['Close'].ewm(span=12).mean()
-        ema26 = df['Close'].ewm(span=26).mean()
-        df['macd'] = ema12 - ema26
-        df['macd_signal'] = df['macd'].ewm(span=9).mean()
-        df['macd_histogram'] = df['macd'] - df['macd_signal']
-        
-        # 이동평균
-        df['sma_20'] = df['Close'].rolling(window=20).mean()
-        df['sma_60'] = df['Close'].rolling(window=60).mean()
-        
-        # 변동률 계산
-        df['change_amount'] = df['Close'].diff()
-        df['change_percent'] = df['Close'].pct_change() * 100
+        for name, values in compute_indicators(df).items():
+            df[name] = values
         
         return df
         
@@ -141,174 +184,528 @@ def calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
         raise
 
 
-def collect_stock_data(symbol: str, days: int = 200) -> pd.DataFrame:
+def prepare_stock_data(df: pd.DataFrame) -> pd.DataFrame:
+    """수집된 일봉에 기술적 지표를 붙여 저장 가능한 형태로 변환"""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    
+    # 인덱스를 컬럼으로 변환
+    df = df.reset_index()
+    
+    # 기술적 지표 계산
+    df = calculate_technical_indicators(df)
+    
+    # 6개월만 유지 (최근 180일)
+    return df.tail(180)
+
+
+def collect_stock_data(symbol: str, days: int = FULL_HISTORY_DAYS, source: Optional[DataSource] = None) -> pd.DataFrame:
     """개별 종목 데이터 수집"""
     try:
         # 과거 데이터 수집 (6개월 + 여유분)
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
         
-        # FinanceDataReader로 데이터 수집
-        df = fdr.DataReader(symbol, start=start_date, end=end_date)
+        source = source or FinanceDataReaderSource()
+        df = source.fetch_history(symbol, start_date, end_date)
         
         if df.empty:
             logger.warning(f"⚠️ {symbol}: 데이터 없음")
             return pd.DataFrame()
         
-        # 인덱스를 컬럼으로 변환
-        df = df.reset_index()
-        
-        # 기술적 지표 계산
-        df = calculate_technical_indicators(df)
-        
-        # 6개월만 유지 (최근 180일)
-        df = df.tail(180)
-        
-        return df
+        return prepare_stock_data(df)
         
     except Exception as e:
         logger.error(f"❌ {symbol} 데이터 수집 실패: {e}")
         return pd.DataFrame()
 
 
-def save_stock_data(symbol: str, df: pd.DataFrame) -> None:
-    """주가 및 기술적 지표 데이터 저장"""
+@dataclass
+class CollectionResult:
+    """수집 실행 결과 (recent_frames: 저장에 성공한 종목의 최근 RECENT_FRAME_ROWS행 일봉+지표)"""
+    universe: List[str] = field(default_factory=list)
+    success: int = 0
+    failed: int = 0
+    recent_frames: Dict[str, pd.DataFrame] = field(default_factory=dict)
+    dirty: DirtySet = field(default_factory=DirtySet)  # 실제로 값이 바뀐 (stock_id, date)
+
+    @property
+    def trade_date(self) -> Optional[date]:
+        """메모리에 있는 일봉 중 가장 최근 거래일"""
+        dates = [df['Date'].iloc[-1].date() for df in self.recent_frames.values() if not df.empty]
+        return max(dates) if dates else None
+
+    @property
+    def complete(self) -> bool:
+        """대상 전 종목의 최근 일봉이 메모리에 있는지 (아니면 다음 단계가 DB에서 읽어야 함)"""
+        return bool(self.universe) and all(symbol in self.recent_frames for symbol in self.universe)
+
+
+def save_stock_batch(
+    frames: Dict[str, pd.DataFrame],
+    states: Optional[Dict[str, StreamingState]] = None,
+    dirty: Optional[DirtySet] = None
+) -> List[str]:
+    """여러 종목의 주가 및 기술적 지표를 한 트랜잭션으로 저장
+
+    종목 ID는 한 번에 조회하고, uk_stock_date / uk_indicator_stock_date 유니크 인덱스 기준으로
+    전체 행을 대량 upsert 한다. states가 주어지면 종목별 지표 상태도 같은 트랜잭션으로 갱신한다.
+    기존 주가와 달라진 행은 종목별 변경 기록(StockChange)으로 남기고, dirty가 주어지면
+    커밋 후 (stock_id, date)를 추가한다. 실제로 저장한 종목 목록을 반환한다
+    (종목 마스터에 없거나 저장할 행이 없는 종목은 제외).
+    """
     db = SessionLocal()
     try:
-        # 종목 정보 조회
-        stock = db.query(Stock).filter(Stock.symbol == symbol).first()
-        if not stock:
-            logger.warning(f"⚠️ {symbol}: 종목 정보 없음")
-            return
-        
-        saved_price_count = 0
-        saved_indicator_count = 0
-        
-        for _, row in df.iterrows():
-            trade_date = row['Date'].date()
-            
-            # 주가 데이터 저장/업데이트
-            existing_price = db.query(StockPrice).filter(
-                StockPrice.stock_id == stock.id,
-                StockPrice.date == trade_date
-            ).first()
-            
-            if existing_price:
-                # 기존 데이터 업데이트
-                existing_price.open = float(row['Open'])
-                existing_price.high = float(row['High'])
-                existing_price.low = float(row['Low'])
-                existing_price.close = float(row['Close'])
-                existing_price.volume = int(row['Volume'])
-                existing_price.change_amount = float(row['change_amount']) if pd.notna(row['change_amount']) else None
-                existing_price.change_percent = float(row['change_percent']) if pd.notna(row['change_percent']) else None
-            else:
-                # 새 주가 데이터 추가
-                stock_price = StockPrice(
-                    stock_id=stock.id,
-                    date=trade_date,
-                    open=float(row['Open']),
-                    high=float(row['High']),
-                    low=float(row['Low']),
-                    close=float(row['Close']),
-                    volume=int(row['Volume']),
-                    change_amount=float(row['change_amount']) if pd.notna(row['change_amount']) else None,
-                    change_percent=float(row['change_percent']) if pd.notna(row['change_percent']) else None
-                )
-                db.add(stock_price)
-            
-            saved_price_count += 1
+        stock_ids = dict(
+            db.query(Stock.symbol, Stock.id).filter(Stock.symbol.in_(list(frames))).all()
+        )
+        
+        price_rows = []
+        indicator_rows = []
+        value_rows = []
+        latest_rows = []
+        state_rows = []
+        saved = []
+        value_names = long_format_outputs()
+        
+        for symbol, df in frames.items():
+            stock_id = stock_ids.get(symbol)
+            if stock_id is None:
+                logger.warning(f"⚠️ {symbol}: 종목 정보 없음")
+                continue
             
-            # 기술적 지표 저장/업데이트
-            existing_indicator = db.query(TechnicalIndicator).filter(
-                TechnicalIndicator.stock_id == stock.id,
-                TechnicalIndicator.date == trade_date
-            ).first()
+            rows = price_records(df, stock_id)
+            if not rows:
+                continue
             
-            if existing_indicator:
-                # 기존 지표 업데이트
-                existing_indicator.rsi = float(row['rsi']) if pd.notna(row['rsi']) else None
-                existing_indicator.macd = float(row['macd']) if pd.notna(row['macd']) else None
-                existing_indicator.macd_signal = float(row['macd_signal']) if pd.notna(row['macd_signal']) else None
-                existing_indicator.macd_histogram = float(row['macd_histogram']) if pd.notna(row['macd_histogram']) else None
-                existing_indicator.sma_20 = float(row['sma_20']) if pd.notna(row['sma_20']) else None
-                existing_indicator.sma_60 = float(row['sma_60']) if pd.notna(row['sma_60']) else None
-            else:
-                # 새 지표 데이터 추가
-                indicator = TechnicalIndicator(
-                    stock_id=stock.id,
-                    date=trade_date,
-                    rsi=float(row['rsi']) if pd.notna(row['rsi']) else None,
-                    macd=float(row['macd']) if pd.notna(row['macd']) else None,
-                    macd_signal=float(row['macd_signal']) if pd.notna(row['macd_signal']) else None,
-                    macd_histogram=float(row['macd_histogram']) if pd.notna(row['macd_histogram']) else None,
-                    sma_20=float(row['sma_20']) if pd.notna(row['sma_20']) else None,
-                    sma_60=float(row['sma_60']) if pd.notna(row['sma_60']) else None
-                )
-                db.add(indicator)
+            saved.append(symbol)
+            price_rows.extend(rows)
+            indicator_rows.extend(indicator_records(df, stock_id))
+            value_rows.extend(indicator_value_records(df, stock_id, value_names))
+            if states and symbol in states:
+                state_rows.append(state_record(states[symbol], stock_id))
             
-            saved_indicator_count += 1
+            # 종목의 현재가 정보 (최신 데이터 기준)
+            latest = rows[-1]
+            latest_rows.append({
+                'id': stock_id,
+                'price': latest['close'],
+                'change': latest['change_amount'] if latest['change_amount'] is not None else 0.0,
+                'change_percent': latest['change_percent'] if latest['change_percent'] is not None else 0.0,
+                'volume': latest['volume']
+            })
+        
+        changed = find_changed_rows(db, price_rows)
         
-        # 종목의 현재가 정보 업데이트 (최신 데이터 기준)
-        if not df.empty:
-            latest_row = df.iloc[-1]
-            stock.price = float(latest_row['Close'])
-            stock.change = float(latest_row['change_amount']) if pd.notna(latest_row['change_amount']) else 0.0
-            stock.change_percent = float(latest_row['change_percent']) if pd.notna(latest_row['change_percent']) else 0.0
-            stock.volume = int(latest_row['Volume'])
+        bulk_upsert(db, StockPrice, price_rows, ('stock_id', 'date'))
+        bulk_upsert(db, TechnicalIndicator, indicator_rows, ('stock_id', 'date'))
+        bulk_upsert(db, IndicatorValue, value_rows, ('stock_id', 'date', 'name'))
+        bulk_upsert(db, IndicatorState, state_rows, ('stock_id',))
+        record_changes(db, changed)
+        if latest_rows:
+            db.execute(update(Stock), latest_rows)
         
         db.commit()
-        logger.info(f"✅ {symbol}: 주가 {saved_price_count}개, 지표 {saved_indicator_count}개 저장 완료")
+        if dirty is not None:
+            dirty.add(changed)
+        logger.info(
+            f"✅ {len(latest_rows)}개 종목: 주가 {len(price_rows)}개(변경 {len(changed)}개), "
+            f"지표 {len(indicator_rows)}개 저장 완료"
+        )
+        return saved
         
     except Exception as e:
-        logger.error(f"❌ {symbol} 데이터 저장 실패: {e}")
+        logger.error(f"❌ {', '.join(frames)} 데이터 저장 실패: {e}")
         db.rollback()
         raise
     finally:
         db.close()
 
 
-def main():
+def save_stock_data(symbol: str, df: pd.DataFrame) -> None:
+    """주가 및 기술적 지표 데이터 저장 (단일 종목)"""
+    save_stock_batch({symbol: df})
+
+
+def get_last_stored_dates() -> Dict[str, date]:
+    """종목별 마지막 저장 거래일 조회 (단일 집계 쿼리)"""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(Stock.symbol, func.max(StockPrice.date))
+            .join(StockPrice, StockPrice.stock_id == Stock.id)
+            .group_by(Stock.symbol)
+            .all()
+        )
+        return {symbol: last_date for symbol, last_date in rows}
+    finally:
+        db.close()
+
+
+def plan_fetch_ranges(
+    symbols: List[str],
+    last_dates: Dict[str, date],
+    end_date: date,
+    full: bool = False
+) -> Tuple[List[Tuple[str, date, date]], Dict[str, date]]:
+    """종목별 수집 구간과 저장 시작일 결정
+
+    - 전체 모드 또는 저장 이력이 없는 종목: 최근 FULL_HISTORY_DAYS 전체
+    - 증분 모드: 마지막 저장일 이후 누락 구간 + 지표 워밍업 구간
+      (마지막 저장일도 다시 저장해 장중 수집 등으로 바뀐 값을 보정)
+    """
+    requests = []
+    write_from = {}
+    
+    for symbol in symbols:
+        last_date = last_dates.get(symbol)
+        
+        if full or last_date is None:
+            requests.append((symbol, end_date - timedelta(days=FULL_HISTORY_DAYS), end_date))
+            continue
+        
+        if last_date >= end_date:
+            continue  # 이미 최신
+        
+        requests.append((symbol, last_date - timedelta(days=INDICATOR_WARMUP_DAYS), end_date))
+        write_from[symbol] = last_date
+    
+    return requests, write_from
+
+
+def advance_snapshot_bar(state: StreamingState, history: pd.DataFrame, trade_date: date) -> Tuple[StreamingState, pd.DataFrame]:
+    """저장된 지표 상태에 스냅샷 일봉 하나를 반영해 (새 상태, 저장용 1행 DataFrame) 반환
+
+    history는 스냅샷 일봉을 마지막 행으로 붙인 짧은 이력이며 확장 지표 계산에만 쓴다.
+    """
+    bar = history.iloc[-1]
+    new_state, values = advance(state, bar['Close'], trade_date)
+    extended = compute_indicators(history, long_format_indicators())
+    row = {
+        'Date': pd.Timestamp(trade_date),
+        **{column: bar[column] for column in OHLCV_COLUMNS},
+        **values,
+        **{name: series.iloc[-1] for name, series in extended.items()},
+    }
+    return new_state, pd.DataFrame([row])
+
+
+def resume_state(state: Optional[StreamingState], data: pd.DataFrame) -> Optional[StreamingState]:
+    """저장된 지표 상태를 받은 일봉 중 상태 이후 봉으로 전진
+
+    증분 수집은 워밍업 구간만 받으므로 그 구간으로 상태를 새로 만들면 EMA가 구간 시작점에 고정되어
+    전체 이력 계산(rebuild_indicators)과 달라진다. 상태의 마지막 봉이 받은 일봉에 같은 종가로 있을 때만
+    이어서 전진하고, 아니면 None (상태를 저장하지 않고 다음 이력 재계산 때 저장 이력 전체로 다시 만든다).
+    """
+    if state is None or state.last_date is None or not state.closes:
+        return None
+    dates = data.index.date
+    known = data.loc[dates <= state.last_date, 'Close']
+    if known.empty or known.index[-1].date() != state.last_date or float(known.iloc[-1]) != state.closes[-1]:
+        return None
+    for bar_date, close in data.loc[dates > state.last_date, 'Close'].items():
+        if pd.isna(close):
+            continue
+        state, _ = advance(state, close, bar_date.date())
+    return state
+
+
+def load_symbol_states(symbols: List[str]) -> Dict[str, StreamingState]:
+    """종목 코드별 저장된 지표 상태"""
+    if not symbols:
+        return {}
+    db = SessionLocal()
+    try:
+        stock_ids = dict(db.query(Stock.symbol, Stock.id).filter(Stock.symbol.in_(symbols)).all())
+        states = load_states(db, stock_ids.values())
+    finally:
+        db.close()
+    return {symbol: states[stock_id] for symbol, stock_id in stock_ids.items() if stock_id in states}
+
+
+def ingest_snapshot(
+    listing_df: pd.DataFrame,
+    symbols: List[str],
+    last_dates: Dict[str, date],
+    fetcher: ConcurrentFetcher,
+    recent: Optional[Dict[str, pd.DataFrame]] = None,
+    dirty: Optional[DirtySet] = None
+) -> Tuple[List[str], List[str]]:
+    """상장종목 목록 스냅샷으로 최신 거래일 저장
+
+    직전 거래일까지의 지표 상태가 있는 종목은 당일 종가 하나로 지표를 전진시키고,
+    나머지는 저장된 이력에 당일 일봉을 이어 붙여 다시 계산한다. 어느 쪽이든 종목별 네트워크 호출이 없다.
+    (저장 성공 종목 목록, 종목별 이력 수집이 필요한 종목 목록)을 반환한다.
+    recent가 주어지면 이력을 다시 계산한 종목의 최근 일봉+지표를 채운다
+    (지표 상태로 전진한 종목은 과거 지표가 메모리에 없어 제외). dirty는 save_stock_batch로 전달된다.
+    """
+    if not symbols:
+        return [], symbols
+    
+    bars = listing_bars(listing_df)
+    
+    # 기준 종목 1개만 조회해 스냅샷의 거래일과 직전 거래일을 확정
+    probe_symbol = symbols[0]
+    today = date.today()
+    probe = fetcher.fetch_one(probe_symbol, today - timedelta(days=14), today)
+    trade_date, previous_date = resolve_trade_dates(probe.data)
+    
+    if trade_date is None:
+        logger.warning(f"⚠️ 스냅샷 거래일 확인 실패 ({probe_symbol}): 종목별 수집으로 대체")
+        return [], symbols
+    
+    if probe_symbol in bars.index and abs(float(probe.data['Close'].iloc[-1]) - bars.loc[probe_symbol, 'Close']) > 1e-6:
+        logger.warning(f"⚠️ 스냅샷 종가가 {trade_date} 일봉과 다름: 종목별 수집으로 대체")
+        return [], symbols
+    
+    snapshot_symbols, fallback = split_snapshot_universe(symbols, bars, last_dates, trade_date, previous_date)
+    logger.info(f"📸 {trade_date} 스냅샷 적용: {len(snapshot_symbols)}개, 종목별 수집 필요: {len(fallback)}개")
+    
+    # 지표 워밍업용 저장 이력을 한 번에 조회
+    db = SessionLocal()
+    try:
+        stock_ids = dict(
+            db.query(Stock.symbol, Stock.id).filter(Stock.symbol.in_(snapshot_symbols)).all()
+        )
+        stored_states = load_states(db, stock_ids.values())
+        
+        # 직전 거래일 봉까지 반영된 상태가 있으면 이력 없이 한 봉만 전진
+        streaming = {
+            symbol for symbol in snapshot_symbols
+            if symbol in stock_ids
+            and last_dates.get(symbol) == previous_date
+            and getattr(stored_states.get(stock_ids[symbol]), 'last_date', None) == previous_date
+        }
+        # 상태를 새로 만드는 종목은 저장 이력 전체 (워밍업 구간으로 만든 상태는 전체 재계산과 다름)
+        histories = load_price_history(
+            db,
+            [stock_ids[symbol] for symbol in snapshot_symbols if symbol in stock_ids and symbol not in streaming]
+        )
+        histories.update(load_price_history(
+            db,
+            [stock_ids[symbol] for symbol in streaming],
+            since=trade_date - timedelta(days=LONG_FORMAT_HISTORY_DAYS)
+        ))
+    finally:
+        db.close()
+    
+    frames = {}
+    states = {}
+    for symbol in snapshot_symbols:
+        try:
+            df = append_snapshot_bar(histories.get(stock_ids.get(symbol)), bars.loc[symbol], trade_date)
+            if symbol in streaming:
+                states[symbol], frames[symbol] = advance_snapshot_bar(stored_states[stock_ids[symbol]], df, trade_date)
+                continue
+            
+            states[symbol] = seed_state(df['Close'], trade_date)
+            df = prepare_stock_data(df)
+            frames[symbol] = df[df['Date'].dt.date >= trade_date]
+            if recent is not None:
+                recent[symbol] = df.tail(RECENT_FRAME_ROWS)
+        except Exception as e:
+            logger.error(f"❌ {symbol} 스냅샷 지표 계산 실패: {e}")
+            states.pop(symbol, None)
+            frames.pop(symbol, None)
+            fallback.append(symbol)
+    
+    logger.info(f"⚡ 지표 상태 전진: {len(streaming & set(frames))}개, 이력 재계산: {len(frames) - len(streaming & set(frames))}개")
+    
+    try:
+        saved = save_stock_batch(frames, states, dirty)
+    except Exception as e:
+        logger.error(f"❌ 스냅샷 저장 실패, 종목별 수집으로 대체: {e}")
+        if recent is not None:
+            for symbol in frames:
+                recent.pop(symbol, None)
+        return [], fallback + list(frames)
+    
+    # 저장되지 않은 종목은 종목별 수집 경로에서 다시 처리 (실패도 그쪽에서 기록)
+    saved_set = set(saved)
+    unsaved = [symbol for symbol in frames if symbol not in saved_set]
+    if recent is not None:
+        for symbol in unsaved:
+            recent.pop(symbol, None)
+    return saved, fallback + unsaved
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="일별 주식 데이터 수집")
+    parser.add_argument("--source", default=settings.COLLECT_DATA_SOURCE,
+                        help="데이터 소스 (fdr, fake)")
+    parser.add_argument("--workers", type=int, default=settings.COLLECT_MAX_WORKERS,
+                        help="동시 수집 워커 수")
+    parser.add_argument("--rate-limit", type=float, default=settings.COLLECT_RATE_LIMIT,
+                        help="초당 최대 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--write-batch", type=int, default=settings.COLLECT_WRITE_BATCH_SIZE,
+                        help="한 번에 묶어 저장할 종목 수")
+    parser.add_argument("--cache-dir", default=settings.COLLECT_CACHE_DIR,
+                        help="원본 일봉 캐시 경로")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="원본 일봉 캐시 사용 안 함")
+    parser.add_argument("--shard", type=parse_shard, default=ShardSpec(),
+                        help="샤드 지정 'i/N' (종목 코드 해시로 N개 작업에 분배, 예: 0/4)")
+    parser.add_argument("--full", action="store_true",
+                        help="증분 수집 대신 전체 기간 재수집 (재구축용)")
+    parser.add_argument("--snapshot", action="store_true",
+                        help="상장종목 목록 스냅샷으로 최신 거래일 저장 (누락/신규 종목만 종목별 수집)")
+    parser.add_argument("--restart", action="store_true",
+                        help="오늘 수집 기록을 무시하고 모든 종목을 처음부터 수집")
+    parser.add_argument("--force", action="store_true",
+                        help="휴장일에도 실행 (최근 거래일 기준)")
+    return parser.parse_args(argv)
+
+
+def run_collection(args: argparse.Namespace) -> CollectionResult:
+    """수집 실행 (저장에 성공한 종목의 최근 일봉+지표를 결과에 담아 다음 단계로 전달)
+
+    휴장일에는 네트워크 호출 없이 빈 결과를 반환한다 (--force 제외).
+    수집 기준일은 거래일 달력의 최근 거래일이라 이미 그날까지 저장된 종목은 요청하지 않는다.
+    """
+    start_time = datetime.now()
+    
+    calendar = load_trading_calendar()
+    if skip_if_closed(calendar, force=args.force):
+        return CollectionResult()
+    
+    # 1. 상위 종목 리스트 가져오기
+    listing_df = get_krx_listing()
+    stocks_list = get_top_stocks(settings.MAX_STOCKS, listing_df)
+    
+    # 2. 종목 마스터 업데이트 (샤드 실행시 자기 샤드 종목만)
+    update_stocks_master(stocks_list, args.shard)
+    stocks_list = [s for s in stocks_list if args.shard.contains(s['symbol'])]
+    if args.shard.count > 1:
+        logger.info(f"🧩 샤드 {args.shard.label}: {len(stocks_list)}개 종목 담당")
+    
+    # 3. 개별 종목 데이터 병렬 수집
+    source = get_data_source(args.source)
+    cache = None
+    if args.cache_dir and not args.no_cache:
+        cache = CachedDataSource(source, args.cache_dir, settings.COLLECT_CACHE_TODAY_TTL_SECONDS)
+        source = cache
+    
+    fetcher = ConcurrentFetcher(
+        source,
+        max_workers=args.workers,
+        rate_limit=args.rate_limit,
+        max_retries=settings.COLLECT_MAX_RETRIES
+    )
+    logger.info(f"⚙️ 워커 {fetcher.max_workers}개, 초당 {args.rate_limit}건 제한으로 수집")
+    
+    end_date = calendar.latest_trading_day()
+    names = {s['symbol']: s['name'] for s in stocks_list}
+    last_dates = {} if args.full else get_last_stored_dates()
+    result = CollectionResult(universe=list(names))
+    
+    # 실행 원장: 오늘 이미 완료한 종목은 건너뛰고 남은 종목만 수집
+    ledger = RunLedger(SessionLocal, end_date, args.shard.label)
+    symbols = ledger.start(list(names), restart=args.restart or args.full)
+    
+    # 3-1. 스냅샷 모드: 목록 한 번으로 최신 거래일 처리, 나머지만 종목별 수집
+    if args.snapshot and not args.full:
+        saved, symbols = ingest_snapshot(
+            listing_df, symbols, last_dates, fetcher, result.recent_frames, result.dirty
+        )
+        ledger.mark_done(*saved)
+        result.success += len(saved)
+    
+    requests, write_from = plan_fetch_ranges(symbols, last_dates, end_date, full=args.full)
+    
+    # 이미 최신 상태인 종목은 완료 처리
+    requested = {symbol for symbol, _, _ in requests}
+    ledger.mark_done(*[symbol for symbol in symbols if symbol not in requested])
+    
+    mode = "전체" if args.full else "증분"
+    logger.info(
+        f"🗂️ {mode} 수집: 대상 {len(requests)}개 "
+        f"(증분 {len(write_from)}개, 최신 상태 생략 {len(symbols) - len(requests)}개)"
+    )
+    
+    states = {}
+    computed = {}
+    stored_states = load_symbol_states(list(write_from))
+    
+    def compute(fetched) -> pd.DataFrame:
+        if fetched.data is not None and not fetched.data.empty:
+            if fetched.symbol in write_from:
+                # 워밍업 구간만 받았으므로 저장된 상태를 이어서 전진 (이어지지 않으면 상태 저장 생략)
+                state = resume_state(stored_states.get(fetched.symbol), fetched.data)
+            else:
+                # 저장할 이력 전체를 받았으므로 처음부터 상태를 만들어 다음 스냅샷 실행부터 한 봉씩 갱신
+                state = seed_state(fetched.data['Close'], fetched.data.index[-1].date())
+            if state is not None:
+                states[fetched.symbol] = state
+        df = prepare_stock_data(fetched.data)
+        computed[fetched.symbol] = df.tail(RECENT_FRAME_ROWS)
+        if fetched.symbol in write_from and not df.empty:
+            # 워밍업 구간은 지표 계산에만 쓰고 저장하지 않음
+            df = df[df['Date'].dt.date >= write_from[fetched.symbol]]
+        if df.empty:
+            raise ValueError("데이터 없음")
+        return df
+    
+    def write(frames: Dict[str, pd.DataFrame]) -> List[str]:
+        return save_stock_batch(
+            frames,
+            {symbol: states[symbol] for symbol in frames if symbol in states},
+            result.dirty
+        )
+    
+    outcome = {'success': 0, 'fail': 0}
+    
+    def on_written(symbols: List[str]) -> None:
+        ledger.mark_done(*symbols)
+        for symbol in symbols:
+            if symbol in computed:
+                result.recent_frames[symbol] = computed.pop(symbol)
+        outcome['success'] += len(symbols)
+        done = outcome['success'] + outcome['fail']
+        logger.info(f"⏳ 진행률: {done}/{len(requests)}개 ({done / len(requests) * 100:.1f}%)")
+    
+    def on_failed(symbol: str, error: str) -> None:
+        logger.error(f"❌ {symbol} ({names.get(symbol)}) 처리 실패: {error}")
+        ledger.mark_failed(symbol, error)
+        computed.pop(symbol, None)
+        outcome['fail'] += 1
+    
+    # 수집 → 지표 계산 → 저장 단계를 겹쳐 실행 (저장은 여러 종목씩 묶어서)
+    pipeline = CollectionPipeline(
+        fetcher,
+        compute=compute,
+        write=write,
+        on_written=on_written,
+        on_failed=on_failed,
+        write_batch_size=args.write_batch
+    )
+    pipeline.run(requests)
+    result.success += outcome['success']
+    result.failed += outcome['fail']
+    
+    # 완료 통계
+    counts = ledger.finish()
+    elapsed_time = datetime.now() - start_time
+    logger.info(f"🎉 데이터 수집 완료!")
+    logger.info(f"성공: {result.success}개, 실패: {result.failed}개")
+    logger.info(f"🧾 변경된 데이터: {result.dirty.summary()}")
+    if cache is not None:
+        logger.info(f"🗄️ {cache.stats.summary()}")
+    logger.info(f"원장 기준 {end_date}: 완료 {counts['done']}개, 실패 {counts['failed']}개, 미처리 {counts['pending']}개")
+    logger.info(f"소요 시간: {elapsed_time}")
+    
+    if result.failed > result.success * 0.1:  # 실패율 10% 초과시 경고
+        logger.warning(f"⚠️ 실패율이 높습니다: {result.failed/max(result.success + result.failed, 1)*100:.1f}%")
+    
+    return result
+
+
+def main(argv: Optional[List[str]] = None):
     """메인 함수"""
+    args = parse_args(argv)
     try:
         logger.info("🚀 일별 주식 데이터 수집 시작")
-        start_time = datetime.now()
-        
-        # 1. 상위 종목 리스트 가져오기
-        stocks_list = get_top_stocks(settings.MAX_STOCKS)
-        
-        # 2. 종목 마스터 업데이트
-        update_stocks_master(stocks_list)
-        
-        # 3. 개별 종목 데이터 수집
-        success_count = 0
-        fail_count = 0
-        
-        for i, stock_info in enumerate(stocks_list):
-            symbol = stock_info['symbol']
-            logger.info(f"📊 {i+1}/{len(stocks_list)} - {symbol} ({stock_info['name']}) 수집 중...")
-            
-            try:
-                df = collect_stock_data(symbol)
-                if not df.empty:
-                    save_stock_data(symbol, df)
-                    success_count += 1
-                else:
-                    fail_count += 1
-                    
-            except Exception as e:
-                logger.error(f"❌ {symbol} 처리 실패: {e}")
-                fail_count += 1
-                continue
-        
-        # 완료 통계
-        elapsed_time = datetime.now() - start_time
-        logger.info(f"🎉 데이터 수집 완료!")
-        logger.info(f"성공: {success_count}개, 실패: {fail_count}개")
-        logger.info(f"소요 시간: {elapsed_time}")
-        
-        if fail_count > success_count * 0.1:  # 실패율 10% 초과시 경고
-            logger.warning(f"⚠️ 실패율이 높습니다: {fail_count/len(stocks_list)*100:.1f}%")
+        run_collection(args)
         
     except Exception as e:
         logger.error(f"💥 데이터 수집 실패: {e}")
@@ -316,4 +713,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
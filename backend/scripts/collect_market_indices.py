@@ -3,18 +3,21 @@
 """
 import sys
 import os
+import argparse
 from datetime import datetime, date, timedelta
 import logging
 
 # 프로젝트 루트 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import pandas as pd
 import FinanceDataReader as fdr
 from sqlalchemy.orm import sessionmaker
 
 from app.core.database import engine
+from app.core.trading_calendar import invalidate_trading_calendar, load_trading_calendar, skip_if_closed
 from app.models import MarketIndex
+from app.collector.records import frame_to_records
+from app.collector.writer import bulk_upsert
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -22,6 +25,15 @@ logger = logging.getLogger(__name__)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# MarketIndex 컬럼명 → DataFrame 컬럼명
+MARKET_INDEX_COLUMNS = {
+    'date': 'Date',
+    'value': 'Close',
+    'change': 'Change',
+    'change_percent': 'Change_Pct',
+    'volume': 'Volume',
+}
+
 
 def collect_market_index(index_code: str, index_name: str, days: int = 30) -> None:
     """시장 지수 데이터 수집"""
@@ -47,38 +59,17 @@ def collect_market_index(index_code: str, index_name: str, days: int = 30) -> No
         df['Change'] = df['Close'].diff()
         df['Change_Pct'] = df['Close'].pct_change() * 100
         
-        saved_count = 0
-        for _, row in df.iterrows():
-            trade_date = row['Date'].date()
-            
-            # 기존 데이터 확인
-            existing = db.query(MarketIndex).filter(
-                MarketIndex.code == index_code,
-                MarketIndex.date == trade_date
-            ).first()
-            
-            if existing:
-                # 기존 데이터 업데이트
-                existing.value = float(row['Close'])
-                existing.change = float(row['Change']) if pd.notna(row['Change']) else None
-                existing.change_percent = float(row['Change_Pct']) if pd.notna(row['Change_Pct']) else None
-                existing.volume = int(row['Volume']) if 'Volume' in row and pd.notna(row['Volume']) else None
-            else:
-                # 새 데이터 추가
-                market_index = MarketIndex(
-                    code=index_code,
-                    name=index_name,
-                    date=trade_date,
-                    value=float(row['Close']),
-                    change=float(row['Change']) if pd.notna(row['Change']) else None,
-                    change_percent=float(row['Change_Pct']) if pd.notna(row['Change_Pct']) else None,
-                    volume=int(row['Volume']) if 'Volume' in row and pd.notna(row['Volume']) else None
-                )
-                db.add(market_index)
-            
-            saved_count += 1
+        # 컬럼 단위 변환 후 uk_market_index_code_date 기준 upsert
+        rows = frame_to_records(
+            df,
+            MARKET_INDEX_COLUMNS,
+            int_columns=('volume',),
+            constants={'code': index_code, 'name': index_name}
+        )
+        saved_count = bulk_upsert(db, MarketIndex, rows, ('code', 'date'))
         
         db.commit()
+        invalidate_trading_calendar()
         logger.info(f"✅ {index_name}: {saved_count}개 데이터 저장 완료")
         
     except Exception as e:
@@ -91,10 +82,18 @@ def collect_market_index(index_code: str, index_name: str, days: int = 30) -> No
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="시장 지수 데이터 수집")
+    parser.add_argument("--force", action="store_true",
+                        help="휴장일에도 실행")
+    args = parser.parse_args()
+    
     try:
         logger.info("🚀 시장 지수 데이터 수집 시작")
         start_time = datetime.now()
         
+        if skip_if_closed(load_trading_calendar(), force=args.force):
+            return
+        
         # 주요 지수 수집
         indices = [
             ("KS11", "코스피"),  # KOSPI
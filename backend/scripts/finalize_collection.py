@@ -0,0 +1,108 @@
+"""
+샤드 수집 완료 확인 스크립트 - 모든 샤드가 끝났을 때만 스크리닝 단계로 진행
+"""
+import sys
+import os
+import argparse
+from datetime import datetime, date
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import engine
+from app.core.trading_calendar import load_trading_calendar, skip_if_closed
+from app.models import CollectionRun
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def verify_shards(trade_date: date, shard_count: int, max_failure_rate: float = 0.1) -> bool:
+    """거래일의 모든 샤드 실행이 끝났고 실패율이 허용 범위인지 확인"""
+    db = SessionLocal()
+    try:
+        expected = ['all'] if shard_count == 1 else [f"{i}/{shard_count}" for i in range(shard_count)]
+        runs = {
+            run.shard: run
+            for run in db.query(CollectionRun).filter(
+                CollectionRun.trade_date == trade_date,
+                CollectionRun.shard.in_(expected)
+            )
+        }
+
+        ok = True
+        total = completed = failed = 0
+        for shard in expected:
+            run = runs.get(shard)
+            if run is None:
+                logger.error(f"❌ 샤드 {shard}: 실행 기록 없음")
+                ok = False
+                continue
+
+            if run.finished_at is None:
+                logger.error(f"❌ 샤드 {shard}: 아직 실행 중이거나 비정상 종료 (상태: {run.status})")
+                ok = False
+                continue
+
+            total += run.total_symbols
+            completed += run.completed_symbols
+            failed += run.failed_symbols
+            logger.info(
+                f"🧩 샤드 {shard}: {run.status} - 완료 {run.completed_symbols}/{run.total_symbols}개, "
+                f"실패 {run.failed_symbols}개"
+            )
+
+        if ok and total:
+            failure_rate = (total - completed) / total
+            logger.info(f"📊 전체: 완료 {completed}/{total}개, 실패 {failed}개 (미완료율 {failure_rate * 100:.1f}%)")
+            if failure_rate > max_failure_rate:
+                logger.error(f"❌ 미완료율이 허용치({max_failure_rate * 100:.0f}%)를 넘었습니다")
+                ok = False
+
+        return ok
+
+    finally:
+        db.close()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="샤드 수집 완료 확인")
+    parser.add_argument("--shards", type=int, required=True, help="전체 샤드 수")
+    parser.add_argument("--date", type=date.fromisoformat, default=None,
+                        help="확인할 거래일 (YYYY-MM-DD, 기본값: 최근 거래일)")
+    parser.add_argument("--max-failure-rate", type=float, default=0.1,
+                        help="허용할 미완료 종목 비율 (기본값: 0.1)")
+    args = parser.parse_args()
+
+    try:
+        if args.date is None:
+            # 휴장일에는 수집 샤드도 실행되지 않으므로 확인할 것이 없음
+            calendar = load_trading_calendar()
+            if skip_if_closed(calendar):
+                return
+            args.date = calendar.latest_trading_day()
+
+        logger.info(f"🔎 {args.date} 수집 샤드 {args.shards}개 완료 확인")
+        start_time = datetime.now()
+
+        if not verify_shards(args.date, args.shards, args.max_failure_rate):
+            logger.error("💥 수집이 완료되지 않아 후속 단계를 진행할 수 없습니다.")
+            sys.exit(1)
+
+        elapsed_time = datetime.now() - start_time
+        logger.info(f"✅ 모든 샤드 수집 완료 확인 (소요시간: {elapsed_time})")
+
+    except Exception as e:
+        logger.error(f"💥 수집 완료 확인 실패: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
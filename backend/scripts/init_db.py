@@ -25,7 +25,13 @@ def create_tables():
     print("- technical_indicators (기술적 지표)")
     print("- buy_signals (매수 신호)")
     print("- market_indices (시장 지수)")
+    print("- market_holidays (KRX 휴장일)")
     print("- market_summary (시장 요약)")
+    print("- collection_runs (수집 실행 기록)")
+    print("- collection_run_items (종목별 수집 상태)")
+    print("- stock_changes (종목별 데이터 변경 기록)")
+    print("- indicator_states (종목별 지표 계산 상태)")
+    print("- indicator_values (확장 지표 값)")
 
 
 def insert_sample_data():
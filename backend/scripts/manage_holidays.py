@@ -0,0 +1,83 @@
+"""
+KRX 휴장일 관리 스크립트 - 거래일 달력이 쓰는 market_holidays 테이블 등록/삭제/조회
+
+지수가 이미 저장된 날짜는 지수 일자로 거래일을 판정하므로,
+주로 아직 오지 않은 공휴일/대체공휴일/연말 휴장일을 미리 등록하는 데 쓴다.
+
+예) python scripts/manage_holidays.py --add 2026-12-31 "연말 휴장"
+"""
+import sys
+import os
+import argparse
+from datetime import date
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import engine
+from app.core.trading_calendar import build_trading_calendar, invalidate_trading_calendar
+from app.models import MarketHoliday
+from app.collector.writer import bulk_upsert
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="KRX 휴장일 관리")
+    parser.add_argument("--add", nargs=2, metavar=("DATE", "NAME"),
+                        help="휴장일 등록 (YYYY-MM-DD 이름)")
+    parser.add_argument("--remove", type=date.fromisoformat, metavar="DATE",
+                        help="휴장일 삭제 (YYYY-MM-DD)")
+    parser.add_argument("--year", type=int, default=date.today().year,
+                        help="조회할 연도 (기본값: 올해)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        if args.add:
+            day, name = date.fromisoformat(args.add[0]), args.add[1]
+            bulk_upsert(db, MarketHoliday, [{'date': day, 'name': name}], ('date',))
+            db.commit()
+            invalidate_trading_calendar()
+            logger.info(f"✅ 휴장일 등록: {day} ({name})")
+
+        if args.remove:
+            deleted = db.query(MarketHoliday).filter(MarketHoliday.date == args.remove).delete()
+            db.commit()
+            invalidate_trading_calendar()
+            logger.info(f"🗑️ 휴장일 삭제: {args.remove} ({deleted}건)")
+
+        holidays = (
+            db.query(MarketHoliday)
+            .filter(MarketHoliday.date >= date(args.year, 1, 1), MarketHoliday.date <= date(args.year, 12, 31))
+            .order_by(MarketHoliday.date)
+            .all()
+        )
+        logger.info(f"📅 {args.year}년 등록된 휴장일 {len(holidays)}개")
+        for holiday in holidays:
+            logger.info(f"  {holiday.date} ({holiday.name or '-'})")
+
+        calendar = build_trading_calendar(db)
+        logger.info(
+            f"🗓️ 오늘 {date.today()}: {'거래일' if calendar.is_trading_day(date.today()) else '휴장일'}, "
+            f"최근 거래일 {calendar.latest_trading_day()}, 다음 거래일 {calendar.next_trading_day()}"
+        )
+
+    except Exception as e:
+        logger.error(f"💥 휴장일 관리 실패: {e}")
+        db.rollback()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
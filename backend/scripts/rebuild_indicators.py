@@ -0,0 +1,183 @@
+"""
+기술적 지표 재구축 스크립트 - 저장된 주가로 technical_indicators / indicator_values 전체 재계산 (재수집 없음)
+
+지표 정의를 바꿨을 때 사용한다.
+- stock_prices를 (stock_id, date) 순 단일 쿼리로 나눠 받아 종목 단위로 분리
+- 종목 묶음을 프로세스 풀에 나눠 calculate_technical_indicators 실행
+- 결과는 메인 프로세스에서 묶음 단위로 대량 upsert (지표 상태도 함께 재생성)
+"""
+import sys
+import os
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import engine
+from app.models import Stock, StockPrice, TechnicalIndicator, IndicatorState, IndicatorValue
+from app.collector.dirty import record_changes
+from app.collector.history import iter_price_history
+from app.collector.records import indicator_records, indicator_value_records
+from app.collector.writer import bulk_upsert
+from app.indicators.registry import long_format_outputs
+from app.indicators.streaming import seed_state, state_record
+from collect_daily_data import calculate_technical_indicators
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def rebuild_batch(items: List[Tuple[int, pd.DataFrame]]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """종목 묶음의 지표 / 확장 지표 / 지표 상태 레코드 계산 (프로세스 풀 작업 단위)"""
+    indicator_rows = []
+    value_rows = []
+    state_rows = []
+    value_names = long_format_outputs()
+    for stock_id, history in items:
+        df = calculate_technical_indicators(history.reset_index())
+        indicator_rows.extend(indicator_records(df, stock_id))
+        value_rows.extend(indicator_value_records(df, stock_id, value_names))
+        state_rows.append(state_record(seed_state(history['Close'], history.index[-1].date()), stock_id))
+    return indicator_rows, value_rows, state_rows
+
+
+def count_targets(stock_ids: Optional[List[int]]) -> Tuple[int, int]:
+    """재구축 대상 (종목 수, 주가 행 수)"""
+    db = SessionLocal()
+    try:
+        query = db.query(func.count(func.distinct(StockPrice.stock_id)), func.count(StockPrice.id))
+        if stock_ids is not None:
+            query = query.filter(StockPrice.stock_id.in_(stock_ids))
+        return query.one()
+    finally:
+        db.close()
+
+
+def resolve_stock_ids(symbols: Optional[List[str]]) -> Optional[List[int]]:
+    """종목 코드 목록을 stock_id 목록으로 변환 (지정하지 않으면 전체)"""
+    if not symbols:
+        return None
+    db = SessionLocal()
+    try:
+        return [stock_id for (stock_id,) in db.query(Stock.id).filter(Stock.symbol.in_(symbols))]
+    finally:
+        db.close()
+
+
+def write_results(indicator_rows: List[Dict], value_rows: List[Dict], state_rows: List[Dict]) -> None:
+    """계산 결과 대량 upsert (지표가 바뀐 종목의 변경 시각도 갱신해 API 캐시가 새로 계산하게 함)"""
+    changed = [(row['stock_id'], row['date']) for row in indicator_rows]
+    db = SessionLocal()
+    try:
+        bulk_upsert(db, TechnicalIndicator, indicator_rows, ('stock_id', 'date'))
+        bulk_upsert(db, IndicatorValue, value_rows, ('stock_id', 'date', 'name'))
+        bulk_upsert(db, IndicatorState, state_rows, ('stock_id',))
+        record_changes(db, changed)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def rebuild_indicators(
+    stock_ids: Optional[List[int]] = None,
+    workers: Optional[int] = None,
+    batch_size: int = 50
+) -> Tuple[int, int]:
+    """저장된 주가로 지표 재계산 후 저장 (반환: 처리 종목 수, 저장 지표 행 수)"""
+    total_symbols, total_rows = count_targets(stock_ids)
+    logger.info(f"📦 대상: {total_symbols}개 종목, 주가 {total_rows:,}행")
+    if not total_symbols:
+        return 0, 0
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    done_symbols = 0
+    written_rows = 0
+    started = time.perf_counter()
+
+    def collect(finished) -> None:
+        nonlocal done_symbols, written_rows
+        for future in finished:
+            indicator_rows, value_rows, state_rows = future.result()
+            write_results(indicator_rows, value_rows, state_rows)
+            done_symbols += len(state_rows)
+            written_rows += len(indicator_rows)
+
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"⏳ 진행률: {done_symbols}/{total_symbols}개 ({done_symbols / total_symbols * 100:.1f}%), "
+            f"지표 {written_rows:,}행, {written_rows / elapsed:,.0f}행/초"
+        )
+
+    read_db = SessionLocal()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            batch = []
+            for item in iter_price_history(read_db, stock_ids):
+                batch.append(item)
+                if len(batch) < batch_size:
+                    continue
+
+                pending.add(executor.submit(rebuild_batch, batch))
+                batch = []
+                # 메모리 사용량을 묶음 수로 제한
+                if len(pending) >= max_pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(finished)
+
+            if batch:
+                pending.add(executor.submit(rebuild_batch, batch))
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+    finally:
+        read_db.close()
+
+    return done_symbols, written_rows
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="저장된 주가로 기술적 지표 재구축")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="작업 하나에 묶을 종목 수")
+    parser.add_argument("--symbols", nargs="*", default=None,
+                        help="재구축할 종목 코드 (기본값: 전체)")
+    args = parser.parse_args()
+
+    try:
+        logger.info("🔧 기술적 지표 재구축 시작")
+        start_time = datetime.now()
+
+        symbols, rows = rebuild_indicators(resolve_stock_ids(args.symbols), args.workers, args.batch_size)
+
+        elapsed_time = datetime.now() - start_time
+        rate = rows / max(elapsed_time.total_seconds(), 1e-9)
+        logger.info(f"🎉 지표 재구축 완료: {symbols}개 종목, 지표 {rows:,}행 ({rate:,.0f}행/초)")
+        logger.info(f"소요 시간: {elapsed_time}")
+
+    except Exception as e:
+        logger.error(f"💥 지표 재구축 실패: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
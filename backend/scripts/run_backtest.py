@@ -0,0 +1,87 @@
+"""
+백테스트 스크립트 - 저장된 주가/지표로 등록된 전략의 보유 기간별 성과 확인
+
+신호 강도 구간(50점 미만 / 50-79 / 80점 이상)별 수익률과 적중률을 비교해
+스크리닝 점수 기준(50점, 80점)이 실제로 의미가 있는지 확인한다.
+"""
+import sys
+import os
+import argparse
+from datetime import datetime
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.database import engine
+from app.screening.backtest import run_backtest
+from app.screening.strategies import STRATEGIES
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _percent(value, sign: bool = True) -> str:
+    if value is None:
+        return "-"
+    return f"{value:+.2f}%" if sign else f"{value:.1f}%"
+
+
+def log_report(report: dict) -> None:
+    """전략별 / 보유 기간별 / 신호 강도 구간별 성과 출력"""
+    logger.info(f"📅 진입 구간: {report['since']} ~ {report['until']}")
+    for result in report['strategies']:
+        logger.info(f"🎯 {result['strategy']} ({result['label']}): 진입 {result['entries']}건")
+        for horizon, stats in result['horizons'].items():
+            logger.info(
+                f"  {horizon:2d}일 보유 - {stats['trades']}건, "
+                f"평균 {_percent(stats['mean_return'])}, 중앙값 {_percent(stats['median_return'])}, "
+                f"적중률 {_percent(stats['hit_rate'], sign=False)}, "
+                f"평균 낙폭 {_percent(stats['avg_drawdown'])}, 최대 낙폭 {_percent(stats['max_drawdown'])}"
+            )
+            for bucket in stats['by_strength']:
+                if not bucket['trades']:
+                    continue
+                logger.info(
+                    f"    강도 {bucket['min_strength']:3d}-{bucket['max_strength']:3d}점: {bucket['trades']}건, "
+                    f"평균 {_percent(bucket['mean_return'])}, 적중률 {_percent(bucket['hit_rate'], sign=False)}"
+                )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="매수 신호 전략 백테스트")
+    parser.add_argument("--strategy", nargs="*", default=None, choices=list(STRATEGIES),
+                        help="백테스트할 전략 (기본값: 전체)")
+    parser.add_argument("--days", type=int, default=settings.DATA_RETENTION_DAYS,
+                        help="진입 구간 (달력일, 기본값: DATA_RETENTION_DAYS)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        logger.info("📈 백테스트 시작")
+        start_time = datetime.now()
+
+        report = run_backtest(db, args.strategy, args.days)
+        if not report['strategies']:
+            logger.info("📭 저장된 기술적 지표가 없습니다.")
+        else:
+            log_report(report)
+
+        logger.info(f"⏱️ 백테스트 완료 (소요시간: {datetime.now() - start_time})")
+
+    except Exception as e:
+        logger.error(f"💥 백테스트 실패: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+일일 배치 오케스트레이터 - 수집 → 스크리닝 → 시장 요약을 한 프로세스에서 의존 순서대로 실행
+
+- 각 스크립트를 별도 프로세스로 돌릴 때마다 반복되던 pandas/SQLAlchemy 로딩을 한 번으로 줄인다
+- 수집 단계가 실제로 바꾼 (stock_id, date) 집합(DirtySet)을 받아 바뀐 종목만 다시 스크리닝하고,
+  바뀐 데이터가 없으면 스크리닝/시장 요약을 생략한다
+- 수집 단계가 계산한 종목별 최근 일봉+지표 DataFrame을 스크리닝에 그대로 넘기고
+  (바뀐 종목이 모두 메모리에 있을 때만, 아니면 DB 스냅샷 사용)
+  당일 등락률을 시장 요약에 넘겨 DB 재조회를 피한다
+- 단계별 소요 시간을 마지막에 출력한다
+- 휴장일에는 아무 단계도 실행하지 않는다 (--force 제외)
+
+샤드 병렬 수집 후에는 --stages screening summary 로 나머지 단계만 한 프로세스에서 실행한다.
+이때는 최근 거래일 수집 실행이 시작된 뒤 기록된 StockChange로 변경 집합을 복원한다.
+"""
+import sys
+import os
+import argparse
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+# 프로젝트 루트 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func
+
+from app.collector.dirty import DirtySet, changes_since
+from app.core.orchestrator import Stage, run_stages
+from app.core.trading_calendar import load_trading_calendar, skip_if_closed
+from app.models import CollectionRun, Stock
+from app.screening.engine import snapshot_from_frames
+
+import collect_daily_data
+import run_screening
+import update_market_summary
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SessionLocal = collect_daily_data.SessionLocal
+
+STAGE_NAMES = ('collect', 'screening', 'summary')
+
+
+def collect_stage(args: argparse.Namespace):
+    def run(context: Dict[str, Any]) -> collect_daily_data.CollectionResult:
+        return collect_daily_data.run_collection(args)
+    return run
+
+
+def collected_changes(context: Dict[str, Any]) -> Tuple[Optional[collect_daily_data.CollectionResult], Optional[DirtySet]]:
+    """수집 단계 결과와 변경 집합
+
+    수집 단계를 같은 프로세스에서 실행하지 않았으면 최근 거래일 수집 실행(CollectionRun)이
+    처음 시작된 뒤 기록된 StockChange로 변경 집합을 복원한다. 실행 기록도 없으면 (None, None).
+    """
+    collection: Optional[collect_daily_data.CollectionResult] = context.get('collect')
+    if collection is not None:
+        return collection, collection.dirty
+
+    trade_date = load_trading_calendar().latest_trading_day()
+    db = SessionLocal()
+    try:
+        started_at = db.query(func.min(CollectionRun.started_at)).filter(
+            CollectionRun.trade_date == trade_date
+        ).scalar()
+        if started_at is None:
+            logger.info(f"📭 {trade_date} 수집 실행 기록이 없어 전 종목을 대상으로 합니다")
+            return None, None
+        dirty = changes_since(db, started_at)
+    finally:
+        db.close()
+
+    logger.info(f"🗂️ {trade_date} 수집 실행 이후 변경: {dirty.summary()}")
+    return None, dirty
+
+
+def screening_stage(context: Dict[str, Any]) -> Optional[List[dict]]:
+    """수집 단계가 바꾼 종목만 다시 스크리닝 (변경 집합을 알 수 없으면 전 종목, 바뀐 종목이 없으면 생략)
+
+    바뀐 종목의 최근 일봉+지표가 모두 메모리에 있으면 그 DataFrame으로, 아니면 DB에서 스냅샷을 만든다.
+    """
+    collection, dirty = collected_changes(context)
+    if dirty is None:
+        signals = run_screening.run_screening()
+        if signals is None:
+            raise RuntimeError("스크리닝 실패 (기존 신호 유지)")
+        if signals:
+            run_screening.save_screening_results(signals)
+        return signals
+
+    stock_ids = dirty.stock_ids
+    if not stock_ids:
+        logger.info("⏭️ 변경된 종목이 없어 스크리닝을 생략합니다 (기존 신호 유지)")
+        return None
+
+    trade_date = max(dirty.dates)
+    db = SessionLocal()
+    try:
+        stocks = {
+            symbol: (stock_id, name, sector)
+            for stock_id, symbol, name, sector in db.query(Stock.id, Stock.symbol, Stock.name, Stock.sector)
+            .filter(Stock.id.in_(stock_ids), Stock.is_active == True)
+        }
+    finally:
+        db.close()
+
+    snapshot = None
+    recent_frames = collection.recent_frames if collection is not None else {}
+    if all(symbol in recent_frames for symbol in stocks):
+        frames = {symbol: recent_frames[symbol] for symbol in stocks}
+        snapshot = snapshot_from_frames(frames, stocks, trade_date)
+        logger.info(f"🧠 수집 단계 DataFrame으로 스크리닝 ({trade_date}, 변경 종목 {len(snapshot)}개)")
+    else:
+        logger.info(f"🗄️ 변경 종목의 최근 지표가 메모리에 없어 DB 스냅샷으로 스크리닝 ({len(stock_ids)}개)")
+
+    signals = run_screening.run_screening(snapshot, stock_ids, trade_date)
+    if signals is None:
+        # 실패를 '신호 없음'으로 저장하면 바뀐 종목의 활성 신호가 지워지므로 단계를 실패로 남김
+        raise RuntimeError("변경 종목 스크리닝 실패 (기존 신호 유지)")
+    # 신호가 없어져도 바뀐 종목의 이전 활성 신호는 비활성화해야 하므로 빈 결과도 저장
+    run_screening.save_screening_results(signals, stock_ids, trade_date)
+    return signals
+
+
+def summary_stage(context: Dict[str, Any]) -> Optional[dict]:
+    """요약 거래일에 바뀐 데이터가 없으면 생략, 있으면 앞 단계 결과(등락률)를 써서 시장 요약 저장"""
+    collection, dirty = collected_changes(context)
+    changes = None
+    trade_date = None
+    if dirty is not None:
+        if not dirty:
+            logger.info("⏭️ 변경된 데이터가 없어 시장 요약 갱신을 생략합니다")
+            return None
+        trade_date = max(dirty.dates)
+        if collection is not None and collection.complete:
+            changes = [
+                df['change_percent'].iloc[-1]
+                for df in collection.recent_frames.values()
+                if not df.empty and df['Date'].iloc[-1].date() == trade_date
+            ]
+
+    # 신호 통계는 일부 종목만 다시 스크리닝했을 수 있으므로 저장된 신호 기준으로 계산
+    indices = update_market_summary.get_market_indices()
+    stats = update_market_summary.get_market_statistics(trade_date, changes)
+    if indices or stats:
+        update_market_summary.update_market_summary(indices, stats, trade_date)
+    else:
+        logger.warning("⚠️ 업데이트할 데이터가 없습니다.")
+    return stats
+
+
+def build_stages(args: argparse.Namespace) -> List[Stage]:
+    """단계 의존 관계 정의"""
+    return [
+        Stage('collect', collect_stage(args)),
+        Stage('screening', screening_stage, depends_on=('collect',)),
+        Stage('summary', summary_stage, depends_on=('collect', 'screening')),
+    ]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱 (수집 옵션은 collect_daily_data.py와 동일)"""
+    parser = argparse.ArgumentParser(description="일일 배치 (수집 → 스크리닝 → 시장 요약)")
+    parser.add_argument("--stages", nargs="+", choices=STAGE_NAMES, default=None,
+                        help="실행할 단계 (기본값: 전체)")
+    args, rest = parser.parse_known_args(argv)
+    collect_args = collect_daily_data.parse_args(rest)
+    collect_args.stages = args.stages
+    return collect_args
+
+
+def main(argv: Optional[List[str]] = None):
+    """메인 함수"""
+    args = parse_args(argv)
+    try:
+        logger.info("🚀 일일 배치 시작")
+        start_time = datetime.now()
+
+        if skip_if_closed(load_trading_calendar(), force=args.force):
+            return
+
+        report = run_stages(build_stages(args), only=args.stages)
+
+        elapsed_time = datetime.now() - start_time
+        logger.info(f"⏱️ 단계별 소요 시간: {report.summary()}")
+        logger.info(f"🎉 일일 배치 완료 (소요시간: {elapsed_time})")
+
+        if not report.ok:
+            failed = [timing.name for timing in report.timings if timing.status != 'done']
+            raise RuntimeError(f"완료되지 않은 단계: {', '.join(failed)}")
+
+    except Exception as e:
+        logger.error(f"💥 일일 배치 실패: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,28 @@
 """
-스크리닝 분석 스크립트 - RSI 과매도 + MACD 골든크로스
+스크리닝 분석 스크립트 - 등록된 전략(RSI 과매도 + MACD 골든크로스, SMA 골든크로스, 거래량 돌파)
+
+--backfill: 저장된 지표 기간 전체(기본 DATA_RETENTION_DAYS)를 한 번에 평가해 과거 신호를 채운다.
 """
 import sys
 import os
+import argparse
 from datetime import datetime, date, timedelta
+from typing import Iterable, Optional
 import logging
 
 # 프로젝트 루트 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import func
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import and_
 
+from app.core.config import settings
 from app.core.database import engine
-from app.models import Stock, TechnicalIndicator, BuySignal
+from app.core.trading_calendar import get_trading_calendar, load_trading_calendar, skip_if_closed
+from app.models import BuySignal, Stock, TechnicalIndicator
+from app.collector.writer import bulk_upsert
+from app.screening.engine import ScreeningSnapshot, load_snapshot, load_snapshot_panel
+from app.screening.strategies import MAX_SIGNALS, STRATEGIES, run_strategies
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -68,167 +77,163 @@ def calculate_signal_strength(rsi: float, macd: float, macd_signal: float, volum
         return 0
 
 
-def get_volume_ratio(symbol: str, current_volume: int, db) -> float:
-    """최근 20일 평균 거래량 대비 비율"""
+def run_screening(
+    snapshot: Optional[ScreeningSnapshot] = None,
+    stock_ids: Optional[Iterable[int]] = None,
+    trade_date: Optional[date] = None
+) -> Optional[list]:
+    """스크리닝 실행 (지표 스냅샷을 한 번 읽어 등록된 모든 전략을 평가)
+
+    snapshot이 주어지면 DB 조회 없이 그대로 평가한다 (수집 단계에서 메모리로 전달된 경우).
+    trade_date 기본값은 거래일 달력의 최근 거래일이다 (휴장일 실행시 직전 거래일 지표 사용).
+    stock_ids가 주어지면 해당 종목만 스냅샷을 읽어 평가한다 (변경된 종목만 다시 스크리닝).
+    전략별 신호 수 제한은 저장할 때 나머지 종목의 기존 신호와 합쳐 다시 적용한다 (save_screening_results).
+    실패하면 None을 반환한다 (빈 목록은 '조건을 만족하는 신호 없음'이므로 구분).
+    """
+    db = SessionLocal()
     try:
-        # 최근 20일 평균 거래량 조회
-        twenty_days_ago = date.today() - timedelta(days=30)
+        logger.info("🔍 스크리닝 분석 시작")
         
-        avg_volume = db.query(DailyPrice.volume).filter(
-            and_(
-                DailyPrice.symbol == symbol,
-                DailyPrice.trade_date >= twenty_days_ago,
-                DailyPrice.trade_date < date.today()
-            )
-        ).limit(20).all()
+        if snapshot is None:
+            # 활성 종목의 오늘 지표 스냅샷 + 거래량 비율
+            snapshot = load_snapshot(db, trade_date or get_trading_calendar(db).latest_trading_day(), stock_ids)
+        logger.info(f"📋 지표 스냅샷: {len(snapshot)}개 종목, 전략 {len(STRATEGIES)}개")
+        
+        # 전략별 조건 + 신호 강도 50점 이상, 전략별 상위 15개
+        signals = run_strategies(snapshot)
         
-        if not avg_volume:
-            return 1.0
+        for signal_type in STRATEGIES:
+            count = sum(1 for signal in signals if signal['signal_type'] == signal_type)
+            logger.info(f"🎯 {signal_type}: 유효한 매수 신호 {count}개")
         
-        avg_volume = sum([v[0] for v in avg_volume]) / len(avg_volume)
-        return current_volume / avg_volume if avg_volume > 0 else 1.0
+        return signals
         
     except Exception as e:
-        logger.error(f"거래량 비율 계산 실패: {e}")
-        return 1.0
+        logger.error(f"❌ 스크리닝 실행 실패: {e}")
+        return None
+    finally:
+        db.close()
 
 
-def run_screening() -> list:
-    """스크리닝 실행"""
+def run_backfill(days: int) -> list:
+    """저장된 최근 days일 지표 전체를 (종목, 거래일) 스냅샷 하나로 평가해 과거 신호 생성"""
     db = SessionLocal()
     try:
-        logger.info("🔍 스크리닝 분석 시작")
+        until = db.query(func.max(TechnicalIndicator.date)).scalar()
+        if until is None:
+            logger.warning("⚠️ 저장된 기술적 지표가 없습니다")
+            return []
+        since = until - timedelta(days=days)
         
-        # 오늘 날짜
-        today = date.today()
+        logger.info(f"🔍 과거 신호 백필 시작: {since} ~ {until}")
+        snapshot = load_snapshot_panel(db, since, until)
+        trading_days = len(set(snapshot.dates.tolist()))
+        logger.info(f"📋 지표 패널: {len(snapshot):,}행 ({trading_days}거래일), 전략 {len(STRATEGIES)}개")
         
-        # 스크리닝 조건: RSI <= 30 AND MACD > MACD_SIGNAL
-        query = db.query(TechnicalIndicator, Stock.name, Stock.sector, Stock.symbol, Stock.price).join(
-            Stock, TechnicalIndicator.stock_id == Stock.id
-        ).filter(
-            and_(
-                TechnicalIndicator.date == today,
-                TechnicalIndicator.rsi.isnot(None),
-                TechnicalIndicator.macd.isnot(None),
-                TechnicalIndicator.macd_signal.isnot(None),
-                TechnicalIndicator.rsi <= 30,  # RSI 과매도
-                TechnicalIndicator.macd > TechnicalIndicator.macd_signal,  # MACD 골든크로스
-                Stock.is_active == True
-            )
-        )
-        
-        candidates = query.all()
-        logger.info(f"📋 스크리닝 조건 만족: {len(candidates)}개 종목")
+        # 거래일마다 전략별 상위 15개 (일일 스크리닝과 같은 기준)
+        signals = run_strategies(snapshot)
         
-        if not candidates:
-            logger.info("조건을 만족하는 종목이 없습니다.")
-            return []
+        for signal_type in STRATEGIES:
+            count = sum(1 for signal in signals if signal['signal_type'] == signal_type)
+            logger.info(f"🎯 {signal_type}: 과거 신호 {count}개")
         
-        # 신호 강도 계산 및 정렬
-        signals = []
-        for indicator, stock_name, sector, symbol, price in candidates:
-            try:
-                # 거래량 비율 계산 (임시로 1.0으로 설정)
-                volume_ratio = 1.0  # TODO: 실제 거래량 비율 계산 구현
-                
-                # 신호 강도 계산
-                signal_strength = calculate_signal_strength(
-                    rsi=float(indicator.rsi),
-                    macd=float(indicator.macd),
-                    macd_signal=float(indicator.macd_signal),
-                    volume_ratio=volume_ratio
-                )
-                
-                if signal_strength >= 50:  # 최소 신호 강도
-                    signals.append({
-                        'symbol': symbol,
-                        'name': stock_name,
-                        'sector': sector,
-                        'signal_strength': signal_strength,
-                        'entry_price': price or 0.0,
-                        'rsi_value': float(indicator.rsi),
-                        'macd_value': float(indicator.macd),
-                        'macd_signal_value': float(indicator.macd_signal),
-                        'volume_ratio': volume_ratio
-                    })
-                    
-            except Exception as e:
-                logger.error(f"❌ {symbol} 신호 처리 실패: {e}")
-                continue
+        return signals
         
-        # 신호 강도순 정렬
-        signals.sort(key=lambda x: x['signal_strength'], reverse=True)
+    finally:
+        db.close()
+
+
+def signal_rows(db, signals: list, is_active: bool) -> list:
+    """신호 목록을 BuySignal 행으로 변환 (stock_id가 없는 신호는 종목 코드→id 맵 한 번으로 채움)"""
+    stock_ids = {}
+    missing = {signal['symbol'] for signal in signals if signal.get('stock_id') is None}
+    if missing:
+        stock_ids = dict(db.query(Stock.symbol, Stock.id).filter(Stock.symbol.in_(missing)).all())
+    
+    rows = []
+    for signal in signals:
+        stock_id = signal.get('stock_id') or stock_ids.get(signal['symbol'])
+        if stock_id is None:
+            logger.warning(f"⚠️ 종목 정보가 없습니다: {signal['symbol']}")
+            continue
+        rows.append({
+            'stock_id': stock_id,
+            'date': signal['date'],
+            'signal_type': signal['signal_type'],
+            'signal_strength': signal['signal_strength'],
+            'reason': signal['reason'],
+            'rsi': signal['rsi_value'],
+            'macd': signal['macd_value'],
+            'macd_signal': signal['macd_signal_value'],
+            'price': signal['entry_price'],
+            'volume': signal['volume'],
+            'is_active': is_active,
+        })
+    return rows
+
+
+def save_signal_history(signals: list) -> None:
+    """과거 신호 대량 upsert (새 행은 비활성, 이미 있는 행의 활성 여부는 유지)"""
+    db = SessionLocal()
+    try:
+        logger.info("💾 과거 신호 저장 중...")
         
-        logger.info(f"🎯 유효한 매수 신호: {len(signals)}개")
+        rows = signal_rows(db, signals, is_active=False)
+        update_columns = [c for c in rows[0] if c not in ('stock_id', 'date', 'signal_type', 'is_active')] if rows else None
+        saved_count = bulk_upsert(db, BuySignal, rows, ('stock_id', 'date', 'signal_type'), update_columns)
         
-        # 상위 15개만 저장 (여유분 포함)
-        return signals[:15]
+        db.commit()
+        logger.info(f"✅ 과거 신호 저장 완료: {saved_count}개")
         
     except Exception as e:
-        logger.error(f"❌ 스크리닝 실행 실패: {e}")
-        return []
+        logger.error(f"❌ 과거 신호 저장 실패: {e}")
+        db.rollback()
+        raise
     finally:
         db.close()
 
 
-def save_screening_results(signals: list) -> None:
-    """스크리닝 결과 저장"""
+def save_screening_results(
+    signals: list,
+    stock_ids: Optional[Iterable[int]] = None,
+    trade_date: Optional[date] = None
+) -> None:
+    """스크리닝 결과 저장 (기존 활성 신호 비활성화 후 uk_buy_signal_stock_date 기준 대량 upsert)
+
+    stock_ids가 주어지면 해당 종목만 다시 스크리닝한 결과로 보고 trade_date 신호를 합쳐 저장한다.
+    trade_date 이전의 활성 신호는 모두 비활성화하고, 다시 평가하지 않은 종목의 trade_date 신호와
+    이번 결과를 합친 뒤 전략별 상위 MAX_SIGNALS개만 활성으로 남긴다 (전 종목 스크리닝과 같은 기준).
+    """
     db = SessionLocal()
     try:
         logger.info("💾 스크리닝 결과 저장 중...")
         
-        today = date.today()
-        saved_count = 0
+        kept = []
+        if stock_ids is not None:
+            trade_date = trade_date or max((signal['date'] for signal in signals), default=None)
+            kept = db.query(BuySignal.id, BuySignal.signal_type, BuySignal.signal_strength).filter(
+                BuySignal.is_active == True,
+                BuySignal.date == trade_date,
+                ~BuySignal.stock_id.in_(list(stock_ids))
+            ).all()
+            signals, kept_ids = merge_active_signals(signals, kept)
         
-        # 기존 오늘 결과 비활성화
-        db.query(BuySignal).filter(BuySignal.date != today).update({'is_active': False})
+        # 현재 활성 신호만 비활성화 (idx_buy_signals_active 범위, 테이블 크기와 무관)
+        # 이번 결과는 아래 upsert에서 다시 활성화되고, 재실행 시 사라진 당일 신호는 비활성으로 남는다
+        deactivated = db.query(BuySignal).filter(BuySignal.is_active == True).update(
+            {'is_active': False}, synchronize_session=False
+        )
+        if kept:
+            # 다시 평가하지 않은 종목 중 상위권에 남은 trade_date 신호는 유지
+            deactivated -= db.query(BuySignal).filter(BuySignal.id.in_(kept_ids)).update(
+                {'is_active': True}, synchronize_session=False
+            )
         
-        # 새 결과 저장
-        for signal in signals:
-            # 종목 ID 조회
-            stock = db.query(Stock).filter(Stock.symbol == signal['symbol']).first()
-            if not stock:
-                continue
-                
-            # 기존 신호 확인
-            existing_signal = db.query(BuySignal).filter(
-                and_(
-                    BuySignal.stock_id == stock.id,
-                    BuySignal.date == today,
-                    BuySignal.signal_type == 'rsi_oversold_macd_golden'
-                )
-            ).first()
-            
-            if existing_signal:
-                # 기존 신호 업데이트
-                existing_signal.signal_strength = signal['signal_strength']
-                existing_signal.rsi = signal['rsi_value']
-                existing_signal.macd = signal['macd_value']
-                existing_signal.macd_signal = signal['macd_signal_value']
-                existing_signal.price = signal['entry_price']
-                existing_signal.is_active = True
-            else:
-                # 새 신호 생성
-                buy_signal = BuySignal(
-                    stock_id=stock.id,
-                    date=today,
-                    signal_type='rsi_oversold_macd_golden',
-                    signal_strength=signal['signal_strength'],
-                    reason=f"RSI 과매도({signal['rsi_value']:.1f}) + MACD 골든크로스",
-                    rsi=signal['rsi_value'],
-                    macd=signal['macd_value'],
-                    macd_signal=signal['macd_signal_value'],
-                    price=signal['entry_price'],
-                    is_active=True
-                )
-                db.add(buy_signal)
-            
-            saved_count += 1
-            
-            logger.info(f"📊 {signal['symbol']} ({signal['name']}): {signal['signal_strength']}점")
+        rows = signal_rows(db, signals, is_active=True)
+        saved_count = bulk_upsert(db, BuySignal, rows, ('stock_id', 'date', 'signal_type'))
         
         db.commit()
-        logger.info(f"✅ 스크리닝 결과 저장 완료: {saved_count}개")
+        logger.info(f"✅ 스크리닝 결과 저장 완료: {saved_count}개 (이전 활성 신호 {deactivated}개 비활성화)")
         
     except Exception as e:
         logger.error(f"❌ 스크리닝 결과 저장 실패: {e}")
@@ -238,14 +243,64 @@ def save_screening_results(signals: list) -> None:
         db.close()
 
 
+def merge_active_signals(signals: list, kept: list) -> tuple:
+    """새 신호와 유지할 기존 활성 신호(id, signal_type, signal_strength)를 합쳐 전략별 상위 MAX_SIGNALS개 선택
+
+    (남길 새 신호 목록, 남길 기존 신호 id 목록)을 반환한다. 같은 강도면 새 신호를 먼저 둔다.
+    """
+    candidates = [(signal['signal_type'], signal['signal_strength'], signal, None) for signal in signals]
+    candidates += [(signal_type, strength, None, signal_id) for signal_id, signal_type, strength in kept]
+    candidates.sort(key=lambda candidate: -candidate[1])
+    
+    counts = {}
+    merged, kept_ids = [], []
+    for signal_type, _, signal, signal_id in candidates:
+        if counts.get(signal_type, 0) >= MAX_SIGNALS:
+            continue
+        counts[signal_type] = counts.get(signal_type, 0) + 1
+        if signal is not None:
+            merged.append(signal)
+        else:
+            kept_ids.append(signal_id)
+    return merged, kept_ids
+
+
+def backfill(days: int) -> None:
+    """과거 신호 백필 실행"""
+    signals = run_backfill(days)
+    if signals:
+        save_signal_history(signals)
+    else:
+        logger.info("📭 기간 내 조건을 만족하는 신호가 없습니다.")
+
+
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="매수 신호 스크리닝")
+    parser.add_argument("--backfill", action="store_true",
+                        help="저장된 지표 기간 전체의 과거 신호 생성")
+    parser.add_argument("--days", type=int, default=settings.DATA_RETENTION_DAYS,
+                        help="백필 기간 (달력일, 기본값: DATA_RETENTION_DAYS)")
+    parser.add_argument("--force", action="store_true",
+                        help="휴장일에도 실행 (최근 거래일 기준)")
+    args = parser.parse_args()
+    
     try:
         logger.info("🚀 스크리닝 분석 시작")
         start_time = datetime.now()
         
+        if args.backfill:
+            backfill(args.days)
+            logger.info(f"⏱️ 백필 완료 (소요시간: {datetime.now() - start_time})")
+            return
+        
+        if skip_if_closed(load_trading_calendar(), force=args.force):
+            return
+        
         # 스크리닝 실행
         signals = run_screening()
+        if signals is None:
+            raise RuntimeError("스크리닝 실행 실패")
         
         if signals:
             # 결과 저장
@@ -253,9 +308,10 @@ def main():
             
             # 상위 10개 출력
             logger.info("🏆 오늘의 Top 10 매수 신호:")
-            for i, signal in enumerate(signals[:10], 1):
+            top_signals = sorted(signals, key=lambda x: x['signal_strength'], reverse=True)[:10]
+            for i, signal in enumerate(top_signals, 1):
                 logger.info(
-                    f"{i:2d}. {signal['symbol']} ({signal['name']}) "
+                    f"{i:2d}. {signal['symbol']} ({signal['name']}) [{signal['signal_type']}] "
                     f"- 강도: {signal['signal_strength']}점, "
                     f"RSI: {signal['rsi_value']:.1f}, "
                     f"거래량: {signal['volume_ratio']:.1f}배"
@@ -3,7 +3,9 @@
 """
 import sys
 import os
+import argparse
 from datetime import datetime, date
+from typing import List, Optional
 import logging
 from collections import Counter
 
@@ -15,6 +17,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy import func
 
 from app.core.database import engine
+from app.core.trading_calendar import load_trading_calendar, skip_if_closed
 from app.models.stock import Stock, StockPrice, BuySignal, MarketSummary
 
 # 로깅 설정
@@ -75,26 +78,39 @@ def get_market_indices() -> dict:
         return {}
 
 
-def get_market_statistics() -> dict:
-    """시장 통계 조회"""
+def get_market_statistics(
+    trade_date: Optional[date] = None,
+    changes: Optional[List[float]] = None,
+    signals: Optional[List[dict]] = None
+) -> dict:
+    """시장 통계 조회
+
+    trade_date 기본값은 거래일 달력의 최근 거래일이다.
+    changes(종목별 당일 등락률)나 signals(당일 스크리닝 신호)가 주어지면
+    앞 단계가 메모리로 넘긴 값을 그대로 쓰고 해당 항목은 DB를 조회하지 않는다.
+    """
     db = SessionLocal()
     try:
         logger.info("📈 시장 통계 계산 중...")
         
-        today = date.today()
+        today = trade_date or load_trading_calendar().latest_trading_day()
         stats = {}
         
         # 전체 종목 변동 통계 (SQLite 호환)
         try:
-            rising_count = db.query(func.count(StockPrice.id)).filter(
-                StockPrice.date == today,
-                StockPrice.change_percent > 0
-            ).scalar() or 0
-            
-            declining_count = db.query(func.count(StockPrice.id)).filter(
-                StockPrice.date == today,
-                StockPrice.change_percent < 0
-            ).scalar() or 0
+            if changes is not None:
+                rising_count = sum(1 for change in changes if change is not None and change > 0)
+                declining_count = sum(1 for change in changes if change is not None and change < 0)
+            else:
+                rising_count = db.query(func.count(StockPrice.id)).filter(
+                    StockPrice.date == today,
+                    StockPrice.change_percent > 0
+                ).scalar() or 0
+                
+                declining_count = db.query(func.count(StockPrice.id)).filter(
+                    StockPrice.date == today,
+                    StockPrice.change_percent < 0
+                ).scalar() or 0
             
             stats['rising_stocks'] = rising_count
             stats['declining_stocks'] = declining_count
@@ -105,14 +121,18 @@ def get_market_statistics() -> dict:
         
         # 신호 통계 (SQLite 호환)
         try:
-            total_signals = db.query(func.count(BuySignal.id)).filter(
-                BuySignal.date == today
-            ).scalar() or 0
-            
-            strong_signals = db.query(func.count(BuySignal.id)).filter(
-                BuySignal.date == today,
-                BuySignal.signal_strength >= 80
-            ).scalar() or 0
+            if signals is not None:
+                total_signals = len(signals)
+                strong_signals = sum(1 for signal in signals if signal['signal_strength'] >= 80)
+            else:
+                total_signals = db.query(func.count(BuySignal.id)).filter(
+                    BuySignal.date == today
+                ).scalar() or 0
+                
+                strong_signals = db.query(func.count(BuySignal.id)).filter(
+                    BuySignal.date == today,
+                    BuySignal.signal_strength >= 80
+                ).scalar() or 0
             
             stats['total_signals'] = total_signals
             stats['strong_signals'] = strong_signals
@@ -122,12 +142,15 @@ def get_market_statistics() -> dict:
             stats['strong_signals'] = 0
         
         # 섹터별 신호 분포
-        sector_signals = db.query(Stock.sector, func.count(BuySignal.id)).join(
-            BuySignal, Stock.id == BuySignal.stock_id
-        ).filter(BuySignal.date == today).group_by(Stock.sector).all()
+        if signals is not None:
+            sector_counter = Counter(signal['sector'] for signal in signals)
+        else:
+            sector_signals = db.query(Stock.sector, func.count(BuySignal.id)).join(
+                BuySignal, Stock.id == BuySignal.stock_id
+            ).filter(BuySignal.date == today).group_by(Stock.sector).all()
+            sector_counter = Counter(dict(sector_signals))
         
         # 상위 5개 섹터만
-        sector_counter = Counter(dict(sector_signals))
         top_sectors = sector_counter.most_common(5)
         stats['top_sectors'] = ','.join([f"{sector}:{count}" for sector, count in top_sectors])
         
@@ -141,13 +164,13 @@ def get_market_statistics() -> dict:
         db.close()
 
 
-def update_market_summary(indices: dict, stats: dict) -> None:
-    """시장 요약 정보 업데이트"""
+def update_market_summary(indices: dict, stats: dict, summary_date: Optional[date] = None) -> None:
+    """시장 요약 정보 업데이트 (summary_date 기본값: 최근 거래일)"""
     db = SessionLocal()
     try:
         logger.info("💾 시장 요약 정보 저장 중...")
         
-        today = date.today()
+        today = summary_date or load_trading_calendar().latest_trading_day()
         
         # 기존 데이터 확인
         existing = db.query(MarketSummary).filter(MarketSummary.summary_date == today).first()
@@ -203,10 +226,18 @@ def update_market_summary(indices: dict, stats: dict) -> None:
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description="시장 요약 정보 업데이트")
+    parser.add_argument("--force", action="store_true",
+                        help="휴장일에도 실행 (최근 거래일 기준)")
+    args = parser.parse_args()
+    
     try:
         logger.info("🚀 시장 요약 정보 업데이트 시작")
         start_time = datetime.now()
         
+        if skip_if_closed(load_trading_calendar(), force=args.force):
+            return
+        
         # 1. 시장 지수 조회
         indices = get_market_indices()
         
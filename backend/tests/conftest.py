@@ -0,0 +1,36 @@
+"""
+테스트 공통 설정 - 설정 필수값, 스크립트 import 경로, 인메모리 SQLite 세션
+"""
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+os.environ.setdefault("ENVIRONMENT", "production")
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, "scripts"))
+
+
+@pytest.fixture
+def session_factory():
+    """테스트마다 새로 만든 인메모리 SQLite 세션 팩토리 (전체 테이블 생성)"""
+    from app.core.database import Base
+    import app.models  # noqa: F401 - 테이블 등록
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
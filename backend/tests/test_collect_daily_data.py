@@ -0,0 +1,29 @@
+"""
+collect_daily_data.run_collection 테스트
+"""
+from datetime import date, timedelta
+
+import collect_daily_data
+from app.core.trading_calendar import TradingCalendar
+
+
+def closed_calendar() -> TradingCalendar:
+    """오늘 전후가 모두 휴장인 달력"""
+    today = date.today()
+    return TradingCalendar([], [], today - timedelta(days=7), today + timedelta(days=7))
+
+
+def test_run_collection_returns_empty_result_on_closed_day(monkeypatch):
+    monkeypatch.setattr(collect_daily_data, "load_trading_calendar", closed_calendar)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("휴장일에는 종목 목록을 조회하지 않아야 합니다")
+
+    monkeypatch.setattr(collect_daily_data, "get_krx_listing", fail)
+
+    result = collect_daily_data.run_collection(collect_daily_data.parse_args([]))
+
+    assert result.universe == []
+    assert result.success == 0 and result.failed == 0
+    assert not result.dirty
+    assert not result.complete
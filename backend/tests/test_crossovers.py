@@ -0,0 +1,127 @@
+"""
+교차 이벤트 탐지 테스트 - 상태 조건이 아니라 교차한 거래일만 찾는지, 종목별 루프와 같은 결과인지
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.models import Stock, TechnicalIndicator
+from app.screening.crossovers import (
+    CROSS_EVENTS, PANEL_COLUMNS, cross_age, cross_matrix, detect_crossovers, load_indicator_panel, panel_from_frame,
+)
+
+START = date(2026, 9, 1)
+
+
+def make_panel(series):
+    """{stock_id: {컬럼: 값 목록}} → 패널 (없는 컬럼은 NaN)"""
+    rows = []
+    for stock_id, columns in series.items():
+        length = len(next(iter(columns.values())))
+        for i in range(length):
+            rows.append({
+                'stock_id': stock_id, 'symbol': f"{stock_id:06d}", 'name': f"S{stock_id}", 'sector': None,
+                'date': START + timedelta(days=i),
+                **{column: columns.get(column, [np.nan] * length)[i] for column in PANEL_COLUMNS},
+            })
+    return panel_from_frame(pd.DataFrame(rows))
+
+
+def naive_crossings(fast, slow, upward=True):
+    """종목 하나의 교차 거래일 위치 (전일 fast <= slow, 당일 fast > slow)"""
+    if not upward:
+        fast, slow = slow, fast
+    return [
+        i for i in range(1, len(fast))
+        if not np.isnan([fast[i - 1], slow[i - 1], fast[i], slow[i]]).any()
+        and fast[i - 1] <= slow[i - 1] and fast[i] > slow[i]
+    ]
+
+
+def test_only_crossing_day_is_an_event():
+    panel = make_panel({1: {'macd': [-1, 0, 1, 2, 3, -1], 'macd_signal': [0, 0, 0, 0, 0, 0]}})
+
+    found = detect_crossovers(panel, ['macd_golden_cross', 'macd_dead_cross'], days=10)
+
+    # 같은 값(0 <= 0) 다음날 위로 올라선 날만 골든크로스, 신호선 위에 머무는 날은 제외
+    assert [(item['event'], item['date']) for item in found] == [
+        ('macd_dead_cross', START + timedelta(days=5)),
+        ('macd_golden_cross', START + timedelta(days=2)),
+    ]
+    assert found[1]['macd'] == 1.0 and found[1]['macd_signal'] == 0.0
+
+
+def test_rsi_level_crossing_and_missing_days():
+    panel = make_panel({
+        1: {'rsi': [25, 28, 35, 40, 20, np.nan, 45]},
+        2: {'rsi': [20, np.nan, 40, 50, 60, 70, 80]},
+    })
+
+    found = detect_crossovers(panel, ['rsi_oversold_exit'], days=10)
+
+    # 결측일 전후는 비교하지 않음
+    assert [(item['symbol'], item['date']) for item in found] == [('000001', START + timedelta(days=2))]
+
+
+def test_days_limits_to_recent_trading_days():
+    panel = make_panel({1: {'sma_20': [1, 3, 1, 3, 1, 3], 'sma_60': [2] * 6}})
+
+    recent = detect_crossovers(panel, ['sma_golden_cross'], days=2)
+    everything = detect_crossovers(panel, ['sma_golden_cross'], days=6)
+
+    assert [item['date'] for item in recent] == [START + timedelta(days=5)]
+    assert len(everything) == 3
+
+
+def test_unknown_event_raises():
+    panel = make_panel({1: {'macd': [0, 1], 'macd_signal': [0, 0]}})
+    with pytest.raises(ValueError):
+        detect_crossovers(panel, ['macd_golden_cross', 'nope'])
+
+
+def test_matches_per_stock_loop_on_random_panel():
+    rng = np.random.default_rng(3)
+    series = {}
+    for stock_id in range(1, 41):
+        columns = {column: rng.normal(0, 1, 60).cumsum() for column in ('macd', 'macd_signal', 'sma_20', 'sma_60')}
+        columns['rsi'] = rng.uniform(10, 60, 60)
+        columns['rsi'][rng.integers(0, 60, 3)] = 30.0
+        for values in columns.values():
+            values[rng.random(60) < 0.05] = np.nan
+        series[stock_id] = columns
+    panel = make_panel(series)
+
+    for name, event in CROSS_EVENTS.items():
+        crossed = cross_matrix(panel, event)
+        for col, stock_id in enumerate(panel.stock_ids):
+            fast = series[stock_id][event.fast]
+            slow = series[stock_id][event.slow] if isinstance(event.slow, str) else np.full(60, float(event.slow))
+            assert np.flatnonzero(crossed[:, col]).tolist() == naive_crossings(fast, slow, event.upward), name
+
+
+def test_cross_age_counts_trading_days_since_last_cross():
+    crossed = np.array([[False, False], [True, False], [False, False], [False, True], [True, False]])
+
+    ages = cross_age(crossed)
+
+    np.testing.assert_array_equal(ages[:, 0], [np.nan, 0, 1, 2, 0])
+    np.testing.assert_array_equal(ages[:, 1], [np.nan, np.nan, np.nan, 0, 1])
+
+
+def test_load_indicator_panel_reads_days_plus_one_trading_days(db):
+    db.add_all([
+        Stock(id=1, symbol='000001', name='A', market='KOSPI', is_active=True),
+        Stock(id=2, symbol='000002', name='B', market='KOSPI', is_active=False),
+    ])
+    for i in range(10):
+        for stock_id in (1, 2):
+            db.add(TechnicalIndicator(stock_id=stock_id, date=START + timedelta(days=i), macd=float(i), macd_signal=5.0))
+    db.commit()
+
+    panel = load_indicator_panel(db, days=3, until=START + timedelta(days=8))
+
+    assert panel.stock_ids.tolist() == [1]
+    assert [d.astype(date) for d in panel.dates] == [START + timedelta(days=i) for i in range(5, 9)]
+    assert detect_crossovers(panel, ['macd_golden_cross'], days=3)[0]['date'] == START + timedelta(days=6)
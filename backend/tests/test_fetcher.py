@@ -0,0 +1,93 @@
+"""
+동시 수집기 테스트 - 토큰 버킷 속도 제한, 재시도, 워커 수 제한
+"""
+import threading
+import time
+from collections import Counter
+from datetime import date
+
+import pandas as pd
+
+from app.collector.fetcher import ConcurrentFetcher, TokenBucket
+from app.collector.sources import DataSource
+
+START, END = date(2026, 1, 1), date(2026, 1, 31)
+
+
+class FlakySource(DataSource):
+    """종목별로 정해진 횟수만큼 실패한 뒤 성공하는 데이터 소스"""
+    name = "flaky"
+
+    def __init__(self, failures=None, latency: float = 0.0):
+        self.failures = failures or {}
+        self.latency = latency
+        self.calls = Counter()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_history(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        with self._lock:
+            self.calls[symbol] += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.latency)
+            if self.calls[symbol] <= self.failures.get(symbol, 0):
+                raise ConnectionError(f"{symbol}: 일시 오류")
+            return pd.DataFrame({'Close': [1.0]}, index=pd.DatetimeIndex([pd.Timestamp(end)], name='Date'))
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_token_bucket_without_limit_never_waits():
+    bucket = TokenBucket(0)
+    assert all(bucket.acquire() == 0.0 for _ in range(100))
+
+
+def test_token_bucket_allows_burst_then_limits_rate():
+    bucket = TokenBucket(rate=50, capacity=5)
+    started = time.monotonic()
+    waits = [bucket.acquire() for _ in range(15)]
+    elapsed = time.monotonic() - started
+
+    assert waits[:5] == [0.0] * 5
+    # 버스트 5개 이후 10개는 초당 50개 속도 (0.2초) 이상 걸림
+    assert elapsed >= 10 / 50 * 0.9
+
+
+def test_fetch_one_retries_until_success():
+    source = FlakySource({'A': 2})
+    fetcher = ConcurrentFetcher(source, rate_limit=0, max_retries=3, backoff_base=0)
+
+    result = fetcher.fetch_one('A', START, END)
+
+    assert result.ok and result.attempts == 3
+    assert not result.data.empty
+    assert source.calls['A'] == 3
+
+
+def test_fetch_one_gives_up_after_max_retries():
+    source = FlakySource({'A': 10})
+    fetcher = ConcurrentFetcher(source, rate_limit=0, max_retries=2, backoff_base=0)
+
+    result = fetcher.fetch_one('A', START, END)
+
+    assert not result.ok and "일시 오류" in result.error
+    assert result.attempts == 3 and source.calls['A'] == 3
+    assert result.data.empty
+
+
+def test_fetch_many_returns_every_symbol_within_worker_limit():
+    symbols = [f"{i:06d}" for i in range(20)]
+    source = FlakySource({symbols[0]: 1, symbols[5]: 5}, latency=0.01)
+    fetcher = ConcurrentFetcher(source, max_workers=4, rate_limit=0, max_retries=1, backoff_base=0)
+
+    results = {result.symbol: result for result in fetcher.fetch_many((s, START, END) for s in symbols)}
+
+    assert set(results) == set(symbols)
+    assert results[symbols[0]].ok and results[symbols[0]].attempts == 2
+    assert not results[symbols[5]].ok
+    assert sum(result.ok for result in results.values()) == 19
+    assert source.peak <= 4
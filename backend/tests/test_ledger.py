@@ -0,0 +1,72 @@
+"""
+수집 실행 원장 테스트 - 중단 후 재개, 실패 종목 재시도, restart, 샤드별 원장 분리
+"""
+from datetime import date
+
+from app.collector.ledger import DONE, FAILED, PENDING, RunLedger
+from app.models import CollectionRun
+
+TRADE_DATE = date(2026, 10, 16)
+SYMBOLS = ['000001', '000002', '000003', '000004']
+
+
+def test_resume_skips_done_symbols_and_retries_failed(session_factory):
+    ledger = RunLedger(session_factory, TRADE_DATE)
+    assert ledger.start(SYMBOLS) == SYMBOLS
+    ledger.mark_done('000001', '000002')
+    ledger.mark_failed('000003', "네트워크 오류")
+    # 여기서 중단되었다고 보고 새 원장으로 같은 거래일 재실행
+
+    resumed = RunLedger(session_factory, TRADE_DATE)
+    assert resumed.start(SYMBOLS) == ['000003', '000004']
+    assert resumed.run_id == ledger.run_id
+    assert resumed.progress() == {DONE: 2, FAILED: 1, PENDING: 1}
+
+    resumed.mark_done('000003', '000004')
+    assert resumed.finish() == {DONE: 4, FAILED: 0, PENDING: 0}
+
+    db = session_factory()
+    run = db.get(CollectionRun, resumed.run_id)
+    assert (run.status, run.total_symbols, run.completed_symbols) == ('completed', 4, 4)
+    assert run.finished_at is not None
+    db.close()
+
+
+def test_partial_run_and_restart(session_factory):
+    ledger = RunLedger(session_factory, TRADE_DATE)
+    ledger.start(SYMBOLS)
+    ledger.mark_done(*SYMBOLS[:3])
+    ledger.mark_failed(SYMBOLS[3], "x" * 1000)
+    assert ledger.finish() == {DONE: 3, FAILED: 1, PENDING: 0}
+    db = session_factory()
+    assert db.get(CollectionRun, ledger.run_id).status == 'partial'
+    db.close()
+
+    restarted = RunLedger(session_factory, TRADE_DATE)
+    assert restarted.start(SYMBOLS, restart=True) == SYMBOLS
+    assert restarted.progress() == {DONE: 0, FAILED: 0, PENDING: 4}
+
+
+def test_symbols_dropped_from_universe_are_cleared(session_factory):
+    ledger = RunLedger(session_factory, TRADE_DATE)
+    ledger.start(SYMBOLS)
+    ledger.mark_done('000001')
+
+    # 시가총액 순위 변동으로 대상이 바뀐 재실행: 빠진 미완료 종목은 정리, 완료 기록은 유지
+    resumed = RunLedger(session_factory, TRADE_DATE)
+    assert resumed.start(['000001', '000002', '000005']) == ['000002', '000005']
+    assert resumed.progress() == {DONE: 1, FAILED: 0, PENDING: 2}
+
+
+def test_shards_and_trade_dates_have_separate_runs(session_factory):
+    first = RunLedger(session_factory, TRADE_DATE, '0/2')
+    second = RunLedger(session_factory, TRADE_DATE, '1/2')
+    next_day = RunLedger(session_factory, date(2026, 10, 19), '0/2')
+    first.start(SYMBOLS[:2])
+    second.start(SYMBOLS[2:])
+    first.mark_done(*SYMBOLS[:2])
+
+    assert len({first.run_id, second.run_id}) == 2
+    assert second.progress() == {DONE: 0, FAILED: 0, PENDING: 2}
+    assert next_day.start(SYMBOLS[:2]) == SYMBOLS[:2]
+    assert next_day.run_id not in (first.run_id, second.run_id)
@@ -0,0 +1,51 @@
+"""
+스크리닝 점수 테스트 - 벡터화 signal_strength가 종목별 calculate_signal_strength와 같은 결과인지
+"""
+import numpy as np
+
+from app.screening.engine import signal_strength
+from run_screening import calculate_signal_strength
+
+RSI_BOUNDARIES = [20.0, 25.0, 30.0, 35.0, 70.0]
+VOLUME_BOUNDARIES = [1.0, 1.2, 1.5, 2.0]
+
+
+def random_inputs(size: int, seed: int):
+    """경계값과 NaN을 섞은 임의 스냅샷 배열 (rsi, macd, macd_signal, volume_ratio)"""
+    rng = np.random.default_rng(seed)
+    rsi = rng.uniform(0, 100, size)
+    macd_signal = rng.normal(0, 50, size)
+    macd = macd_signal + rng.normal(0, 10, size)
+    volume_ratio = rng.uniform(0, 3, size)
+
+    boundary = rng.random(size) < 0.2
+    rsi[boundary] = rng.choice(RSI_BOUNDARIES, boundary.sum())
+    volume_ratio[:size // 5] = rng.choice(VOLUME_BOUNDARIES, size // 5)
+    # MACD 골든크로스 강도 경계 (차이가 신호선의 0 / 5% / 10%)
+    edge = slice(size // 5, 2 * size // 5)
+    macd[edge] = macd_signal[edge] * (1 + rng.choice([0.0, 0.05, 0.1], edge.stop - edge.start))
+
+    for values in (rsi, macd, macd_signal, volume_ratio):
+        values[rng.random(size) < 0.05] = np.nan
+    return rsi, macd, macd_signal, volume_ratio
+
+
+def test_signal_strength_matches_scalar_scoring():
+    rsi, macd, macd_signal, volume_ratio = random_inputs(20000, seed=7)
+
+    vectorized = signal_strength(rsi, macd, macd_signal, volume_ratio)
+    scalar = [
+        calculate_signal_strength(r, m, s, v)
+        for r, m, s, v in zip(rsi, macd, macd_signal, volume_ratio)
+    ]
+
+    np.testing.assert_array_equal(vectorized, scalar)
+
+
+def test_signal_strength_defaults_volume_ratio_to_one():
+    rsi, macd, macd_signal, _ = random_inputs(1000, seed=8)
+
+    vectorized = signal_strength(rsi, macd, macd_signal)
+    scalar = [calculate_signal_strength(r, m, s) for r, m, s in zip(rsi, macd, macd_signal)]
+
+    np.testing.assert_array_equal(vectorized, scalar)
@@ -0,0 +1,35 @@
+"""
+수집 샤딩 테스트 - 샤드가 전체 종목을 겹침 없이 나누는지, 문자열 파싱
+"""
+import pytest
+
+from app.collector.sharding import ShardSpec, parse_shard
+
+SYMBOLS = [f"{i:06d}" for i in range(0, 400000, 997)]
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 7])
+def test_shards_partition_symbols_disjointly(count):
+    shards = [parse_shard(f"{index}/{count}").select(SYMBOLS) for index in range(count)]
+
+    assert sorted(symbol for shard in shards for symbol in shard) == sorted(SYMBOLS)
+    assert sum(len(shard) for shard in shards) == len(SYMBOLS)
+    # 해시 분배라 한 샤드에 몰리지 않음
+    assert max(len(shard) for shard in shards) < len(SYMBOLS) / count * 1.5
+
+
+def test_assignment_is_deterministic_and_order_preserving():
+    shard = ShardSpec(1, 4)
+    assert shard.select(SYMBOLS) == shard.select(list(SYMBOLS))
+    assert shard.select(SYMBOLS) == [symbol for symbol in SYMBOLS if shard.contains(symbol)]
+
+
+def test_labels():
+    assert ShardSpec().label == "all"
+    assert parse_shard("2/4").label == "2/4"
+
+
+@pytest.mark.parametrize("spec", ["", "1", "a/b", "4/4", "-1/4", "0/0", "1/2/3"])
+def test_parse_shard_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_shard(spec)
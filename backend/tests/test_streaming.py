@@ -0,0 +1,70 @@
+"""
+스트리밍 지표 상태 테스트 - 한 봉씩 전진한 값이 전체 이력 재계산과 STREAMING_TOLERANCE 안에서 일치하는지
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.indicators.engine import INDICATOR_NAMES
+from app.indicators.streaming import STATE_WINDOW, STREAMING_TOLERANCE, advance, seed_state
+from collect_daily_data import calculate_technical_indicators
+
+
+def full_recompute(closes: np.ndarray) -> pd.DataFrame:
+    """같은 종가 이력 전체를 pandas로 다시 계산한 지표"""
+    df = pd.DataFrame({
+        'Date': pd.bdate_range('2024-01-01', periods=len(closes)),
+        'Open': closes, 'High': closes, 'Low': closes, 'Close': closes,
+        'Volume': np.full(len(closes), 1000),
+    })
+    return calculate_technical_indicators(df)
+
+
+def assert_streaming_matches(closes: np.ndarray, seed_bars: int) -> None:
+    """앞 seed_bars개로 상태를 만들고 나머지를 한 봉씩 전진시켜 전체 재계산과 비교"""
+    expected = full_recompute(closes)
+    state = seed_state(closes[:seed_bars])
+    for i in range(seed_bars, len(closes)):
+        state, values = advance(state, closes[i])
+        for name in INDICATOR_NAMES:
+            want = expected[name].iloc[i]
+            got = values[name]
+            if isinstance(want, float) and math.isnan(want):
+                assert math.isnan(got), f"{name}[{i}]: {got} != NaN"
+                continue
+            assert math.isfinite(got), f"{name}[{i}]: {got} != {want}"
+            # 0 근처 값(MACD 등)은 가격 수준 기준 상대 오차로 비교
+            scale = max(abs(want), abs(closes[i]), 1.0)
+            assert abs(got - want) <= STREAMING_TOLERANCE * scale, f"{name}[{i}]: {got} != {want}"
+
+
+def random_walk(size: int, seed: int, integer: bool = True) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    closes = 50000 * np.exp(np.cumsum(rng.normal(0, 0.02, size)))
+    return np.round(closes) if integer else np.round(closes, 2)
+
+
+def test_advance_matches_full_recompute_across_resync_boundary():
+    # 시드 300봉(STATE_WINDOW 배수) + 100봉 전진: 360번째 봉에서 누적합 재계산
+    assert 300 % STATE_WINDOW == 0
+    assert_streaming_matches(random_walk(400, seed=1), seed_bars=300)
+
+
+def test_advance_matches_full_recompute_with_decimal_prices():
+    assert_streaming_matches(random_walk(400, seed=2, integer=False), seed_bars=250)
+
+
+def test_advance_from_empty_state_covers_warmup_bars():
+    # 빈 상태부터 전진해 RSI/SMA가 NaN에서 값으로 바뀌는 구간 포함
+    assert_streaming_matches(random_walk(150, seed=3), seed_bars=0)
+
+
+@pytest.mark.parametrize("closes", [
+    np.full(120, 10000.0),  # 변화 없음 → RSI NaN
+    np.arange(10000.0, 10120.0),  # 하락 없음 → RSI 100
+    np.r_[np.full(70, 10000.0), np.arange(10000.0, 10050.0)],  # 보합 후 상승
+])
+def test_advance_matches_full_recompute_without_losses(closes):
+    assert_streaming_matches(closes, seed_bars=60)
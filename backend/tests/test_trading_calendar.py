@@ -0,0 +1,81 @@
+"""
+거래일 달력 테스트 - 지수/휴장일 기반 판정과 캐시 갱신
+"""
+from datetime import date
+
+import pytest
+
+from app.core import trading_calendar
+from app.core.trading_calendar import build_trading_calendar, get_trading_calendar, invalidate_trading_calendar
+from app.models import MarketHoliday, MarketIndex
+
+TODAY = date(2026, 10, 17)  # 토요일
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    invalidate_trading_calendar()
+    yield
+    invalidate_trading_calendar()
+
+
+def add_index_days(db, *days):
+    db.add_all(MarketIndex(code='KS11', name='KOSPI', date=day, value=2500.0) for day in days)
+    db.commit()
+
+
+def test_index_days_and_holidays_decide_trading_days(db):
+    # 10/14(수)는 지수가 없어 임시 휴장, 10/19(월) 이후는 평일 - 휴장일 규칙
+    add_index_days(db, date(2026, 10, 13), date(2026, 10, 15), date(2026, 10, 16))
+    db.add(MarketHoliday(date=date(2026, 10, 20), name="휴장"))
+    db.commit()
+
+    calendar = build_trading_calendar(db, TODAY)
+
+    assert not calendar.is_trading_day(date(2026, 10, 14))
+    assert calendar.latest_trading_day(TODAY) == date(2026, 10, 16)
+    assert calendar.previous_trading_day(date(2026, 10, 15)) == date(2026, 10, 13)
+    assert calendar.next_trading_day(date(2026, 10, 19)) == date(2026, 10, 21)
+    assert calendar.trading_days(date(2026, 10, 13), date(2026, 10, 19)) == [
+        date(2026, 10, 13), date(2026, 10, 15), date(2026, 10, 16), date(2026, 10, 19),
+    ]
+
+
+def test_cache_reused_until_new_index_day_or_holiday(db):
+    add_index_days(db, date(2026, 10, 16))
+    first = get_trading_calendar(db, TODAY)
+    assert get_trading_calendar(db, TODAY) is first
+
+    db.add(MarketHoliday(date=date(2026, 10, 19), name="임시 휴장"))
+    db.commit()
+    second = get_trading_calendar(db, TODAY)
+    assert second is not first and not second.is_trading_day(date(2026, 10, 19))
+
+    add_index_days(db, date(2026, 10, 19))
+    assert get_trading_calendar(db, TODAY) is not second
+
+
+def test_holiday_removal_applies_after_invalidation_or_cache_period(db, monkeypatch):
+    db.add(MarketHoliday(date=date(2026, 10, 19), name="임시 휴장"))
+    db.add(MarketHoliday(date=date(2026, 12, 31), name="연말 휴장"))
+    db.commit()
+    assert not get_trading_calendar(db, TODAY).is_trading_day(date(2026, 10, 19))
+
+    # 마지막 id가 아닌 휴장일 삭제는 버전에 드러나지 않으므로 같은 캐시 구간에서는 이전 달력
+    db.query(MarketHoliday).filter(MarketHoliday.date == date(2026, 10, 19)).delete()
+    db.commit()
+    assert not get_trading_calendar(db, TODAY).is_trading_day(date(2026, 10, 19))
+
+    invalidate_trading_calendar()
+    assert get_trading_calendar(db, TODAY).is_trading_day(date(2026, 10, 19))
+
+    db.add(MarketHoliday(date=date(2026, 10, 19), name="임시 휴장"))
+    db.add(MarketHoliday(date=date(2026, 12, 30), name="연말 휴장"))
+    db.commit()
+    assert not get_trading_calendar(db, TODAY).is_trading_day(date(2026, 10, 19))
+    db.query(MarketHoliday).filter(MarketHoliday.date == date(2026, 10, 19)).delete()
+    db.commit()
+
+    now = trading_calendar.time.time()
+    monkeypatch.setattr(trading_calendar.time, "time", lambda: now + trading_calendar.CALENDAR_CACHE_SECONDS)
+    assert get_trading_calendar(db, TODAY).is_trading_day(date(2026, 10, 19))
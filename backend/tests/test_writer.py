@@ -0,0 +1,92 @@
+"""
+bulk_upsert 테스트 - 새 행 insert, 유니크 인덱스 충돌시 update, 청크 경계, NaN → NULL
+"""
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from app.collector.records import indicator_records, price_records
+from app.collector.writer import bulk_upsert
+from app.models import StockPrice, TechnicalIndicator
+
+START = date(2026, 1, 5)
+
+
+def price_frame(days: int, close: float = 100.0) -> pd.DataFrame:
+    dates = pd.to_datetime([START + timedelta(days=i) for i in range(days)])
+    closes = np.full(days, close)
+    return pd.DataFrame({
+        'Date': dates, 'Open': closes, 'High': closes, 'Low': closes, 'Close': closes,
+        'Volume': np.full(days, 1000), 'change_amount': np.nan, 'change_percent': np.nan,
+    })
+
+
+def test_inserts_then_updates_on_uk_stock_date(db):
+    assert bulk_upsert(db, StockPrice, price_records(price_frame(3), 1), ('stock_id', 'date')) == 3
+    db.commit()
+
+    # 마지막 날짜만 값이 바뀌고 새 날짜 하나가 붙은 재수집
+    frame = price_frame(4, close=110.0).iloc[2:]
+    bulk_upsert(db, StockPrice, price_records(frame, 1), ('stock_id', 'date'))
+    db.commit()
+
+    rows = db.query(StockPrice.date, StockPrice.close).filter(StockPrice.stock_id == 1).order_by(StockPrice.date).all()
+    assert [close for _, close in rows] == [100.0, 100.0, 110.0, 110.0]
+    assert db.query(StockPrice).count() == 4
+
+
+def test_update_columns_limits_updated_values(db):
+    bulk_upsert(db, StockPrice, price_records(price_frame(1), 1), ('stock_id', 'date'))
+    frame = price_frame(1, close=120.0)
+    frame['Volume'] = 5000
+    bulk_upsert(db, StockPrice, price_records(frame, 1), ('stock_id', 'date'), update_columns=['volume'])
+    db.commit()
+
+    row = db.query(StockPrice).one()
+    assert (row.close, row.volume) == (100.0, 5000)
+
+
+def test_empty_update_columns_keeps_existing_rows(db):
+    bulk_upsert(db, StockPrice, price_records(price_frame(2), 1), ('stock_id', 'date'))
+    bulk_upsert(db, StockPrice, price_records(price_frame(3, close=130.0), 1), ('stock_id', 'date'), update_columns=())
+    db.commit()
+
+    closes = [close for (close,) in db.query(StockPrice.close).order_by(StockPrice.date)]
+    assert closes == [100.0, 100.0, 130.0]
+
+
+def test_chunk_boundaries(db):
+    # 청크 크기의 배수 경계와 마지막 부분 청크, 청크를 넘나드는 중복 키 갱신
+    for stock_id in (1, 2, 3):
+        rows = price_records(price_frame(7), stock_id)
+        assert bulk_upsert(db, StockPrice, rows, ('stock_id', 'date'), chunk_size=3) == 7
+    rows = price_records(price_frame(7, close=150.0), 2)
+    bulk_upsert(db, StockPrice, rows, ('stock_id', 'date'), chunk_size=2)
+    db.commit()
+
+    assert db.query(StockPrice).count() == 21
+    assert {close for (close,) in db.query(StockPrice.close).filter(StockPrice.stock_id == 2)} == {150.0}
+    assert {close for (close,) in db.query(StockPrice.close).filter(StockPrice.stock_id != 2)} == {100.0}
+
+
+def test_nan_values_are_stored_as_null_and_update_on_uk_indicator_stock_date(db):
+    frame = price_frame(2)
+    frame['rsi'] = [np.nan, 45.0]
+    frame['macd'] = [np.nan, np.nan]
+    bulk_upsert(db, TechnicalIndicator, indicator_records(frame, 1), ('stock_id', 'date'))
+    db.commit()
+
+    rows = db.query(TechnicalIndicator.rsi, TechnicalIndicator.macd, TechnicalIndicator.sma_20).order_by(TechnicalIndicator.date).all()
+    assert rows == [(None, None, None), (45.0, None, None)]
+
+    frame['rsi'] = [30.0, np.nan]
+    bulk_upsert(db, TechnicalIndicator, indicator_records(frame, 1), ('stock_id', 'date'))
+    db.commit()
+
+    assert [rsi for (rsi,) in db.query(TechnicalIndicator.rsi).order_by(TechnicalIndicator.date)] == [30.0, None]
+    assert db.query(TechnicalIndicator).count() == 2
+
+
+def test_empty_rows(db):
+    assert bulk_upsert(db, StockPrice, [], ('stock_id', 'date')) == 0